@@ -1,47 +1,64 @@
+import asyncio
+import functools
+import html
 import logging
 import re
+import time
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional, Tuple, Set
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Set
 
-from aiogram import Router, F, Bot
+from aiogram import BaseMiddleware, Router, F, Bot
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
-from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton, TelegramObject
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest, TelegramForbiddenError, TelegramRetryAfter
 from aiogram.enums import ParseMode
+from gspread.exceptions import APIError, GSpreadException
 
 from config import HELPER_ID, ADMIN_ID
+from rate_limiter import SendAdmission
 from database import (
-	get_all_users, delete_user_from_db, get_all_sales_reports, delete_sales_report,
-	add_telegram_group, get_all_telegram_groups, delete_telegram_group,
-	add_google_sheet, get_all_google_sheets, delete_google_sheet, get_google_sheet_by_id,
+	get_all_user_ids_stream, get_total_users_count, delete_user_from_db,
+	add_telegram_group, get_all_telegram_groups_cached, delete_telegram_group,
+	add_google_sheet, get_all_google_sheets_cached, delete_google_sheet, get_google_sheet_by_id,
 	get_users_paginated, get_user_by_telegram_id, get_reports_by_user,
-	block_user, unblock_user, check_user_blocked, update_user_name, get_user_reports_count,
+	block_user, unblock_user, check_user_blocked, get_user_reports_count,
 	update_user_group, get_telegram_group_by_id, get_database_stats,
-	get_reports_count_by_date, get_total_users_count, get_total_reports_count,
-	get_confirmed_reports_count, get_pending_reports_count, get_current_password,
-	update_password, update_group_google_sheet, get_reports_by_status,
-	add_user_to_db, check_user_exists, update_report_status_in_db
+	get_reports_count_by_date, get_current_password, update_password, check_password,
+	get_user_block_counts, get_daily_report_counts
 )
 from keyboards import (
 	get_main_menu_reply_keyboard, get_admin_cancel_inline_keyboard,
-	get_admin_menu_inline_keyboard, get_workers_list_keyboard,
 	get_worker_management_keyboard, get_groups_list_keyboard,
 	get_worker_groups_keyboard, get_google_sheets_keyboard,
 	get_reports_stats_keyboard, get_worker_sales_back_keyboard,
 	get_sheets_list_keyboard, get_sheet_management_keyboard,
-	get_google_sheets_selection_keyboard, get_password_change_keyboard,
-	get_settings_keyboard
+	get_google_sheets_selection_keyboard, get_password_change_keyboard
 )
 from google_sheets_integration import (
 	test_google_sheets_connection, get_reports_statistics,
-	save_report_to_sheets, get_worksheet, get_sheet_info,
-	clear_test_data
+	get_worksheet, get_sheet_info, clear_test_data
 )
 
 admin_router = Router()
 
+# Havolalarni tekshirish uchun oldindan kompilyatsiya qilingan ifodalar
+# t.me/c/GROUP_ID[/TOPIC_ID[/MSG_ID]][/][?...] yoki to'g'ridan-to'g'ri raqamli ID
+_RE_GROUP_LINK = re.compile(r"(?:https://t\.me/c/(\d+)(?:/(\d+))?(?:/\d+)*/?(?:\?.*)?|(-?\d+))$")
+_RE_SHEET_URL = re.compile(r"https://docs\.google\.com/spreadsheets/d/([a-zA-Z0-9_-]+)")
+# Sheet callback prefikslari - ID satrni bo'lmasdan kesib olinadi
+_PFX_SELECT_SHEET = "select_sheet_"
+_PFX_SHEET_SELECT = "sheet_select_"
+_PFX_SHEET_TEST = "sheet_test_"
+_PFX_SHEET_STATS = "sheet_stats_"
+_PFX_SHEET_DEL = "sheet_delete_"
+_PFX_SHEET_UPD = "sheet_update_"
+
 class AdminStates(StatesGroup):
 	# Guruh boshqaruvi
 	waiting_for_group_link = State()
@@ -75,40 +92,109 @@ class AdminStates(StatesGroup):
 	waiting_for_broadcast_message = State()
 	waiting_for_broadcast_confirmation = State()
 
+@dataclass(slots=True)
+class AdminFlowData:
+	"""Admin suhbatlarida FSM'da saqlanadigan vaqtinchalik qiymatlar"""
+	new_approver_id: Optional[int] = None
+	new_admin_id: Optional[int] = None
+	temp_group_id: Optional[int] = None
+	temp_topic_id: Optional[int] = None
+	temp_group_name: Optional[str] = None
+	temp_sheet_name: Optional[str] = None
+	temp_spreadsheet_id: Optional[str] = None
+	new_password: Optional[str] = None
+	broadcast_message: Optional[str] = None
+	broadcast_user_count: Optional[int] = None
+
+_FLOW_FIELDS = frozenset(f.name for f in fields(AdminFlowData))
+
+async def _save_flow(state: FSMContext, flow: AdminFlowData) -> None:
+	"""Faqat to'ldirilgan maydonlarni saqlash"""
+	await state.set_data({k: v for k, v in asdict(flow).items() if v is not None})
+
+async def get_flow_data(state: FSMContext) -> AdminFlowData:
+	"""FSM ma'lumotlarini AdminFlowData ko'rinishida olish (noma'lum kalitlar tashlanadi)"""
+	data = await state.get_data()
+	return AdminFlowData(**{k: v for k, v in data.items() if k in _FLOW_FIELDS})
+
+async def start_flow(state: FSMContext, **values: Any) -> None:
+	"""Yangi suhbatni boshlash - tashlab ketilgan oldingi suhbat qiymatlari o'chadi"""
+	await _save_flow(state, AdminFlowData(**values))
+
+async def update_flow_data(state: FSMContext, **changes: Any) -> None:
+	"""Joriy suhbat qiymatlarini yangilash"""
+	flow = await get_flow_data(state)
+	for key, value in changes.items():
+		setattr(flow, key, value)
+	await _save_flow(state, flow)
+
 # Admin va tasdiqlovchilar ro'yxati
-ADDITIONAL_ADMINS: Set[int] = set()
+ADDITIONAL_ADMINS: frozenset[int] = frozenset()  # Faqat add_admin/remove_admin orqali almashtiriladi
 APPROVERS: Set[int] = set()  # Tasdiqlovchilar ro'yxati
 
+# Chizilgan ro'yxatlar keshi: (avlod, matn, klaviatura). Avlod faqat o'zgarishda oshiriladi
+_render_gen: Dict[str, int] = {"approvers": 0, "groups": 0, "sheets": 0}
+_render_cache: Dict[str, Tuple[int, str, Optional[InlineKeyboardMarkup]]] = {}
+
+def _bump_render(*kinds: str) -> None:
+	"""Ko'rsatilgan ro'yxatlar keshini eskirgan deb belgilash"""
+	for kind in kinds:
+		_render_gen[kind] += 1
+
+# Tekshiruvlar uchun tayyor to'plamlar (har o'zgarishda qayta quriladi)
+_ADMIN_SET: frozenset[int] = frozenset({ADMIN_ID})
+_APPROVER_SET: frozenset[int] = frozenset({HELPER_ID, ADMIN_ID} - {0})
+# Ko'rsatish uchun tartiblangan ro'yxatlar (ham faqat o'zgarishda quriladi)
+_ADMINS_SNAPSHOT: Tuple[int, ...] = (ADMIN_ID,)
+_APPROVERS_SNAPSHOT: Tuple[int, ...] = (HELPER_ID,) if HELPER_ID != 0 else ()
+
+def _rebuild_role_sets() -> None:
+	"""Admin va tasdiqlovchi to'plamlarini qayta qurish"""
+	global _ADMIN_SET, _APPROVER_SET, _ADMINS_SNAPSHOT, _APPROVERS_SNAPSHOT, _sysinfo_cache
+	_ADMIN_SET = ADDITIONAL_ADMINS | {ADMIN_ID}
+	_APPROVER_SET = _ADMIN_SET | APPROVERS | ({HELPER_ID} if HELPER_ID != 0 else set())
+	_ADMINS_SNAPSHOT = (ADMIN_ID, *sorted(ADDITIONAL_ADMINS))
+	_APPROVERS_SNAPSHOT = ((HELPER_ID,) if HELPER_ID != 0 else ()) + tuple(sorted(APPROVERS))
+	# Sonlar o'zgardi - tizim ma'lumotlari keshini tashlash
+	_sysinfo_cache = None
+
 def is_admin(user_id: int) -> bool:
 	"""Foydalanuvchi admin ekanligini tekshirish"""
-	return user_id == ADMIN_ID or user_id in ADDITIONAL_ADMINS
+	return user_id in _ADMIN_SET
 
 def is_approver(user_id: int) -> bool:
 	"""Foydalanuvchi tasdiqlovchi ekanligini tekshirish"""
-	return user_id == HELPER_ID or user_id in APPROVERS or is_admin(user_id)
+	return user_id in _APPROVER_SET
 
 def can_approve_reports(user_id: int) -> bool:
 	"""Hisobotlarni tasdiqlash huquqi borligini tekshirish"""
-	return is_admin(user_id) or is_approver(user_id)
+	return user_id in _APPROVER_SET
 
 def add_admin(user_id: int) -> bool:
 	"""Yangi admin qo'shish"""
-	if user_id not in ADDITIONAL_ADMINS and user_id != ADMIN_ID:
-		ADDITIONAL_ADMINS.add(user_id)
+	global ADDITIONAL_ADMINS
+	if user_id not in _ADMIN_SET:
+		ADDITIONAL_ADMINS = ADDITIONAL_ADMINS | {user_id}
+		_rebuild_role_sets()
 		return True
 	return False
 
 def remove_admin(user_id: int) -> bool:
 	"""Adminni o'chirish (asosiy adminni o'chirish mumkin emas)"""
+	global ADDITIONAL_ADMINS
 	if user_id in ADDITIONAL_ADMINS:
-		ADDITIONAL_ADMINS.remove(user_id)
+		ADDITIONAL_ADMINS = ADDITIONAL_ADMINS - {user_id}
+		_rebuild_role_sets()
 		return True
 	return False
 
 def add_approver(user_id: int) -> bool:
 	"""Yangi tasdiqlovchi qo'shish"""
-	if user_id not in APPROVERS and user_id != HELPER_ID and not is_admin(user_id):
+	# _APPROVER_SET adminlar va asosiy tasdiqlovchini ham o'z ichiga oladi
+	if user_id not in _APPROVER_SET and user_id != HELPER_ID:
 		APPROVERS.add(user_id)
+		_rebuild_role_sets()
+		_bump_render("approvers")
 		return True
 	return False
 
@@ -116,30 +202,117 @@ def remove_approver(user_id: int) -> bool:
 	"""Tasdiqlovchini o'chirish"""
 	if user_id in APPROVERS:
 		APPROVERS.remove(user_id)
+		_rebuild_role_sets()
+		_bump_render("approvers")
 		return True
 	return False
 
-def get_all_admins() -> List[int]:
+def get_all_admins() -> Tuple[int, ...]:
 	"""Barcha adminlar ro'yxati"""
-	return [ADMIN_ID] + list(ADDITIONAL_ADMINS)
+	return _ADMINS_SNAPSHOT
 
-def get_all_approvers() -> List[int]:
+def get_all_approvers() -> Tuple[int, ...]:
 	"""Barcha tasdiqlovchilar ro'yxati"""
-	approvers_list = []
-	if HELPER_ID != 0:
-		approvers_list.append(HELPER_ID)
-	approvers_list.extend(list(APPROVERS))
-	return approvers_list
+	return _APPROVERS_SNAPSHOT
+
+def count_admins() -> int:
+	"""Adminlar soni (ro'yxat yaratmasdan)"""
+	return len(ADDITIONAL_ADMINS) + 1
+
+def count_approvers() -> int:
+	"""Tasdiqlovchilar soni (ro'yxat yaratmasdan)"""
+	return len(APPROVERS) + (1 if HELPER_ID != 0 else 0)
+
+def async_ttl_cache(ttl: float):
+	"""Async funksiya natijasini ttl soniya davomida keshlash (istisnolar keshlanmaydi)"""
+	def decorator(func):
+		cache: Dict[tuple, Tuple[float, object]] = {}
+		
+		@functools.wraps(func)
+		async def wrapper(*args, **kwargs):
+			key = (args, tuple(sorted(kwargs.items())))
+			now = time.monotonic()
+			hit = cache.get(key)
+			if hit and hit[0] > now:
+				return hit[1]
+			result = await func(*args, **kwargs)
+			cache[key] = (now + ttl, result)
+			return result
+		
+		wrapper.cache_clear = cache.clear
+		return wrapper
+	return decorator
+
+# Joriy daqiqa satri - daqiqada bir marta formatlanadi
+_last_minute: int = -1
+_minute_str: str = ""
+
+def minute_stamp() -> str:
+	"""Joriy vaqt 'dd.mm.YYYY HH:MM' ko'rinishida"""
+	global _last_minute, _minute_str
+	now = time.time()
+	minute = int(now // 60)
+	if minute != _last_minute:
+		_last_minute = minute
+		n = datetime.fromtimestamp(now)
+		_minute_str = f"{n.day:02d}.{n.month:02d}.{n.year} {n.hour:02d}:{n.minute:02d}"
+	return _minute_str
+
+# (bugun, bugun ISO, 7 kun oldin ISO, 30 kun oldin ISO) - kunda bir marta hisoblanadi
+_day_cache: Optional[Tuple[date, str, str, str]] = None
+
+def report_windows() -> Tuple[str, str, str]:
+	"""Bugungi, haftalik va oylik oraliq boshlanish sanalari (ISO)"""
+	global _day_cache
+	today = date.today()
+	if _day_cache is None or _day_cache[0] != today:
+		_day_cache = (
+			today,
+			today.isoformat(),
+			(today - timedelta(days=7)).isoformat(),
+			(today - timedelta(days=30)).isoformat()
+		)
+	return _day_cache[1:]
 
 # ============== FORMATTERS ==============
 
+def _trunc(s: str, n: int) -> str:
+	"""Satrni n belgigacha qisqartirish"""
+	return s if len(s) <= n else f"{s[:n]}…"
+
+_STATUS_ICONS = {"confirmed": "✅", "pending": "⏳", "rejected": "❌"}
+# id, client_name, contract_id, product_type, client_location, submission_date, status, is_tashkent
+_report_fields = itemgetter(0, 2, 5, 7, 8, 10, 12, 17)
+
+_SYSINFO_TMPL = (
+	"🖥️ <b>TIZIM MA'LUMOTLARI</b>\n\n"
+	"📅 <b>Sana:</b> {date}\n"
+	"🕐 <b>Vaqt:</b> {time}\n"
+	"🤖 <b>Bot versiyasi:</b> v2.1 Pro\n"
+	"🐍 <b>Python:</b> 3.11+\n"
+	"📱 <b>Aiogram:</b> 3.x\n"
+	"🗄️ <b>Ma'lumotlar bazasi:</b> SQLite3\n"
+	"📊 <b>Google Sheets:</b> gspread\n"
+	"🏙️ <b>Toshkent shahar:</b> Faol\n"
+	"🔧 <b>Holat:</b> ✅ Ishlamoqda\n\n"
+	"👨‍💻 <b>Adminlar:</b> {admin_count} ta\n"
+	"✅ <b>Tasdiqlovchilar:</b> {approver_count} ta\n"
+	"🔐 <b>Asosiy admin:</b> <code>{admin_id}</code>\n"
+)
+
+# (soniya, matn) - bir soniya ichidagi so'rovlar bitta natijani ulashadi
+_sysinfo_cache: Optional[Tuple[int, str]] = None
+
 def format_workers_list(workers: list, page: int = 1, total_pages: int = 1, total_count: int = 0) -> str:
 	"""Ishchilar ro'yxatini formatlash"""
 	if not workers:
-		return "📂 **ISHCHILAR RO'YXATI**\n\nHozircha ishchilar yo'q"
+		return "📂 <b>ISHCHILAR RO'YXATI</b>\n\nHozircha ishchilar yo'q"
 	
-	text = f"📂 **ISHCHILAR RO'YXATI**\n"
-	text += f"📄 Sahifa: {page}/{total_pages} | Jami: {total_count} ta\n\n"
+	parts: List[str] = [
+		"📂 <b>ISHCHILAR RO'YXATI</b>\n",
+		f"📄 Sahifa: {page}/{total_pages} | Jami: {total_count} ta\n\n"
+	]
+	append = parts.append
 	
 	for i, worker in enumerate(workers, 1):
 		user_id, telegram_id, full_name, reg_date, is_blocked, group_name = worker
@@ -147,255 +320,307 @@ def format_workers_list(workers: list, page: int = 1, total_pages: int = 1, tota
 		status_icon = "🔒" if is_blocked else "✅"
 		group_display = group_name if group_name != 'Guruh tayinlanmagan' else "❌ Tayinlanmagan"
 		
-		text += f"**{i}.** {status_icon} **{full_name}**\n"
-		text += f"├ 🆔 ID: `{telegram_id}`\n"
-		text += f"├ 👥 Guruh: {group_display}\n"
-		text += f"└ 📅 Sana: {reg_date.split(' ')[0]}\n\n"
+		append(
+			f"<b>{i}.</b> {status_icon} <b>{html.escape(full_name)}</b>\n"
+			f"├ 🆔 ID: <code>{telegram_id}</code>\n"
+			f"├ 👥 Guruh: {html.escape(group_display)}\n"
+			f"└ 📅 Sana: {reg_date.split(' ')[0]}\n\n"
+		)
 	
-	text += "💡 Batafsil ma'lumot uchun raqamli tugmani bosing"
-	return text
+	append("💡 Batafsil ma'lumot uchun raqamli tugmani bosing")
+	return "".join(parts)
 
 def format_groups_list(groups: list) -> str:
 	"""Guruhlar ro'yxatini formatlash"""
 	if not groups:
-		return "🏢 **GURUHLAR**\n\nHozircha guruhlar yo'q"
+		return "🏢 <b>GURUHLAR</b>\n\nHozircha guruhlar yo'q"
 	
-	text = "🏢 **GURUHLAR RO'YXATI**\n\n"
+	parts: List[str] = ["🏢 <b>GURUHLAR RO'YXATI</b>\n\n"]
+	append = parts.append
 	for i, group in enumerate(groups, 1):
 		db_id, group_id, group_name, topic_id, google_sheet_id, sheet_name = group
 		
 		sheet_display = sheet_name if sheet_name != 'Sheet tayinlanmagan' else "❌ Tayinlanmagan"
 		topic_display = f"#{topic_id}" if topic_id else "Yo'q"
 		
-		text += f"**{i}.** 📁 **{group_name}**\n"
-		text += f"├ 🆔 ID: `{group_id}`\n"
-		text += f"├ 📋 Mavzu: {topic_display}\n"
-		text += f"└ 📊 Sheet: {sheet_display}\n\n"
+		append(
+			f"<b>{i}.</b> 📁 <b>{html.escape(group_name)}</b>\n"
+			f"├ 🆔 ID: <code>{group_id}</code>\n"
+			f"├ 📋 Mavzu: {topic_display}\n"
+			f"└ 📊 Sheet: {html.escape(sheet_display)}\n\n"
+		)
 	
-	text += f"📊 **Jami:** {len(groups)} ta guruh"
-	return text
+	append(f"📊 <b>Jami:</b> {len(groups)} ta guruh")
+	return "".join(parts)
 
 def format_sheets_list(sheets: list) -> str:
 	"""Google Sheets ro'yxatini formatlash"""
 	if not sheets:
-		return "📊 **GOOGLE SHEETS**\n\nHozircha sheetlar yo'q"
+		return "📊 <b>GOOGLE SHEETS</b>\n\nHozircha sheetlar yo'q"
 	
-	text = "📊 **GOOGLE SHEETS RO'YXATI**\n\n"
+	parts: List[str] = ["📊 <b>GOOGLE SHEETS RO'YXATI</b>\n\n"]
+	append = parts.append
 	for i, sheet in enumerate(sheets, 1):
 		sheet_id, sheet_name, spreadsheet_id, worksheet_name, is_active = sheet
 		
 		status_icon = "🟢" if is_active else "🔴"
-		short_id = spreadsheet_id[:15] + "..." if len(spreadsheet_id) > 15 else spreadsheet_id
+		short_id = _trunc(spreadsheet_id, 15)
 		
-		text += f"**{i}.** {status_icon} **{sheet_name}**\n"
-		text += f"├ 🆔 ID: `{short_id}`\n"
-		text += f"├ 📋 Varaq: {worksheet_name}\n"
-		text += f"└ 🔘 Holat: {'Faol' if is_active else 'Nofaol'}\n\n"
+		append(
+			f"<b>{i}.</b> {status_icon} <b>{html.escape(sheet_name)}</b>\n"
+			f"├ 🆔 ID: <code>{html.escape(short_id)}</code>\n"
+			f"├ 📋 Varaq: {html.escape(worksheet_name)}\n"
+			f"└ 🔘 Holat: {'Faol' if is_active else 'Nofaol'}\n\n"
+		)
 	
-	text += f"📈 **Jami:** {len(sheets)} ta sheet"
-	return text
+	append(f"📈 <b>Jami:</b> {len(sheets)} ta sheet")
+	return "".join(parts)
 
 def format_worker_sales(worker_name: str, reports: list) -> str:
 	"""Ishchi sotuvlarini formatlash"""
 	if not reports:
-		return f"📊 **{worker_name.upper()} SOTUVLARI**\n\nHozircha sotuvlar yo'q"
-	
-	text = f"📊 **{worker_name.upper()} SOTUVLARI**\n\n"
-	
-	confirmed_count = sum(1 for r in reports if r[12] == "confirmed")
-	pending_count = sum(1 for r in reports if r[12] == "pending")
-	rejected_count = sum(1 for r in reports if r[12] == "rejected")
-	
-	text += f"📈 **STATISTIKA:**\n"
-	text += f"├ ✅ Tasdiqlangan: {confirmed_count}\n"
-	text += f"├ ⏳ Kutilayotgan: {pending_count}\n"
-	text += f"└ ❌ Rad etilgan: {rejected_count}\n\n"
-	
-	text += "📋 **SO'NGGI HISOBOTLAR:**\n"
+		return f"📊 <b>{html.escape(worker_name.upper())} SOTUVLARI</b>\n\nHozircha sotuvlar yo'q"
+	
+	counts = Counter(r[12] for r in reports)
+	confirmed_count = counts["confirmed"]
+	pending_count = counts["pending"]
+	rejected_count = counts["rejected"]
+	
+	parts: List[str] = [
+		f"📊 <b>{html.escape(worker_name.upper())} SOTUVLARI</b>\n\n",
+		f"📈 <b>STATISTIKA:</b>\n"
+		f"├ ✅ Tasdiqlangan: {confirmed_count}\n"
+		f"├ ⏳ Kutilayotgan: {pending_count}\n"
+		f"└ ❌ Rad etilgan: {rejected_count}\n\n",
+		"📋 <b>SO'NGGI HISOBOTLAR:</b>\n"
+	]
+	append = parts.append
 	
 	for i, report in enumerate(reports[:10], 1):
-		# Updated report structure with is_tashkent field
-		report_id, user_telegram_id, client_name, phone_number, additional_phone_number, contract_id, contract_amount, product_type, client_location, product_image_id, submission_date, submission_timestamp, status, confirmed_by_helper_id, confirmation_timestamp, group_message_id, google_sheet_id, is_tashkent = report
+		report_id, client_name, contract_id, product_type, client_location, submission_date, status, is_tashkent = _report_fields(report)
 		
-		if status == "confirmed":
-			status_icon = "✅"
-		elif status == "pending":
-			status_icon = "⏳"
-		elif status == "rejected":
-			status_icon = "❌"
-		else:
-			status_icon = "❓"
+		status_icon = _STATUS_ICONS.get(status, "❓")
 		
-		client_short = client_name[:20] + "..." if len(client_name) > 20 else client_name
-		product_short = product_type[:25] + "..." if len(product_type) > 25 else product_type
+		client_short = _trunc(client_name, 20)
+		product_short = _trunc(product_type, 25)
 		location_icon = "🏙️" if is_tashkent else "📍"
 		
-		text += f"**{i}.** {status_icon} ID: #{report_id}\n"
-		text += f"├ 👤 {client_short}\n"
-		text += f"├ 🛍️ {product_short}\n"
-		text += f"├ {location_icon} {client_location}\n"
-		text += f"├ 📄 {contract_id}\n"
-		text += f"└ 📅 {submission_date}\n\n"
+		append(
+			f"<b>{i}.</b> {status_icon} ID: #{report_id}\n"
+			f"├ 👤 {html.escape(client_short)}\n"
+			f"├ 🛍️ {html.escape(product_short)}\n"
+			f"├ {location_icon} {html.escape(client_location or "—")}\n"
+			f"├ 📄 {html.escape(str(contract_id))}\n"
+			f"└ 📅 {submission_date}\n\n"
+		)
 	
 	if len(reports) > 10:
-		text += f"➕ ... va yana {len(reports) - 10} ta hisobot"
+		append(f"➕ ... va yana {len(reports) - 10} ta hisobot")
 	
-	return text
+	return "".join(parts)
 
 def format_system_info() -> str:
 	"""Tizim ma'lumotlarini formatlash"""
+	global _sysinfo_cache
+	bucket = int(time.monotonic())
+	if _sysinfo_cache and _sysinfo_cache[0] == bucket:
+		return _sysinfo_cache[1]
+	
 	current_time = datetime.now()
 	
-	text = "🖥️ **TIZIM MA'LUMOTLARI**\n\n"
-	text += f"📅 **Sana:** {current_time.strftime('%d.%m.%Y')}\n"
-	text += f"🕐 **Vaqt:** {current_time.strftime('%H:%M:%S')}\n"
-	text += f"🤖 **Bot versiyasi:** v2.1 Pro\n"
-	text += f"🐍 **Python:** 3.11+\n"
-	text += f"📱 **Aiogram:** 3.x\n"
-	text += f"🗄️ **Ma'lumotlar bazasi:** SQLite3\n"
-	text += f"📊 **Google Sheets:** gspread\n"
-	text += f"🏙️ **Toshkent shahar:** Faol\n"
-	text += f"🔧 **Holat:** ✅ Ishlamoqda\n\n"
-	
-	# Admin va tasdiqlovchilar statistikasi
-	admin_count = len(get_all_admins())
-	approver_count = len(get_all_approvers())
-	text += f"👨‍💻 **Adminlar:** {admin_count} ta\n"
-	text += f"✅ **Tasdiqlovchilar:** {approver_count} ta\n"
-	text += f"🔐 **Asosiy admin:** `{ADMIN_ID}`\n"
+	text = _SYSINFO_TMPL.format_map({
+		"date": f"{current_time.day:02d}.{current_time.month:02d}.{current_time.year}",
+		"time": f"{current_time.hour:02d}:{current_time.minute:02d}:{current_time.second:02d}",
+		# Admin va tasdiqlovchilar statistikasi
+		"admin_count": count_admins(),
+		"approver_count": count_approvers(),
+		"admin_id": ADMIN_ID,
+	})
 	
 	if ADDITIONAL_ADMINS:
-		text += f"➕ **Qo'shimcha adminlar:** {len(ADDITIONAL_ADMINS)} ta\n"
+		text += f"➕ <b>Qo'shimcha adminlar:</b> {len(ADDITIONAL_ADMINS)} ta\n"
 	
 	if APPROVERS:
-		text += f"✅ **Qo'shimcha tasdiqlovchilar:** {len(APPROVERS)} ta"
+		text += f"✅ <b>Qo'shimcha tasdiqlovchilar:</b> {len(APPROVERS)} ta"
 	
+	_sysinfo_cache = (bucket, text)
 	return text
 
+@async_ttl_cache(ttl=60)
+async def _database_info_text() -> str:
+	"""Ma'lumotlar bazasi bo'limi matni (xato bo'lsa istisno - keshga tushmaydi)"""
+	# Haftalik va oylik statistika
+	today, week_ago, month_ago = report_windows()
+	
+	stats, week_reports, month_reports = await asyncio.gather(
+		get_database_stats(today),
+		get_reports_count_by_date(week_ago, today),
+		get_reports_count_by_date(month_ago, today)
+	)
+	
+	parts: List[str] = [
+		"🗄️ <b>MA'LUMOTLAR BAZASI</b>\n\n",
+		f"👥 <b>Foydalanuvchilar:</b> {stats.get('total_users', 0)} ta\n"
+		f"📝 <b>Jami hisobotlar:</b> {stats.get('total_reports', 0)} ta\n"
+		f"✅ <b>Tasdiqlangan:</b> {stats.get('confirmed_reports', 0)} ta\n"
+		f"⏳ <b>Kutilayotgan:</b> {stats.get('pending_reports', 0)} ta\n"
+		f"📅 <b>Bugungi hisobotlar:</b> {stats.get('today_reports', 0)} ta\n"
+		f"🎯 <b>Tasdiqlash foizi:</b> {stats.get('confirmation_rate', 0)}%\n\n",
+		# Toshkent shahar statistikasi
+		"🏙️ <b>TOSHKENT SHAHAR:</b>\n"
+		f"├ Toshkent hisobotlari: {stats.get('tashkent_reports', 0)} ta\n"
+		f"└ Boshqa hududlar: {stats.get('other_reports', 0)} ta\n\n",
+		f"📈 <b>Haftalik:</b> {week_reports} ta hisobot\n"
+		f"📊 <b>Oylik:</b> {month_reports} ta hisobot\n"
+	]
+	
+	return "".join(parts)
+
 async def format_database_info() -> str:
 	"""Ma'lumotlar bazasi ma'lumotlarini formatlash"""
 	try:
-		stats = await get_database_stats()
-		
-		text = "🗄️ **MA'LUMOTLAR BAZASI**\n\n"
-		text += f"👥 **Foydalanuvchilar:** {stats.get('total_users', 0)} ta\n"
-		text += f"📝 **Jami hisobotlar:** {stats.get('total_reports', 0)} ta\n"
-		text += f"✅ **Tasdiqlangan:** {stats.get('confirmed_reports', 0)} ta\n"
-		text += f"⏳ **Kutilayotgan:** {stats.get('pending_reports', 0)} ta\n"
-		text += f"📅 **Bugungi hisobotlar:** {stats.get('today_reports', 0)} ta\n"
-		text += f"🎯 **Tasdiqlash foizi:** {stats.get('confirmation_rate', 0)}%\n\n"
-		
-		# Toshkent shahar statistikasi
-		text += f"🏙️ **TOSHKENT SHAHAR:**\n"
-		text += f"├ Toshkent hisobotlari: {stats.get('tashkent_reports', 0)} ta\n"
-		text += f"└ Boshqa hududlar: {stats.get('other_reports', 0)} ta\n\n"
-		
-		# Haftalik va oylik statistika
-		today = date.today()
-		week_ago = today - timedelta(days=7)
-		month_ago = today - timedelta(days=30)
-		
-		week_reports = await get_reports_count_by_date(week_ago.isoformat(), today.isoformat())
-		month_reports = await get_reports_count_by_date(month_ago.isoformat(), today.isoformat())
-		
-		text += f"📈 **Haftalik:** {week_reports} ta hisobot\n"
-		text += f"📊 **Oylik:** {month_reports} ta hisobot\n"
-		
-		return text
-	
+		return await _database_info_text()
 	except Exception as e:
-		logging.error(f"Ma'lumotlar bazasi ma'lumotlarini olishda xatolik: {e}")
-		return "🗄️ **MA'LUMOTLAR BAZASI**\n\n❌ Ma'lumotlarni olishda xatolik"
+		logging.error("Ma'lumotlar bazasi ma'lumotlarini olishda xatolik: %s", e)
+		return "🗄️ <b>MA'LUMOTLAR BAZASI</b>\n\n❌ Ma'lumotlarni olishda xatolik"
 
 def format_admins_list() -> str:
 	"""Adminlar ro'yxatini formatlash"""
 	admins = get_all_admins()
 	
-	text = "👨‍💻 **ADMINLAR RO'YXATI**\n\n"
+	parts: List[str] = ["👨‍💻 <b>ADMINLAR RO'YXATI</b>\n\n"]
+	append = parts.append
 	
 	for i, admin_id in enumerate(admins, 1):
 		if admin_id == ADMIN_ID:
-			text += f"**{i}.** 👑 **Asosiy Admin**\n"
-			text += f"├ 🆔 ID: `{admin_id}`\n"
-			text += f"├ 🔐 Huquqlar: To'liq\n"
-			text += f"└ 🚫 O'chirish: Mumkin emas\n\n"
+			append(
+				f"<b>{i}.</b> 👑 <b>Asosiy Admin</b>\n"
+				f"├ 🆔 ID: <code>{admin_id}</code>\n"
+				"├ 🔐 Huquqlar: To'liq\n"
+				"└ 🚫 O'chirish: Mumkin emas\n\n"
+			)
 		else:
-			text += f"**{i}.** 👨‍💻 **Qo'shimcha Admin**\n"
-			text += f"├ 🆔 ID: `{admin_id}`\n"
-			text += f"├ 🔐 Huquqlar: To'liq\n"
-			text += f"└ 🗑️ O'chirish: Mumkin\n\n"
+			append(
+				f"<b>{i}.</b> 👨‍💻 <b>Qo'shimcha Admin</b>\n"
+				f"├ 🆔 ID: <code>{admin_id}</code>\n"
+				"├ 🔐 Huquqlar: To'liq\n"
+				"└ 🗑️ O'chirish: Mumkin\n\n"
+			)
 	
-	text += f"📊 **Jami:** {len(admins)} ta admin"
-	return text
+	append(f"📊 <b>Jami:</b> {len(admins)} ta admin")
+	return "".join(parts)
 
 def format_approvers_list() -> str:
+	"""Tasdiqlovchilar ro'yxatini formatlash (keshlangan)"""
+	gen = _render_gen["approvers"]
+	cached = _render_cache.get("approvers")
+	if cached and cached[0] == gen:
+		return cached[1]
+	
+	text = _build_approvers_list()
+	_render_cache["approvers"] = (gen, text, None)
+	return text
+
+def _build_approvers_list() -> str:
 	"""Tasdiqlovchilar ro'yxatini formatlash"""
 	approvers = get_all_approvers()
 	
-	text = "✅ **TASDIQLOVCHILAR RO'YXATI**\n\n"
+	header = "✅ <b>TASDIQLOVCHILAR RO'YXATI</b>\n\n"
 	
 	if not approvers:
-		return text + "Hozircha tasdiqlovchilar yo'q"
+		return header + "Hozircha tasdiqlovchilar yo'q"
+	
+	parts: List[str] = [header]
+	append = parts.append
 	
 	for i, approver_id in enumerate(approvers, 1):
 		if approver_id == HELPER_ID:
-			text += f"**{i}.** 🔧 **Asosiy Tasdiqlovchi**\n"
-			text += f"├ 🆔 ID: `{approver_id}`\n"
-			text += f"├ 🔐 Huquqlar: Hisobotlarni tasdiqlash\n"
-			text += f"└ 🚫 O'chirish: Mumkin emas\n\n"
+			append(
+				f"<b>{i}.</b> 🔧 <b>Asosiy Tasdiqlovchi</b>\n"
+				f"├ 🆔 ID: <code>{approver_id}</code>\n"
+				"├ 🔐 Huquqlar: Hisobotlarni tasdiqlash\n"
+				"└ 🚫 O'chirish: Mumkin emas\n\n"
+			)
 		else:
-			text += f"**{i}.** ✅ **Qo'shimcha Tasdiqlovchi**\n"
-			text += f"├ 🆔 ID: `{approver_id}`\n"
-			text += f"├ 🔐 Huquqlar: Hisobotlarni tasdiqlash\n"
-			text += f"└ 🗑️ O'chirish: Mumkin\n\n"
+			append(
+				f"<b>{i}.</b> ✅ <b>Qo'shimcha Tasdiqlovchi</b>\n"
+				f"├ 🆔 ID: <code>{approver_id}</code>\n"
+				"├ 🔐 Huquqlar: Hisobotlarni tasdiqlash\n"
+				"└ 🗑️ O'chirish: Mumkin\n\n"
+			)
 	
-	text += f"📊 **Jami:** {len(approvers)} ta tasdiqlovchi"
-	return text
+	append(f"📊 <b>Jami:</b> {len(approvers)} ta tasdiqlovchi")
+	return "".join(parts)
+
+async def render_groups_list() -> Tuple[str, InlineKeyboardMarkup]:
+	"""Guruhlar ro'yxati matni va klaviaturasi (keshlangan)"""
+	gen = _render_gen["groups"]
+	cached = _render_cache.get("groups")
+	if cached and cached[0] == gen:
+		return cached[1], cached[2]
+	
+	groups = await get_all_telegram_groups_cached()
+	text, keyboard = format_groups_list(groups), get_groups_list_keyboard(groups)
+	# Bo'sh ro'yxat DB xatosi bo'lishi mumkin - keshlanmaydi, keyingi safar qayta so'raladi
+	if groups:
+		_render_cache["groups"] = (gen, text, keyboard)
+	return text, keyboard
+
+async def render_sheets_list() -> Tuple[str, InlineKeyboardMarkup]:
+	"""Google Sheets ro'yxati matni va klaviaturasi (keshlangan)"""
+	gen = _render_gen["sheets"]
+	cached = _render_cache.get("sheets")
+	if cached and cached[0] == gen:
+		return cached[1], cached[2]
+	
+	sheets = await get_all_google_sheets_cached()
+	text, keyboard = format_sheets_list(sheets), get_sheets_list_keyboard(sheets)
+	if sheets:
+		_render_cache["sheets"] = (gen, text, keyboard)
+	return text, keyboard
 
 # ============== KEYBOARDS ==============
 
+# Umumiy klaviaturalar bir marta quriladi. aiogram markup'lari o'zgaruvchan (MutableTelegramObject),
+# shuning uchun ularni hech qachon o'zgartirmang - kerak bo'lsa yangi klaviatura quring
+
+_ADMIN_MENU_KB = InlineKeyboardMarkup(inline_keyboard=[
+	[
+		InlineKeyboardButton(text="👥 Ishchilar", callback_data="admin_workers"),
+		InlineKeyboardButton(text="📊 Hisobotlar", callback_data="admin_reports")
+	],
+	[
+		InlineKeyboardButton(text="🏢 Guruhlar", callback_data="admin_groups"),
+		InlineKeyboardButton(text="📈 Google Sheets", callback_data="admin_sheets")
+	],
+	[
+		InlineKeyboardButton(text="✅ Tasdiqlovchilar", callback_data="admin_approvers"),
+		InlineKeyboardButton(text="📊 Statistika", callback_data="admin_analytics")
+	],
+	[
+		InlineKeyboardButton(text="📢 Xabar yuborish", callback_data="admin_broadcast"),
+		InlineKeyboardButton(text="⚙️ Sozlamalar", callback_data="admin_settings")
+	],
+	[
+		InlineKeyboardButton(text="🚪 Chiqish", callback_data="admin_exit")
+	]
+])
+
 def get_enhanced_admin_menu_keyboard() -> InlineKeyboardMarkup:
 	"""Kengaytirilgan admin menyu klaviaturasi"""
-	buttons = [
-		[
-			InlineKeyboardButton(text="👥 Ishchilar", callback_data="admin_workers"),
-			InlineKeyboardButton(text="📊 Hisobotlar", callback_data="admin_reports")
-		],
-		[
-			InlineKeyboardButton(text="🏢 Guruhlar", callback_data="admin_groups"),
-			InlineKeyboardButton(text="📈 Google Sheets", callback_data="admin_sheets")
-		],
-		[
-			InlineKeyboardButton(text="✅ Tasdiqlovchilar", callback_data="admin_approvers"),
-			InlineKeyboardButton(text="📊 Statistika", callback_data="admin_analytics")
-		],
-		[
-			InlineKeyboardButton(text="📢 Xabar yuborish", callback_data="admin_broadcast"),
-			InlineKeyboardButton(text="⚙️ Sozlamalar", callback_data="admin_settings")
-		],
-		[
-			InlineKeyboardButton(text="🚪 Chiqish", callback_data="admin_exit")
-		]
-	]
-	return InlineKeyboardMarkup(inline_keyboard=buttons)
+	return _ADMIN_MENU_KB
 
 def get_workers_list_keyboard_with_pagination(workers: list, page: int = 1,
                                               total_pages: int = 1) -> InlineKeyboardMarkup:
 	"""Sahifalash bilan ishchilar ro'yxati klaviaturasi"""
-	buttons = []
-	
-	# Raqamli tugmalar
-	number_buttons = []
-	for i, worker in enumerate(workers, 1):
-		user_id, telegram_id, full_name, reg_date, is_blocked, group_name = worker
-		number_buttons.append(InlineKeyboardButton(
-			text=str(i),
-			callback_data=f"worker_select_{telegram_id}"
-		))
-	
-	# Raqamli tugmalarni 5 tadan qilib qo'yish
-	for i in range(0, len(number_buttons), 5):
-		buttons.append(number_buttons[i:i + 5])
+	# Raqamli tugmalar, 5 tadan qatorga
+	buttons = [
+		[
+			InlineKeyboardButton(text=str(i), callback_data=f"worker_select_{worker[1]}")
+			for i, worker in enumerate(workers[j:j + 5], start=j + 1)
+		]
+		for j in range(0, len(workers), 5)
+	]
 	
 	# Sahifalash tugmalari
 	pagination_buttons = []
@@ -415,125 +640,229 @@ def get_workers_list_keyboard_with_pagination(workers: list, page: int = 1,
 	
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+_ADMIN_MGMT_KB = InlineKeyboardMarkup(inline_keyboard=[
+	[
+		InlineKeyboardButton(text="📋 Adminlar ro'yxati", callback_data="admins_list"),
+		InlineKeyboardButton(text="➕ Admin qo'shish", callback_data="admin_add")
+	],
+	[
+		InlineKeyboardButton(text="🗑️ Admin o'chirish", callback_data="admin_remove"),
+		InlineKeyboardButton(text="🔐 Huquqlar", callback_data="admin_permissions")
+	],
+	[
+		InlineKeyboardButton(text="🔙 Sozlamalar", callback_data="admin_settings")
+	]
+])
+
 def get_admin_management_keyboard() -> InlineKeyboardMarkup:
 	"""Admin boshqaruvi klaviaturasi"""
-	buttons = [
-		[
-			InlineKeyboardButton(text="📋 Adminlar ro'yxati", callback_data="admins_list"),
-			InlineKeyboardButton(text="➕ Admin qo'shish", callback_data="admin_add")
-		],
-		[
-			InlineKeyboardButton(text="🗑️ Admin o'chirish", callback_data="admin_remove"),
-			InlineKeyboardButton(text="🔐 Huquqlar", callback_data="admin_permissions")
-		],
-		[
-			InlineKeyboardButton(text="🔙 Sozlamalar", callback_data="admin_settings")
-		]
+	return _ADMIN_MGMT_KB
+
+_APPROVERS_MGMT_KB = InlineKeyboardMarkup(inline_keyboard=[
+	[
+		InlineKeyboardButton(text="📋 Tasdiqlovchilar ro'yxati", callback_data="approvers_list"),
+		InlineKeyboardButton(text="➕ Tasdiqlovchi qo'shish", callback_data="approver_add")
+	],
+	[
+		InlineKeyboardButton(text="🗑️ Tasdiqlovchi o'chirish", callback_data="approver_remove"),
+		InlineKeyboardButton(text="🔐 Huquqlar", callback_data="approver_permissions")
+	],
+	[
+		InlineKeyboardButton(text="🔙 Admin menyu", callback_data="admin_menu")
 	]
-	return InlineKeyboardMarkup(inline_keyboard=buttons)
+])
+
+_APPROVERS_BACK_KB = InlineKeyboardMarkup(inline_keyboard=[
+	[InlineKeyboardButton(text="🔙 Tasdiqlovchilar", callback_data="admin_approvers")]
+])
 
 def get_approvers_management_keyboard() -> InlineKeyboardMarkup:
 	"""Tasdiqlovchilar boshqaruvi klaviaturasi"""
-	buttons = [
-		[
-			InlineKeyboardButton(text="📋 Tasdiqlovchilar ro'yxati", callback_data="approvers_list"),
-			InlineKeyboardButton(text="➕ Tasdiqlovchi qo'shish", callback_data="approver_add")
-		],
-		[
-			InlineKeyboardButton(text="🗑️ Tasdiqlovchi o'chirish", callback_data="approver_remove"),
-			InlineKeyboardButton(text="🔐 Huquqlar", callback_data="approver_permissions")
-		],
-		[
-			InlineKeyboardButton(text="🔙 Admin menyu", callback_data="admin_menu")
-		]
+	return _APPROVERS_MGMT_KB
+
+_SETTINGS_KB = InlineKeyboardMarkup(inline_keyboard=[
+	[
+		InlineKeyboardButton(text="👨‍💻 Admin boshqaruvi", callback_data="admin_management"),
+		InlineKeyboardButton(text="✅ Tasdiqlovchilar", callback_data="admin_approvers")
+	],
+	[
+		InlineKeyboardButton(text="🔐 Parol sozlamalari", callback_data="admin_change_password"),
+		InlineKeyboardButton(text="🖥️ Tizim ma'lumotlari", callback_data="system_info")
+	],
+	[
+		InlineKeyboardButton(text="🗄️ Ma'lumotlar bazasi", callback_data="database_info"),
+		InlineKeyboardButton(text="📊 Umumiy statistika", callback_data="reports_general")
+	],
+	[
+		InlineKeyboardButton(text="🔙 Admin menyu", callback_data="admin_menu")
 	]
-	return InlineKeyboardMarkup(inline_keyboard=buttons)
+])
 
 def get_enhanced_settings_keyboard() -> InlineKeyboardMarkup:
 	"""Kengaytirilgan sozlamalar klaviaturasi"""
-	buttons = [
-		[
-			InlineKeyboardButton(text="👨‍💻 Admin boshqaruvi", callback_data="admin_management"),
-			InlineKeyboardButton(text="✅ Tasdiqlovchilar", callback_data="admin_approvers")
-		],
-		[
-			InlineKeyboardButton(text="🔐 Parol sozlamalari", callback_data="admin_change_password"),
-			InlineKeyboardButton(text="🖥️ Tizim ma'lumotlari", callback_data="system_info")
-		],
-		[
-			InlineKeyboardButton(text="🗄️ Ma'lumotlar bazasi", callback_data="database_info"),
-			InlineKeyboardButton(text="📊 Umumiy statistika", callback_data="reports_general")
-		],
-		[
-			InlineKeyboardButton(text="🔙 Admin menyu", callback_data="admin_menu")
-		]
+	return _SETTINGS_KB
+
+_ANALYTICS_KB = InlineKeyboardMarkup(inline_keyboard=[
+	[
+		InlineKeyboardButton(text="📊 Umumiy statistika", callback_data="analytics_general"),
+		InlineKeyboardButton(text="👥 Foydalanuvchilar", callback_data="analytics_users")
+	],
+	[
+		InlineKeyboardButton(text="📈 Hisobotlar", callback_data="analytics_reports"),
+		InlineKeyboardButton(text="🏢 Guruhlar", callback_data="admin_groups")
+	],
+	[
+		InlineKeyboardButton(text="📅 Kunlik", callback_data="analytics_daily"),
+		InlineKeyboardButton(text="📆 Oylik", callback_data="analytics_monthly")
+	],
+	[
+		InlineKeyboardButton(text="🔙 Admin menyu", callback_data="admin_menu")
 	]
-	return InlineKeyboardMarkup(inline_keyboard=buttons)
+])
 
 def get_analytics_keyboard() -> InlineKeyboardMarkup:
 	"""Analitika klaviaturasi"""
-	buttons = [
-		[
-			InlineKeyboardButton(text="📊 Umumiy statistika", callback_data="analytics_general"),
-			InlineKeyboardButton(text="👥 Foydalanuvchilar", callback_data="analytics_users")
-		],
-		[
-			InlineKeyboardButton(text="📈 Hisobotlar", callback_data="analytics_reports"),
-			InlineKeyboardButton(text="🏢 Guruhlar", callback_data="admin_groups")
-		],
-		[
-			InlineKeyboardButton(text="📅 Kunlik", callback_data="analytics_daily"),
-			InlineKeyboardButton(text="📆 Oylik", callback_data="analytics_monthly")
-		],
-		[
-			InlineKeyboardButton(text="🔙 Admin menyu", callback_data="admin_menu")
-		]
+	return _ANALYTICS_KB
+
+# keyboards.py'dagi statik klaviaturalar - bir marta quriladi
+_CANCEL_KB = get_admin_cancel_inline_keyboard()
+_PASSWORD_KB = get_password_change_keyboard()
+_REPORTS_KB = get_reports_stats_keyboard()
+_SHEETS_MENU_KB = get_google_sheets_keyboard()
+_MAIN_MENU_REPLY_KB = get_main_menu_reply_keyboard()
+
+_SETTINGS_BACK_KB = InlineKeyboardMarkup(inline_keyboard=[
+	[InlineKeyboardButton(text="🔙 Sozlamalar", callback_data="admin_settings")]
+])
+
+_BROADCAST_CONFIRM_KB = InlineKeyboardMarkup(inline_keyboard=[
+	[
+		InlineKeyboardButton(text="✅ Yuborish", callback_data="confirm_broadcast"),
+		InlineKeyboardButton(text="❌ Bekor qilish", callback_data="cancel_admin_action")
 	]
-	return InlineKeyboardMarkup(inline_keyboard=buttons)
+])
+
+# ============== HELPERS ==============
+
+# (chat_id, message_id) -> oxirgi chizilgan matn va klaviatura xeshi (LRU, eng ko'pi bilan 10k)
+_LAST_RENDER_MAX = 10_000
+_last_render: "OrderedDict[Tuple[int, int], int]" = OrderedDict()
+
+def _remember_render(key: Tuple[int, int], h: int) -> None:
+	"""Chizilgan xabar xeshini saqlash, eski yozuvlarni chiqarib tashlash"""
+	_last_render[key] = h
+	_last_render.move_to_end(key)
+	if len(_last_render) > _LAST_RENDER_MAX:
+		_last_render.popitem(last=False)
+
+async def safe_edit_or_send(callback_query: CallbackQuery, text: str,
+                            keyboard: Optional[InlineKeyboardMarkup] = None) -> None:
+	"""Xabarni tahrirlash, imkoni bo'lmasa yangisini yuborish"""
+	message = callback_query.message
+	key = (message.chat.id, message.message_id)
+	h = hash((text, repr(keyboard)))
+	
+	# Xabar o'zgarmagan bo'lsa Telegramga so'rov yubormaslik
+	if _last_render.get(key) == h and message.reply_markup == keyboard:
+		return
+	
+	try:
+		await message.edit_text(text, reply_markup=keyboard, parse_mode=ParseMode.HTML)
+		_remember_render(key, h)
+	except TelegramBadRequest as e:
+		# Kesh bo'sh bo'lsa ham (masalan qayta ishga tushgandan keyin) xabar allaqachon
+		# shu ko'rinishda - nusxasini yubormaslik
+		if "message is not modified" in e.message:
+			_remember_render(key, h)
+			return
+		sent = await message.answer(text, reply_markup=keyboard, parse_mode=ParseMode.HTML)
+		_remember_render((sent.chat.id, sent.message_id), h)
+
+def parse_user_id(text: Optional[str]) -> Optional[int]:
+	"""Telegram foydalanuvchi ID'sini istisnosiz tekshirish (musbat, 19 raqamgacha)"""
+	s = (text or "").strip()
+	if s.isascii() and s.isdigit() and len(s) <= 19:
+		return int(s)
+	return None
+
+def parse_group_link(link: str) -> Optional[Tuple[int, Optional[int]]]:
+	"""t.me/c havolasi yoki raqamli ID'dan (group_id, topic_id) olish; noto'g'ri bo'lsa None"""
+	match = _RE_GROUP_LINK.match(link)
+	if not match:
+		return None
+	if match.group(1):
+		raw = match.group(1)
+		topic_id = int(match.group(2)) if match.group(2) else None
+		return -(int(raw) + 100 * 10 ** len(raw)), topic_id
+	return int(match.group(3)), None
+
+class AdminOnlyMiddleware(BaseMiddleware):
+	"""Admin bo'lmagan foydalanuvchilarni admin handlerlariga kiritmaslik"""
+	
+	async def __call__(
+		self,
+		handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+		event: TelegramObject,
+		data: Dict[str, Any]
+	) -> Any:
+		user = data.get("event_from_user")
+		if user is not None and user.id in _ADMIN_SET:
+			return await handler(event, data)
+		
+		if isinstance(event, CallbackQuery):
+			await event.answer("🚫 Ruxsat yo'q.", show_alert=True)
+			return None
+		
+		raw_state = data.get("raw_state")
+		if raw_state and raw_state in AdminStates:
+			await event.answer("🚫 Ruxsat yo'q.")
+			await data["state"].clear()
+		else:
+			await event.answer("🚫 Sizda bu buyruqdan foydalanish uchun ruxsat yo'q.")
+		return None
+
+# Filtrlari mos kelgan handlerlardan oldin ishlaydi, boshqa routerlarga ta'sir qilmaydi
+admin_router.callback_query.middleware(AdminOnlyMiddleware())
+admin_router.message.middleware(AdminOnlyMiddleware())
 
 # ============== MAIN HANDLERS ==============
 
+_ADMIN_PANEL_TMPL = (
+	"👨‍💻 <b>ADMIN PANEL v2.1</b>\n\n"
+	"Salom, {admin_type}!\n"
+	"🆔 ID: <code>{user_id}</code>\n"
+	"📅 Vaqt: {stamp}\n\n"
+	"Kerakli bo'limni tanlang:"
+)
+
+def admin_panel_text(user_id: int) -> str:
+	"""Admin panel sarlavhasi - faqat ID va vaqt o'zgaradi"""
+	admin_type = "👑 Asosiy Admin" if user_id == ADMIN_ID else "👨‍💻 Admin"
+	return _ADMIN_PANEL_TMPL.format(admin_type=admin_type, user_id=user_id, stamp=minute_stamp())
+
 @admin_router.message(Command("rava"))
 async def handle_admin_command(message: Message, state: FSMContext):
 	"""Admin panel asosiy buyruq"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Sizda bu buyruqdan foydalanish uchun ruxsat yo'q.")
-		return
-	
 	await state.clear()
 	
-	admin_type = "👑 Asosiy Admin" if message.from_user.id == ADMIN_ID else "👨‍💻 Admin"
-	
 	await message.answer(
-		f"👨‍💻 **ADMIN PANEL v2.1**\n\n"
-		f"Salom, {admin_type}!\n"
-		f"🆔 ID: `{message.from_user.id}`\n"
-		f"📅 Vaqt: {datetime.now().strftime('%d.%m.%Y %H:%M')}\n\n"
-		f"Kerakli bo'limni tanlang:",
-		reply_markup=get_enhanced_admin_menu_keyboard(),
-		parse_mode=ParseMode.MARKDOWN
+		admin_panel_text(message.from_user.id),
+		reply_markup=_ADMIN_MENU_KB,
+		parse_mode=ParseMode.HTML
 	)
-	logging.info(f"Admin {message.from_user.id} admin panelga kirdi")
+	logging.info("Admin %s admin panelga kirdi", message.from_user.id)
 
 # ============== WORKERS MANAGEMENT ==============
 
 @admin_router.callback_query(F.data == "admin_workers")
 async def show_workers(callback_query: CallbackQuery, state: FSMContext):
 	"""Ishchilar ro'yxatini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	await show_workers_page(callback_query, state, 1)
 
-@admin_router.callback_query(F.data.startswith("workers_page_"))
-async def show_workers_page_handler(callback_query: CallbackQuery, state: FSMContext):
+@admin_router.callback_query(F.data.regexp(r"^workers_page_(?P<page>\d+)$").as_("m"))
+async def show_workers_page_handler(callback_query: CallbackQuery, state: FSMContext, m: re.Match):
 	"""Ishchilar sahifasini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	page = int(callback_query.data.split("_")[-1])
+	page = int(m["page"])
 	await show_workers_page(callback_query, state, page)
 
 async def show_workers_page(callback_query: CallbackQuery, state: FSMContext, page: int):
@@ -543,12 +872,9 @@ async def show_workers_page(callback_query: CallbackQuery, state: FSMContext, pa
 	
 	text = format_workers_list(workers, page, total_pages, total_count)
 	keyboard = get_workers_list_keyboard_with_pagination(workers, page,
-	                                                     total_pages) if workers else get_enhanced_admin_menu_keyboard()
+	                                                     total_pages) if workers else _ADMIN_MENU_KB
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=keyboard, parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=keyboard, parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, keyboard)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "current_page")
@@ -556,58 +882,50 @@ async def current_page_handler(callback_query: CallbackQuery):
 	"""Joriy sahifa tugmasi bosilganda"""
 	await callback_query.answer("📄 Siz hozir ushbu sahifadasiz")
 
-@admin_router.callback_query(F.data.startswith("worker_select_"))
-async def show_worker_details(callback_query: CallbackQuery, state: FSMContext):
+@admin_router.callback_query(F.data.regexp(r"^worker_select_(?P<tid>\d+)$").as_("m"))
+async def show_worker_details_handler(callback_query: CallbackQuery, state: FSMContext, m: re.Match):
 	"""Ishchi batafsil ma'lumotlarini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	telegram_id = int(callback_query.data.split("_")[-1])
-	worker = await get_user_by_telegram_id(telegram_id)
+	await show_worker_details(callback_query, int(m["tid"]))
+
+async def show_worker_details(callback_query: CallbackQuery, telegram_id: int):
+	"""Ishchi batafsil ma'lumotlarini ko'rsatish"""
+	worker, reports_count, recent_reports = await asyncio.gather(
+		get_user_by_telegram_id(telegram_id),
+		get_user_reports_count(telegram_id),
+		get_reports_by_user(telegram_id, 1)
+	)
 	
 	if not worker:
 		await callback_query.answer("❌ Ishchi topilmadi!", show_alert=True)
 		return
 	
 	user_id, telegram_id, full_name, reg_date, is_blocked, group_name = worker
-	reports_count = await get_user_reports_count(telegram_id)
 	
 	# So'nggi faollik
-	recent_reports = await get_reports_by_user(telegram_id, 1)
 	last_activity = "Hech qachon"
 	if recent_reports:
 		last_activity = recent_reports[0][10].split(' ')[0] if recent_reports[0][10] else "Noma'lum"
 	
-	status_text = "🔒 **BLOKLANGAN**" if is_blocked else "✅ **FAOL**"
+	status_text = "🔒 <b>BLOKLANGAN</b>" if is_blocked else "✅ <b>FAOL</b>"
 	group_display = group_name if group_name != 'Guruh tayinlanmagan' else "❌ Tayinlanmagan"
 	
-	text = f"👤 **ISHCHI MA'LUMOTLARI**\n\n"
-	text += f"📝 **Ism:** {full_name}\n"
-	text += f"🆔 **Telegram ID:** `{telegram_id}`\n"
-	text += f"👥 **Guruh:** {group_display}\n"
-	text += f"📅 **Ro'yxatdan o'tgan:** {reg_date.split(' ')[0]}\n"
-	text += f"📊 **Jami hisobotlar:** {reports_count} ta\n"
-	text += f"🕐 **So'nggi faollik:** {last_activity}\n"
-	text += f"🔘 **Holat:** {status_text}\n\n"
+	text = "👤 <b>ISHCHI MA'LUMOTLARI</b>\n\n"
+	text += f"📝 <b>Ism:</b> {html.escape(full_name)}\n"
+	text += f"🆔 <b>Telegram ID:</b> <code>{telegram_id}</code>\n"
+	text += f"👥 <b>Guruh:</b> {html.escape(group_display)}\n"
+	text += f"📅 <b>Ro'yxatdan o'tgan:</b> {reg_date.split(' ')[0]}\n"
+	text += f"📊 <b>Jami hisobotlar:</b> {reports_count} ta\n"
+	text += f"🕐 <b>So'nggi faollik:</b> {last_activity}\n"
+	text += f"🔘 <b>Holat:</b> {status_text}\n\n"
 	text += "💡 Kerakli amalni tanlang:"
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_worker_management_keyboard(telegram_id),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_worker_management_keyboard(telegram_id),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, get_worker_management_keyboard(telegram_id))
 	await callback_query.answer()
 
-@admin_router.callback_query(F.data.startswith("worker_sales_"))
-async def show_worker_sales(callback_query: CallbackQuery, state: FSMContext):
+@admin_router.callback_query(F.data.regexp(r"^worker_sales_(?P<tid>\d+)$").as_("m"))
+async def show_worker_sales(callback_query: CallbackQuery, state: FSMContext, m: re.Match):
 	"""Ishchi sotuvlarini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	telegram_id = int(callback_query.data.split("_")[-1])
+	telegram_id = int(m["tid"])
 	worker = await get_user_by_telegram_id(telegram_id)
 	reports = await get_reports_by_user(telegram_id, 20)
 	
@@ -618,22 +936,13 @@ async def show_worker_sales(callback_query: CallbackQuery, state: FSMContext):
 	full_name = worker[2]
 	text = format_worker_sales(full_name, reports)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_worker_sales_back_keyboard(telegram_id),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_worker_sales_back_keyboard(telegram_id),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, get_worker_sales_back_keyboard(telegram_id))
 	await callback_query.answer()
 
-@admin_router.callback_query(F.data.startswith("worker_block_"))
-async def toggle_worker_block(callback_query: CallbackQuery, state: FSMContext):
+@admin_router.callback_query(F.data.regexp(r"^worker_block_(?P<tid>\d+)$").as_("m"))
+async def toggle_worker_block(callback_query: CallbackQuery, state: FSMContext, m: re.Match):
 	"""Ishchini bloklash/blokdan chiqarish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	telegram_id = int(callback_query.data.split("_")[-1])
+	telegram_id = int(m["tid"])
 	is_blocked = await check_user_blocked(telegram_id)
 	
 	if is_blocked:
@@ -646,42 +955,28 @@ async def toggle_worker_block(callback_query: CallbackQuery, state: FSMContext):
 	await callback_query.answer(message, show_alert=True)
 	
 	if success:
-		await show_worker_details(callback_query, state)
+		await show_worker_details(callback_query, telegram_id)
 
-@admin_router.callback_query(F.data.startswith("worker_group_"))
-async def change_worker_group(callback_query: CallbackQuery, state: FSMContext):
+@admin_router.callback_query(F.data.regexp(r"^worker_group_(?P<tid>\d+)$").as_("m"))
+async def change_worker_group(callback_query: CallbackQuery, state: FSMContext, m: re.Match):
 	"""Ishchi guruhini o'zgartirish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	telegram_id = int(callback_query.data.split("_")[-1])
-	groups = await get_all_telegram_groups()
+	telegram_id = int(m["tid"])
+	groups = await get_all_telegram_groups_cached()
 	
 	if not groups:
 		await callback_query.answer("❌ Guruhlar mavjud emas!", show_alert=True)
 		return
 	
-	text = "👥 **GURUH TANLASH**\n\nIshchi uchun guruh tanlang:"
+	text = "👥 <b>GURUH TANLASH</b>\n\nIshchi uchun guruh tanlang:"
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_worker_groups_keyboard(groups, telegram_id),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_worker_groups_keyboard(groups, telegram_id),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, get_worker_groups_keyboard(groups, telegram_id))
 	await callback_query.answer()
 
-@admin_router.callback_query(F.data.startswith("assign_worker_"))
-async def assign_worker_to_group(callback_query: CallbackQuery, state: FSMContext):
+@admin_router.callback_query(F.data.regexp(r"^assign_worker_(?P<tid>\d+)_(?P<gid>-?\d+)$").as_("m"))
+async def assign_worker_to_group(callback_query: CallbackQuery, state: FSMContext, m: re.Match):
 	"""Ishchini guruhga tayinlash"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	parts = callback_query.data.split("_")
-	worker_telegram_id = int(parts[2])
-	group_id = int(parts[3])
+	worker_telegram_id = int(m["tid"])
+	group_id = int(m["gid"])
 	
 	success = await update_user_group(worker_telegram_id, group_id)
 	
@@ -689,20 +984,16 @@ async def assign_worker_to_group(callback_query: CallbackQuery, state: FSMContex
 		group_info = await get_telegram_group_by_id(group_id)
 		group_name = group_info[2] if group_info else "Noma'lum"
 		await callback_query.answer(f"✅ Ishchi '{group_name}' guruhiga tayinlandi!", show_alert=True)
-		logging.info(f"Worker {worker_telegram_id} assigned to group {group_id} by admin")
+		logging.info("Worker %s assigned to group %s by admin", worker_telegram_id, group_id)
 	else:
 		await callback_query.answer("❌ Xatolik yuz berdi!", show_alert=True)
 	
-	await show_worker_details(callback_query, state)
+	await show_worker_details(callback_query, worker_telegram_id)
 
-@admin_router.callback_query(F.data.startswith("worker_delete_"))
-async def delete_worker(callback_query: CallbackQuery, state: FSMContext):
+@admin_router.callback_query(F.data.regexp(r"^worker_delete_(?P<tid>\d+)$").as_("m"))
+async def delete_worker(callback_query: CallbackQuery, state: FSMContext, m: re.Match):
 	"""Ishchini o'chirish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	telegram_id = int(callback_query.data.split("_")[-1])
+	telegram_id = int(m["tid"])
 	worker = await get_user_by_telegram_id(telegram_id)
 	
 	if not worker:
@@ -713,7 +1004,7 @@ async def delete_worker(callback_query: CallbackQuery, state: FSMContext):
 	
 	if success:
 		await callback_query.answer("✅ Ishchi o'chirildi!", show_alert=True)
-		logging.info(f"Worker {telegram_id} deleted by admin")
+		logging.info("Worker %s deleted by admin", telegram_id)
 		await show_workers(callback_query, state)
 	else:
 		await callback_query.answer("❌ Xatolik yuz berdi!", show_alert=True)
@@ -723,245 +1014,175 @@ async def delete_worker(callback_query: CallbackQuery, state: FSMContext):
 @admin_router.callback_query(F.data == "admin_approvers")
 async def show_approvers_menu(callback_query: CallbackQuery, state: FSMContext):
 	"""Tasdiqlovchilar menyusini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	text = (
-		"✅ **TASDIQLOVCHILAR BOSHQARUVI**\n\n"
-		f"📊 Jami tasdiqlovchilar: **{len(get_all_approvers())} ta**\n\n"
+		"✅ <b>TASDIQLOVCHILAR BOSHQARUVI</b>\n\n"
+		f"📊 Jami tasdiqlovchilar: <b>{count_approvers()} ta</b>\n\n"
 		"Tasdiqlovchilar hisobotlarni tasdiqlash va rad etish huquqiga ega.\n\n"
-		"💡 **Eslatma:** Admin paneldan qo'shilgan tasdiqlovchilar ham hisobotlarni tasdiqlash imkoniyatiga ega.\n\n"
+		"💡 <b>Eslatma:</b> Admin paneldan qo'shilgan tasdiqlovchilar ham hisobotlarni tasdiqlash imkoniyatiga ega.\n\n"
 		"Kerakli amalni tanlang:"
 	)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_approvers_management_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_approvers_management_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _APPROVERS_MGMT_KB)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "approvers_list")
 async def show_approvers_list(callback_query: CallbackQuery, state: FSMContext):
 	"""Tasdiqlovchilar ro'yxatini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	text = format_approvers_list()
 	
-	keyboard = InlineKeyboardMarkup(inline_keyboard=[
-		[InlineKeyboardButton(text="🔙 Tasdiqlovchilar", callback_data="admin_approvers")]
-	])
-	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=keyboard, parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=keyboard, parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _APPROVERS_BACK_KB)
 	await callback_query.answer()
 
+_ADD_APPROVER_PROMPT = (
+	"➕ <b>YANGI TASDIQLOVCHI QO'SHISH</b>\n\n"
+	"Yangi tasdiqlovchi bo'lishi kerak bo'lgan foydalanuvchining Telegram ID'sini kiriting:\n\n"
+	"📝 <b>Masalan:</b> <code>123456789</code>\n\n"
+	"💡 <b>Eslatma:</b>\n"
+	"• Foydalanuvchi ID'sini olish uchun @userinfobot dan foydalaning\n"
+	"• Yangi tasdiqlovchi hisobotlarni tasdiqlash huquqiga ega bo'ladi\n"
+	"• Tasdiqlovchi admin huquqlariga ega bo'lmaydi\n"
+	"• Qo'shilgan tasdiqlovchi darhol hisobotlarni tasdiqlash imkoniyatiga ega bo'ladi"
+)
+
 @admin_router.callback_query(F.data == "approver_add")
 async def add_approver_start(callback_query: CallbackQuery, state: FSMContext):
 	"""Tasdiqlovchi qo'shishni boshlash"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	await state.set_state(AdminStates.waiting_for_new_approver_id)
-	text = (
-		"➕ **YANGI TASDIQLOVCHI QO'SHISH**\n\n"
-		"Yangi tasdiqlovchi bo'lishi kerak bo'lgan foydalanuvchining Telegram ID'sini kiriting:\n\n"
-		"📝 **Masalan:** `123456789`\n\n"
-		"💡 **Eslatma:**\n"
-		"• Foydalanuvchi ID'sini olish uchun @userinfobot dan foydalaning\n"
-		"• Yangi tasdiqlovchi hisobotlarni tasdiqlash huquqiga ega bo'ladi\n"
-		"• Tasdiqlovchi admin huquqlariga ega bo'lmaydi\n"
-		"• Qo'shilgan tasdiqlovchi darhol hisobotlarni tasdiqlash imkoniyatiga ega bo'ladi"
-	)
-	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, _ADD_APPROVER_PROMPT, _CANCEL_KB)
 	await callback_query.answer()
 
 @admin_router.message(AdminStates.waiting_for_new_approver_id)
 async def process_new_approver_id(message: Message, state: FSMContext):
 	"""Yangi tasdiqlovchi ID'sini qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
-	try:
-		new_approver_id = int(message.text.strip())
-	except ValueError:
+	new_approver_id = parse_user_id(message.text)
+	if new_approver_id is None:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Faqat raqamli Telegram ID kiriting\n"
-			"**Masalan:** `123456789`",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			"<b>Masalan:</b> <code>123456789</code>",
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	if new_approver_id == HELPER_ID:
-		await message.answer(
-			"⚠️ **XATO**\n\n"
-			"Bu foydalanuvchi allaqachon asosiy tasdiqlovchi!",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
-		)
-		return
-	
-	if is_admin(new_approver_id):
-		await message.answer(
-			"⚠️ **XATO**\n\n"
-			"Bu foydalanuvchi admin! Adminlar avtomatik tasdiqlovchi huquqiga ega.",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
-		)
-		return
-	
-	if new_approver_id in APPROVERS:
+	# Odatiy holatda bitta tekshiruv; sabab faqat rad etilganda aniqlanadi
+	if new_approver_id in _APPROVER_SET or new_approver_id == HELPER_ID:
+		if new_approver_id == HELPER_ID:
+			reason = "Bu foydalanuvchi allaqachon asosiy tasdiqlovchi!"
+		elif new_approver_id in _ADMIN_SET:
+			reason = "Bu foydalanuvchi admin! Adminlar avtomatik tasdiqlovchi huquqiga ega."
+		else:
+			reason = "Bu foydalanuvchi allaqachon tasdiqlovchi!"
 		await message.answer(
-			"⚠️ **XATO**\n\n"
-			"Bu foydalanuvchi allaqachon tasdiqlovchi!",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			f"⚠️ <b>XATO</b>\n\n{reason}",
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	await state.update_data(new_approver_id=new_approver_id)
+	await start_flow(state, new_approver_id=new_approver_id)
 	await state.set_state(AdminStates.waiting_for_approver_name)
 	
 	await message.answer(
-		f"✅ **TASDIQLASH**\n\n"
-		f"**Yangi tasdiqlovchi ID:** `{new_approver_id}`\n\n"
+		f"✅ <b>TASDIQLASH</b>\n\n"
+		f"<b>Yangi tasdiqlovchi ID:</b> <code>{new_approver_id}</code>\n\n"
 		f"Bu tasdiqlovchi uchun nom kiriting:\n"
-		f"*(Masalan: 'Akmal Tasdiqlovchi' yoki 'Yordamchi')*",
-		reply_markup=get_admin_cancel_inline_keyboard(),
-		parse_mode=ParseMode.MARKDOWN
+		f"<i>(Masalan: 'Akmal Tasdiqlovchi' yoki 'Yordamchi')</i>",
+		reply_markup=_CANCEL_KB,
+		parse_mode=ParseMode.HTML
 	)
 
 @admin_router.message(AdminStates.waiting_for_approver_name)
 async def process_approver_name(message: Message, state: FSMContext):
 	"""Tasdiqlovchi nomini qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
 	approver_name = message.text.strip()
 	if not approver_name or len(approver_name) < 2:
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Tasdiqlovchi nomini to'g'ri kiriting (kamida 2 belgi)",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	data = await state.get_data()
-	new_approver_id = data.get("new_approver_id")
+	flow = await get_flow_data(state)
+	new_approver_id = flow.new_approver_id
 	
 	success = add_approver(new_approver_id)
 	
 	if success:
 		text = (
-			f"✅ **MUVAFFAQIYAT**\n\n"
+			f"✅ <b>MUVAFFAQIYAT</b>\n\n"
 			f"Yangi tasdiqlovchi muvaffaqiyatli qo'shildi!\n\n"
-			f"✅ **Tasdiqlovchi nomi:** {approver_name}\n"
-			f"🆔 **Telegram ID:** `{new_approver_id}`\n"
-			f"🔐 **Huquqlar:** Hisobotlarni tasdiqlash\n"
-			f"📅 **Qo'shilgan:** {datetime.now().strftime('%d.%m.%Y %H:%M')}\n\n"
-			f"⚠️ **Eslatma:** Yangi tasdiqlovchi darhol hisobotlarni tasdiqlash imkoniyatiga ega bo'ladi.\n"
-			f"🎯 **Funksiya:** Guruhda yuborilgan hisobotlarni tasdiqlash va rad etish."
+			f"✅ <b>Tasdiqlovchi nomi:</b> {html.escape(approver_name)}\n"
+			f"🆔 <b>Telegram ID:</b> <code>{new_approver_id}</code>\n"
+			f"🔐 <b>Huquqlar:</b> Hisobotlarni tasdiqlash\n"
+			f"📅 <b>Qo'shilgan:</b> {minute_stamp()}\n\n"
+			f"⚠️ <b>Eslatma:</b> Yangi tasdiqlovchi darhol hisobotlarni tasdiqlash imkoniyatiga ega bo'ladi.\n"
+			f"🎯 <b>Funksiya:</b> Guruhda yuborilgan hisobotlarni tasdiqlash va rad etish."
 		)
-		logging.info(f"New approver added: {new_approver_id} ({approver_name}) by admin {message.from_user.id}")
+		logging.info("New approver added: %s (%s) by admin %s", new_approver_id, approver_name, message.from_user.id)
 	else:
-		text = "❌ **XATO**\n\nTasdiqlovchini qo'shishda xatolik yuz berdi"
+		text = "❌ <b>XATO</b>\n\nTasdiqlovchini qo'shishda xatolik yuz berdi"
 	
 	await state.clear()
-	await message.answer(text, parse_mode=ParseMode.MARKDOWN)
 	
-	# Tasdiqlovchilar ro'yxatini yangilash
+	# Tasdiqlovchilar ro'yxatini yangilash (natija bilan bitta xabarda)
 	await message.answer(
-		format_approvers_list(),
-		reply_markup=get_approvers_management_keyboard(),
-		parse_mode=ParseMode.MARKDOWN
+		f"{text}\n\n{format_approvers_list()}",
+		reply_markup=_APPROVERS_MGMT_KB,
+		parse_mode=ParseMode.HTML
 	)
 
 @admin_router.callback_query(F.data == "approver_remove")
 async def remove_approver_start(callback_query: CallbackQuery, state: FSMContext):
 	"""Tasdiqlovchi o'chirishni boshlash"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	if not APPROVERS:
 		await callback_query.answer("❌ O'chiriladigan qo'shimcha tasdiqlovchilar yo'q!", show_alert=True)
 		return
 	
-	text = (
-		"🗑️ **TASDIQLOVCHI O'CHIRISH**\n\n"
+	parts: List[str] = [
+		"🗑️ <b>TASDIQLOVCHI O'CHIRISH</b>\n\n"
 		"O'chirmoqchi bo'lgan tasdiqlovchi ID'sini kiriting:\n\n"
-		"**Qo'shimcha tasdiqlovchilar:**\n"
-	)
-	
-	for i, approver_id in enumerate(APPROVERS, 1):
-		text += f"{i}. ID: `{approver_id}`\n"
-	
-	text += "\n💡 Faqat tasdiqlovchi ID'sini kiriting"
+		"<b>Qo'shimcha tasdiqlovchilar:</b>\n"
+	]
+	parts.extend(f"{i}. ID: <code>{approver_id}</code>\n" for i, approver_id in enumerate(sorted(APPROVERS), 1))
+	parts.append("\n💡 Faqat tasdiqlovchi ID'sini kiriting")
+	text = "".join(parts)
 	
 	await state.set_state(AdminStates.waiting_for_approver_delete_confirmation)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _CANCEL_KB)
 	await callback_query.answer()
 
 @admin_router.message(AdminStates.waiting_for_approver_delete_confirmation)
 async def process_approver_delete(message: Message, state: FSMContext):
 	"""Tasdiqlovchi o'chirishni qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
-	try:
-		approver_id_to_remove = int(message.text.strip())
-	except ValueError:
+	approver_id_to_remove = parse_user_id(message.text)
+	if approver_id_to_remove is None:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Faqat raqamli tasdiqlovchi ID kiriting",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
 	if approver_id_to_remove == HELPER_ID:
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Asosiy tasdiqlovchini o'chirish mumkin emas!",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
 	if approver_id_to_remove not in APPROVERS:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Bunday ID'li tasdiqlovchi topilmadi",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
@@ -969,217 +1190,168 @@ async def process_approver_delete(message: Message, state: FSMContext):
 	
 	if success:
 		text = (
-			f"✅ **MUVAFFAQIYAT**\n\n"
+			f"✅ <b>MUVAFFAQIYAT</b>\n\n"
 			f"Tasdiqlovchi muvaffaqiyatli o'chirildi!\n\n"
-			f"🆔 **O'chirilgan tasdiqlovchi ID:** `{approver_id_to_remove}`\n"
-			f"📅 **O'chirilgan:** {datetime.now().strftime('%d.%m.%Y %H:%M')}\n\n"
-			f"⚠️ **Eslatma:** Bu foydalanuvchi endi hisobotlarni tasdiqlash huquqiga ega emas."
+			f"🆔 <b>O'chirilgan tasdiqlovchi ID:</b> <code>{approver_id_to_remove}</code>\n"
+			f"📅 <b>O'chirilgan:</b> {minute_stamp()}\n\n"
+			f"⚠️ <b>Eslatma:</b> Bu foydalanuvchi endi hisobotlarni tasdiqlash huquqiga ega emas."
 		)
-		logging.info(f"Approver removed: {approver_id_to_remove} by admin {message.from_user.id}")
+		logging.info("Approver removed: %s by admin %s", approver_id_to_remove, message.from_user.id)
 	else:
-		text = "❌ **XATO**\n\nTasdiqlovchini o'chirishda xatolik yuz berdi"
+		text = "❌ <b>XATO</b>\n\nTasdiqlovchini o'chirishda xatolik yuz berdi"
 	
 	await state.clear()
-	await message.answer(text, parse_mode=ParseMode.MARKDOWN)
 	
-	# Tasdiqlovchilar ro'yxatini yangilash
+	# Tasdiqlovchilar ro'yxatini yangilash (natija bilan bitta xabarda)
 	await message.answer(
-		format_approvers_list(),
-		reply_markup=get_approvers_management_keyboard(),
-		parse_mode=ParseMode.MARKDOWN
+		f"{text}\n\n{format_approvers_list()}",
+		reply_markup=_APPROVERS_MGMT_KB,
+		parse_mode=ParseMode.HTML
 	)
 
+_APPROVER_PERMISSIONS_STATIC = (
+	"🔐 <b>TASDIQLOVCHI HUQUQLARI</b>\n\n"
+	"<b>🔧 Asosiy Tasdiqlovchi (Helper):</b>\n"
+	"├ ✅ Hisobotlarni tasdiqlash\n"
+	"├ ✅ Hisobotlarni rad etish\n"
+	"├ ✅ Sotuvchi bilan bog'lanish\n"
+	"├ ✅ Guruhda hisobotlarni ko'rish\n"
+	"├ ❌ Admin funksiyalari\n"
+	"└ 🚫 O'chirish mumkin emas\n\n"
+	
+	"<b>✅ Qo'shimcha Tasdiqlovchilar:</b>\n"
+	"├ ✅ Hisobotlarni tasdiqlash\n"
+	"├ ✅ Hisobotlarni rad etish\n"
+	"├ ✅ Sotuvchi bilan bog'lanish\n"
+	"├ ✅ Guruhda hisobotlarni ko'rish\n"
+	"├ ❌ Admin funksiyalari\n"
+	"└ 🗑️ O'chirish mumkin\n\n"
+	
+	"<b>👨‍💻 Adminlar:</b>\n"
+	"├ ✅ Barcha tasdiqlovchi huquqlari\n"
+	"├ ✅ Barcha admin funksiyalari\n"
+	"├ ✅ Tasdiqlovchilarni boshqarish\n"
+	"└ ✅ To'liq nazorat\n\n"
+)
+
 @admin_router.callback_query(F.data == "approver_permissions")
 async def show_approver_permissions(callback_query: CallbackQuery, state: FSMContext):
 	"""Tasdiqlovchi huquqlarini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	text = (
-		"🔐 **TASDIQLOVCHI HUQUQLARI**\n\n"
-		"**🔧 Asosiy Tasdiqlovchi (Helper):**\n"
-		"├ ✅ Hisobotlarni tasdiqlash\n"
-		"├ ✅ Hisobotlarni rad etish\n"
-		"├ ✅ Sotuvchi bilan bog'lanish\n"
-		"├ ✅ Guruhda hisobotlarni ko'rish\n"
-		"├ ❌ Admin funksiyalari\n"
-		"└ 🚫 O'chirish mumkin emas\n\n"
-		
-		"**✅ Qo'shimcha Tasdiqlovchilar:**\n"
-		"├ ✅ Hisobotlarni tasdiqlash\n"
-		"├ ✅ Hisobotlarni rad etish\n"
-		"├ ✅ Sotuvchi bilan bog'lanish\n"
-		"├ ✅ Guruhda hisobotlarni ko'rish\n"
-		"├ ❌ Admin funksiyalari\n"
-		"└ 🗑️ O'chirish mumkin\n\n"
-		
-		"**👨‍💻 Adminlar:**\n"
-		"├ ✅ Barcha tasdiqlovchi huquqlari\n"
-		"├ ✅ Barcha admin funksiyalari\n"
-		"├ ✅ Tasdiqlovchilarni boshqarish\n"
-		"└ ✅ To'liq nazorat\n\n"
+	text = _APPROVER_PERMISSIONS_STATIC + (
+		f"📊 <b>Jami tasdiqlovchilar:</b> {count_approvers()} ta\n"
+		f"🔧 <b>Asosiy tasdiqlovchi:</b> {'1 ta' if HELPER_ID != 0 else '0 ta'}\n"
+		f"✅ <b>Qo'shimcha tasdiqlovchilar:</b> {len(APPROVERS)} ta\n\n"
 		
-		f"📊 **Jami tasdiqlovchilar:** {len(get_all_approvers())} ta\n"
-		f"🔧 **Asosiy tasdiqlovchi:** {'1 ta' if HELPER_ID != 0 else '0 ta'}\n"
-		f"✅ **Qo'shimcha tasdiqlovchilar:** {len(APPROVERS)} ta\n\n"
-		
-		f"💡 **Eslatma:** Barcha tasdiqlovchilar guruhda yuborilgan hisobotlarni tasdiqlash yoki rad etish imkoniyatiga ega."
+		f"💡 <b>Eslatma:</b> Barcha tasdiqlovchilar guruhda yuborilgan hisobotlarni tasdiqlash yoki rad etish imkoniyatiga ega."
 	)
 	
-	await callback_query.answer(text, show_alert=True)
+	# Matn alert chegarasidan (200 belgi) uzun - alohida xabar sifatida
+	await callback_query.message.answer(text, parse_mode=ParseMode.HTML)
+	await callback_query.answer()
 
 # ============== GROUPS MANAGEMENT ==============
 
 @admin_router.callback_query(F.data == "admin_groups")
 async def show_groups(callback_query: CallbackQuery, state: FSMContext):
 	"""Guruhlar ro'yxatini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
+	text, keyboard = await render_groups_list()
 	
-	groups = await get_all_telegram_groups()
-	text = format_groups_list(groups)
-	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_groups_list_keyboard(groups),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_groups_list_keyboard(groups),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, keyboard)
 	await callback_query.answer()
 
+_ADD_GROUP_PROMPT = (
+	"➕ <b>GURUH QO'SHISH</b>\n\n"
+	"Guruh yoki mavzuning havolasini kiriting:\n\n"
+	"📝 <b>Masalan:</b>\n"
+	"• <code>https://t.me/c/1234567890/123</code> (mavzu bilan)\n"
+	"• <code>https://t.me/c/1234567890</code> (mavzusiz)\n"
+	"• <code>-1001234567890</code> (raqamli ID)\n\n"
+	"💡 Guruh ID'sini olish uchun botni guruhga qo'shing va /rava buyrug'ini yuboring"
+)
+
 @admin_router.callback_query(F.data == "group_add")
 async def add_group_start(callback_query: CallbackQuery, state: FSMContext):
 	"""Guruh qo'shishni boshlash"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	await state.set_state(AdminStates.waiting_for_group_link)
-	text = (
-		"➕ **GURUH QO'SHISH**\n\n"
-		"Guruh yoki mavzuning havolasini kiriting:\n\n"
-		"📝 **Masalan:**\n"
-		"• `https://t.me/c/1234567890/123` (mavzu bilan)\n"
-		"• `https://t.me/c/1234567890` (mavzusiz)\n"
-		"• `-1001234567890` (raqamli ID)\n\n"
-		"💡 Guruh ID'sini olish uchun botni guruhga qo'shing va /rava buyrug'ini yuboring"
-	)
-	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, _ADD_GROUP_PROMPT, _CANCEL_KB)
 	await callback_query.answer()
 
 @admin_router.message(AdminStates.waiting_for_group_link)
 async def process_group_link(message: Message, state: FSMContext):
 	"""Guruh havolasini qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
+	parsed = parse_group_link(message.text.strip())
 	
-	link = message.text.strip()
-	group_id = None
-	topic_id = None
-	
-	match_channel_topic = re.match(r"https://t\.me/c/(\d+)/(\d+)", link)
-	match_channel_no_topic = re.match(r"https://t\.me/c/(\d+)", link)
-	match_numeric_id = re.match(r"^-?\d+$", link)
-	
-	if match_channel_topic:
-		group_id = int("-100" + match_channel_topic.group(1))
-		topic_id = int(match_channel_topic.group(2))
-	elif match_channel_no_topic:
-		group_id = int("-100" + match_channel_no_topic.group(1))
-		topic_id = None
-	elif match_numeric_id:
-		group_id = int(link)
-		topic_id = None
-	else:
+	if parsed is None:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Noto'g'ri havola kiritildi\n\n"
-			"**To'g'ri formatlar:**\n"
-			"• `https://t.me/c/GROUP_ID/TOPIC_ID`\n"
-			"• `https://t.me/c/GROUP_ID`\n"
-			"• `-1001234567890`",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			"<b>To'g'ri formatlar:</b>\n"
+			"• <code>https://t.me/c/GROUP_ID/TOPIC_ID</code>\n"
+			"• <code>https://t.me/c/GROUP_ID</code>\n"
+			"• <code>-1001234567890</code>",
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
+	group_id, topic_id = parsed
 	if group_id:
-		await state.update_data(temp_group_id=group_id, temp_topic_id=topic_id)
+		await start_flow(state, temp_group_id=group_id, temp_topic_id=topic_id)
 		await state.set_state(AdminStates.waiting_for_group_name)
 		await message.answer(
-			f"✅ **TASDIQLASH**\n\n"
-			f"**Guruh ID:** `{group_id}`\n"
-			f"**Mavzu ID:** {topic_id if topic_id else 'Yo\'q'}\n\n"
+			f"✅ <b>TASDIQLASH</b>\n\n"
+			f"<b>Guruh ID:</b> <code>{group_id}</code>\n"
+			f"<b>Mavzu ID:</b> {topic_id if topic_id else 'Yo\'q'}\n\n"
 			f"Endi bu guruh uchun nom kiriting:\n"
-			f"*(Masalan: 'Asosiy Sotuv Hisoboti')*",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			f"<i>(Masalan: 'Asosiy Sotuv Hisoboti')</i>",
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 
 @admin_router.message(AdminStates.waiting_for_group_name)
 async def process_group_name(message: Message, state: FSMContext):
 	"""Guruh nomini qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
 	group_name = message.text.strip()
 	if not group_name or len(group_name) < 3:
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Guruh nomini to'g'ri kiriting (kamida 3 belgi)",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	await state.update_data(temp_group_name=group_name)
+	await update_flow_data(state, temp_group_name=group_name)
 	
-	sheets = await get_all_google_sheets()
+	sheets = await get_all_google_sheets_cached()
 	if not sheets:
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Hozircha Google Sheets mavjud emas.\n"
 			"Avval Google Sheet qo'shing.",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
 	await state.set_state(AdminStates.waiting_for_group_sheet_selection)
 	await message.answer(
-		f"📊 **GOOGLE SHEET TANLASH**\n\n"
-		f"**'{group_name}'** guruhi uchun Google Sheet tanlang:\n\n"
+		f"📊 <b>GOOGLE SHEET TANLASH</b>\n\n"
+		f"<b>'{html.escape(group_name)}'</b> guruhi uchun Google Sheet tanlang:\n\n"
 		f"Bu guruhga yuborilgan hisobotlar tanlangan Google Sheets'ga saqlanadi.",
 		reply_markup=get_google_sheets_selection_keyboard(sheets),
-		parse_mode=ParseMode.MARKDOWN
+		parse_mode=ParseMode.HTML
 	)
 
-@admin_router.callback_query(AdminStates.waiting_for_group_sheet_selection, F.data.startswith("select_sheet_"))
+@admin_router.callback_query(AdminStates.waiting_for_group_sheet_selection, F.data.startswith(_PFX_SELECT_SHEET))
 async def process_group_sheet_selection(callback_query: CallbackQuery, state: FSMContext):
 	"""Guruh uchun Google Sheet tanlash"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
+	sheet_id = int(callback_query.data[len(_PFX_SELECT_SHEET):])
+	sheet_info, flow = await asyncio.gather(get_google_sheet_by_id(sheet_id), get_flow_data(state))
+	group_id = flow.temp_group_id
+	topic_id = flow.temp_topic_id
+	group_name = flow.temp_group_name
 	
-	sheet_id = int(callback_query.data.split("_")[-1])
-	data = await state.get_data()
-	group_id = data.get("temp_group_id")
-	topic_id = data.get("temp_topic_id")
-	group_name = data.get("temp_group_name")
-	
-	sheet_info = await get_google_sheet_by_id(sheet_id)
 	if not sheet_info:
 		await callback_query.answer("❌ Google Sheet topilmadi!", show_alert=True)
 		return
@@ -1190,90 +1362,70 @@ async def process_group_sheet_selection(callback_query: CallbackQuery, state: FS
 	
 	if success:
 		text = (
-			f"✅ **MUVAFFAQIYAT**\n\n"
-			f"Guruh **'{group_name}'** muvaffaqiyatli qo'shildi\n\n"
-			f"📊 **Guruh ID:** `{group_id}`\n"
-			f"📝 **Mavzu ID:** {topic_id if topic_id else 'Yo\'q'}\n"
-			f"📈 **Google Sheet:** {sheet_name}\n\n"
-			f"Bu guruhga yuborilgan hisobotlar **'{sheet_name}'** Google Sheets'ga saqlanadi."
+			f"✅ <b>MUVAFFAQIYAT</b>\n\n"
+			f"Guruh <b>'{html.escape(group_name)}'</b> muvaffaqiyatli qo'shildi\n\n"
+			f"📊 <b>Guruh ID:</b> <code>{group_id}</code>\n"
+			f"📝 <b>Mavzu ID:</b> {topic_id if topic_id else 'Yo\'q'}\n"
+			f"📈 <b>Google Sheet:</b> {html.escape(sheet_name)}\n\n"
+			f"Bu guruhga yuborilgan hisobotlar <b>'{html.escape(sheet_name)}'</b> Google Sheets'ga saqlanadi."
 		)
-		logging.info(f"Group {group_name} ({group_id}) added with Google Sheet {sheet_name} by admin")
+		_bump_render("groups")
+		logging.info("Group %s (%s) added with Google Sheet %s by admin", group_name, group_id, sheet_name)
 	else:
 		text = (
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Guruhni qo'shishda xatolik yuz berdi yoki bu guruh allaqachon mavjud"
 		)
 	
 	await state.clear()
-	await callback_query.message.edit_text(text, parse_mode=ParseMode.MARKDOWN)
 	
-	groups = await get_all_telegram_groups()
-	await callback_query.message.answer(
-		format_groups_list(groups),
-		reply_markup=get_groups_list_keyboard(groups),
-		parse_mode=ParseMode.MARKDOWN
-	)
+	# Natija va yangilangan ro'yxat bitta xabarda
+	groups_text, groups_keyboard = await render_groups_list()
+	await safe_edit_or_send(callback_query, f"{text}\n\n{groups_text}", groups_keyboard)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "group_delete")
 async def delete_group_start(callback_query: CallbackQuery, state: FSMContext):
 	"""Guruh o'chirishni boshlash"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	groups = await get_all_telegram_groups()
+	groups = await get_all_telegram_groups_cached()
 	if not groups:
 		await callback_query.answer("❌ O'chiriladigan guruhlar yo'q!", show_alert=True)
 		return
 	
 	await state.set_state(AdminStates.waiting_for_group_id_to_delete)
-	text = (
-		"🗑️ **GURUH O'CHIRISH**\n\n"
+	parts: List[str] = [
+		"🗑️ <b>GURUH O'CHIRISH</b>\n\n"
 		"O'chirmoqchi bo'lgan guruh ID'sini kiriting:\n\n"
-	)
-	
-	for i, group in enumerate(groups, 1):
-		db_id, group_id, group_name, topic_id, google_sheet_id, sheet_name = group
-		text += f"**{i}.** {group_name} - ID: `{group_id}`\n"
-	
-	text += "\n💡 Faqat guruh ID'sini kiriting *(masalan: -1001234567890)*"
+	]
+	parts.extend(f"<b>{i}.</b> {html.escape(group[2])} - ID: <code>{group[1]}</code>\n" for i, group in enumerate(groups, 1))
+	parts.append("\n💡 Faqat guruh ID'sini kiriting <i>(masalan: -1001234567890)</i>")
+	text = "".join(parts)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _CANCEL_KB)
 	await callback_query.answer()
 
 @admin_router.message(AdminStates.waiting_for_group_id_to_delete)
 async def process_group_delete(message: Message, state: FSMContext):
 	"""Guruh o'chirishni qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
 	try:
 		group_id = int(message.text.strip())
 	except ValueError:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Faqat raqamli guruh ID'sini kiriting\n"
-			"**Masalan:** `-1001234567890`",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			"<b>Masalan:</b> <code>-1001234567890</code>",
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
 	group_info = await get_telegram_group_by_id(group_id)
 	if not group_info:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Bunday ID'li guruh topilmadi",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
@@ -1281,19 +1433,20 @@ async def process_group_delete(message: Message, state: FSMContext):
 	success = await delete_telegram_group(group_id)
 	
 	if success:
-		text = f"✅ **MUVAFFAQIYAT**\n\nGuruh **'{group_name}'** o'chirildi"
-		logging.info(f"Group {group_name} ({group_id}) deleted by admin")
+		text = f"✅ <b>MUVAFFAQIYAT</b>\n\nGuruh <b>'{html.escape(group_name)}'</b> o'chirildi"
+		_bump_render("groups")
+		logging.info("Group %s (%s) deleted by admin", group_name, group_id)
 	else:
-		text = "❌ **XATO**\n\nGuruhni o'chirishda xatolik yuz berdi"
+		text = "❌ <b>XATO</b>\n\nGuruhni o'chirishda xatolik yuz berdi"
 	
 	await state.clear()
-	await message.answer(text, parse_mode=ParseMode.MARKDOWN)
 	
-	groups = await get_all_telegram_groups()
+	# Natija va yangilangan ro'yxat bitta xabarda
+	groups_text, groups_keyboard = await render_groups_list()
 	await message.answer(
-		format_groups_list(groups),
-		reply_markup=get_groups_list_keyboard(groups),
-		parse_mode=ParseMode.MARKDOWN
+		f"{text}\n\n{groups_text}",
+		reply_markup=groups_keyboard,
+		parse_mode=ParseMode.HTML
 	)
 
 # ============== GOOGLE SHEETS MANAGEMENT ==============
@@ -1301,207 +1454,161 @@ async def process_group_delete(message: Message, state: FSMContext):
 @admin_router.callback_query(F.data == "admin_sheets")
 async def show_google_sheets_menu(callback_query: CallbackQuery, state: FSMContext):
 	"""Google Sheets menyusini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	sheets = await get_all_google_sheets()
+	sheets = await get_all_google_sheets_cached()
 	
 	text = (
-		"📈 **GOOGLE SHEETS BOSHQARUVI**\n\n"
-		f"📊 Jami faol sheetlar: **{len(sheets)} ta**\n\n"
+		"📈 <b>GOOGLE SHEETS BOSHQARUVI</b>\n\n"
+		f"📊 Jami faol sheetlar: <b>{len(sheets)} ta</b>\n\n"
 		"Kerakli amalni tanlang:"
 	)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_google_sheets_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_google_sheets_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _SHEETS_MENU_KB)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "sheets_list")
 async def show_sheets_list(callback_query: CallbackQuery, state: FSMContext):
 	"""Google Sheets ro'yxatini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	sheets = await get_all_google_sheets()
-	text = format_sheets_list(sheets)
+	text, keyboard = await render_sheets_list()
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_sheets_list_keyboard(sheets),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_sheets_list_keyboard(sheets),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, keyboard)
 	await callback_query.answer()
 
+_ADD_SHEET_PROMPT = (
+	"➕ <b>GOOGLE SHEET QO'SHISH</b>\n\n"
+	"Avval Google Sheet uchun nom kiriting:\n\n"
+	"📝 <b>Masalan:</b>\n"
+	"• Asosiy Hisobotlar\n"
+	"• Toshkent Filiali\n"
+	"• Samarqand Bo'limi\n\n"
+	"💡 Bu nom guruhlar ro'yxatida ko'rinadi"
+)
+
 @admin_router.callback_query(F.data == "sheets_add")
 async def add_sheet_start(callback_query: CallbackQuery, state: FSMContext):
 	"""Google Sheet qo'shishni boshlash"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	await state.set_state(AdminStates.waiting_for_sheet_name)
-	text = (
-		"➕ **GOOGLE SHEET QO'SHISH**\n\n"
-		"Avval Google Sheet uchun nom kiriting:\n\n"
-		"📝 **Masalan:**\n"
-		"• Asosiy Hisobotlar\n"
-		"• Toshkent Filiali\n"
-		"• Samarqand Bo'limi\n\n"
-		"💡 Bu nom guruhlar ro'yxatida ko'rinadi"
-	)
-	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, _ADD_SHEET_PROMPT, _CANCEL_KB)
 	await callback_query.answer()
 
 @admin_router.message(AdminStates.waiting_for_sheet_name)
 async def process_sheet_name(message: Message, state: FSMContext):
 	"""Google Sheet nomini qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
 	sheet_name = message.text.strip()
 	if not sheet_name or len(sheet_name) < 3:
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Sheet nomini to'g'ri kiriting (kamida 3 belgi)",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	await state.update_data(temp_sheet_name=sheet_name)
+	await start_flow(state, temp_sheet_name=sheet_name)
 	await state.set_state(AdminStates.waiting_for_google_sheet_url)
 	
 	await message.answer(
-		f"🔗 **GOOGLE SHEET HAVOLASI**\n\n"
-		f"**'{sheet_name}'** uchun Google Sheet havolasini kiriting:\n\n"
-		f"📝 **Masalan:**\n"
-		f"`https://docs.google.com/spreadsheets/d/SPREADSHEET_ID/edit#gid=SHEET_ID`\n\n"
+		f"🔗 <b>GOOGLE SHEET HAVOLASI</b>\n\n"
+		f"<b>'{html.escape(sheet_name)}'</b> uchun Google Sheet havolasini kiriting:\n\n"
+		f"📝 <b>Masalan:</b>\n"
+		f"<code>https://docs.google.com/spreadsheets/d/SPREADSHEET_ID/edit#gid=SHEET_ID</code>\n\n"
 		f"💡 Sheet'ni service account email bilan ulashing:\n"
-		f"`web-malumotlari@aqueous-argon-454316-h5.iam.gserviceaccount.com`",
-		reply_markup=get_admin_cancel_inline_keyboard(),
-		parse_mode=ParseMode.MARKDOWN
+		f"<code>web-malumotlari@aqueous-argon-454316-h5.iam.gserviceaccount.com</code>",
+		reply_markup=_CANCEL_KB,
+		parse_mode=ParseMode.HTML
 	)
 
 @admin_router.message(AdminStates.waiting_for_google_sheet_url)
 async def process_google_sheet_url(message: Message, state: FSMContext):
 	"""Google Sheet URL'ini qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
 	url = message.text.strip()
-	match = re.search(r"https://docs\.google\.com/spreadsheets/d/([a-zA-Z0-9_-]+)", url)
+	match = _RE_SHEET_URL.search(url)
 	
 	if match:
 		spreadsheet_id = match.group(1)
-		await state.update_data(temp_spreadsheet_id=spreadsheet_id)
+		await update_flow_data(state, temp_spreadsheet_id=spreadsheet_id)
 		await state.set_state(AdminStates.waiting_for_google_sheet_worksheet_name)
 		
 		await message.answer(
-			f"✅ **TASDIQLASH**\n\n"
+			f"✅ <b>TASDIQLASH</b>\n\n"
 			f"Google Sheet ID qabul qilindi:\n"
-			f"`{spreadsheet_id}`\n\n"
+			f"<code>{html.escape(spreadsheet_id)}</code>\n\n"
 			f"Endi ishchi varaq nomini kiriting:\n"
-			f"*(masalan: 'Sheet1' yoki 'Hisobotlar')*",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			f"<i>(masalan: 'Sheet1' yoki 'Hisobotlar')</i>",
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 	else:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Noto'g'ri Google Sheet havolasi\n\n"
-			"**To'g'ri format:**\n"
-			"`https://docs.google.com/spreadsheets/d/SPREADSHEET_ID/edit`",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			"<b>To'g'ri format:</b>\n"
+			"<code>https://docs.google.com/spreadsheets/d/SPREADSHEET_ID/edit</code>",
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 
 @admin_router.message(AdminStates.waiting_for_google_sheet_worksheet_name)
 async def process_google_sheet_worksheet_name(message: Message, state: FSMContext):
 	"""Google Sheet worksheet nomini qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
 	worksheet_name = message.text.strip()
 	if not worksheet_name:
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Ishchi varaq nomini kiriting\n"
 			"Qaytadan kiriting",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	data = await state.get_data()
-	sheet_name = data.get("temp_sheet_name")
-	spreadsheet_id = data.get("temp_spreadsheet_id")
+	flow = await get_flow_data(state)
+	sheet_name = flow.temp_sheet_name
+	spreadsheet_id = flow.temp_spreadsheet_id
 	
 	try:
-		worksheet = get_worksheet(spreadsheet_id, worksheet_name)
+		worksheet = await asyncio.to_thread(get_worksheet, spreadsheet_id, worksheet_name)
 		if worksheet:
 			success = await add_google_sheet(sheet_name, spreadsheet_id, worksheet_name)
 			if success:
 				text = (
-					f"✅ **MUVAFFAQIYAT**\n\n"
-					f"Google Sheet **'{sheet_name}'** muvaffaqiyatli qo'shildi\n\n"
-					f"📊 **Nom:** {sheet_name}\n"
-					f"📄 **ID:** `{spreadsheet_id}`\n"
-					f"📋 **Varaq:** {worksheet_name}\n\n"
+					f"✅ <b>MUVAFFAQIYAT</b>\n\n"
+					f"Google Sheet <b>'{html.escape(sheet_name)}'</b> muvaffaqiyatli qo'shildi\n\n"
+					f"📊 <b>Nom:</b> {html.escape(sheet_name)}\n"
+					f"📄 <b>ID:</b> <code>{html.escape(spreadsheet_id)}</code>\n"
+					f"📋 <b>Varaq:</b> {html.escape(worksheet_name)}\n\n"
 					f"Endi bu Sheet'ni guruhlarga tayinlashingiz mumkin."
 				)
-				logging.info(f"Google Sheet added: {sheet_name} ({spreadsheet_id}/{worksheet_name})")
+				_bump_render("sheets")
+				logging.info("Google Sheet added: %s (%s/%s)", sheet_name, spreadsheet_id, worksheet_name)
 			else:
-				text = "❌ **XATO**\n\nMa'lumotlar bazasiga saqlashda xatolik yoki bu Sheet allaqachon mavjud"
+				text = "❌ <b>XATO</b>\n\nMa'lumotlar bazasiga saqlashda xatolik yoki bu Sheet allaqachon mavjud"
 		else:
 			text = (
-				"❌ **ULANISH XATOSI**\n\n"
+				"❌ <b>ULANISH XATOSI</b>\n\n"
 				"Google Sheet'ga ulanib bo'lmadi.\n\n"
-				"**Tekshiring:**\n"
+				"<b>Tekshiring:</b>\n"
 				"• Sheet ID to'g'ri ekanligini\n"
 				"• Service account'ga ruxsat berilganligini\n"
 				"• Varaq nomi to'g'ri ekanligini"
 			)
-	except Exception as e:
-		text = f"❌ **XATO**\n\nUlanishda xatolik: {str(e)}"
-		logging.error(f"Google Sheets connection error: {e}")
+	except (GSpreadException, OSError) as e:
+		text = f"❌ <b>XATO</b>\n\nUlanishda xatolik: {html.escape(str(e))}"
+		logging.error("Google Sheets connection error: %s", e)
 	
 	await state.clear()
-	await message.answer(text, parse_mode=ParseMode.MARKDOWN)
 	
-	sheets = await get_all_google_sheets()
+	# Natija va yangilangan ro'yxat bitta xabarda
+	sheets_text, sheets_keyboard = await render_sheets_list()
 	await message.answer(
-		format_sheets_list(sheets),
-		reply_markup=get_sheets_list_keyboard(sheets),
-		parse_mode=ParseMode.MARKDOWN
+		f"{text}\n\n{sheets_text}",
+		reply_markup=sheets_keyboard,
+		parse_mode=ParseMode.HTML
 	)
 
-@admin_router.callback_query(F.data.startswith("sheet_select_"))
+@admin_router.callback_query(F.data.startswith(_PFX_SHEET_SELECT))
 async def show_sheet_details(callback_query: CallbackQuery, state: FSMContext):
 	"""Google Sheet batafsil ma'lumotlarini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	sheet_id = int(callback_query.data.split("_")[-1])
+	sheet_id = int(callback_query.data[len(_PFX_SHEET_SELECT):])
 	sheet_info = await get_google_sheet_by_id(sheet_id)
 	
 	if not sheet_info:
@@ -1512,40 +1619,28 @@ async def show_sheet_details(callback_query: CallbackQuery, state: FSMContext):
 	
 	# Sheet ma'lumotlarini olish
 	try:
-		sheet_details = get_sheet_info(spreadsheet_id)
+		sheet_details = await asyncio.to_thread(get_sheet_info, spreadsheet_id)
+		ws_by_title = {ws['title']: ws for ws in (sheet_details or {}).get('worksheets', [])}
+		total_rows = ws_by_title.get(worksheet_name, {}).get('data_count', 0)
+	except (APIError, KeyError, TimeoutError) as e:
 		total_rows = 0
-		if sheet_details and sheet_details.get('worksheets'):
-			for ws in sheet_details['worksheets']:
-				if ws['title'] == worksheet_name:
-					total_rows = ws.get('data_count', 0)
-					break
-	except:
-		total_rows = 0
-	
-	text = f"📊 **GOOGLE SHEET MA'LUMOTLARI**\n\n"
-	text += f"📝 **Nom:** {sheet_name}\n"
-	text += f"📄 **Spreadsheet ID:** `{spreadsheet_id[:20]}...`\n"
-	text += f"📋 **Worksheet:** {worksheet_name}\n"
-	text += f"📊 **Ma'lumotlar:** {total_rows} ta qator\n"
-	text += f"🔘 **Holat:** {'🟢 Faol' if is_active else '🔴 Nofaol'}\n\n"
+		logging.warning("Sheet info olinmadi: %s", e)
+	
+	text = "📊 <b>GOOGLE SHEET MA'LUMOTLARI</b>\n\n"
+	text += f"📝 <b>Nom:</b> {html.escape(sheet_name)}\n"
+	text += f"📄 <b>Spreadsheet ID:</b> <code>{html.escape(_trunc(spreadsheet_id, 20))}</code>\n"
+	text += f"📋 <b>Worksheet:</b> {html.escape(worksheet_name)}\n"
+	text += f"📊 <b>Ma'lumotlar:</b> {total_rows} ta qator\n"
+	text += f"🔘 <b>Holat:</b> {'🟢 Faol' if is_active else '🔴 Nofaol'}\n\n"
 	text += "💡 Kerakli amalni tanlang:"
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_sheet_management_keyboard(sheet_db_id),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_sheet_management_keyboard(sheet_db_id),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, get_sheet_management_keyboard(sheet_db_id))
 	await callback_query.answer()
 
-@admin_router.callback_query(F.data.startswith("sheet_test_"))
+@admin_router.callback_query(F.data.startswith(_PFX_SHEET_TEST))
 async def test_sheet(callback_query: CallbackQuery, state: FSMContext):
 	"""Google Sheet'ni test qilish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	sheet_id = int(callback_query.data.split("_")[-1])
+	sheet_id = int(callback_query.data[len(_PFX_SHEET_TEST):])
 	sheet_info = await get_google_sheet_by_id(sheet_id)
 	
 	if not sheet_info:
@@ -1554,27 +1649,23 @@ async def test_sheet(callback_query: CallbackQuery, state: FSMContext):
 	
 	sheet_db_id, sheet_name, spreadsheet_id, worksheet_name, is_active = sheet_info
 	
-	success, message_text = test_google_sheets_connection(spreadsheet_id, worksheet_name)
+	success, message_text = await asyncio.to_thread(test_google_sheets_connection, spreadsheet_id, worksheet_name)
 	
 	if success:
 		await callback_query.message.answer(
-			f"✅ **TEST MUVAFFAQIYATLI**\n\n{message_text}",
-			parse_mode=ParseMode.MARKDOWN
+			f"✅ <b>TEST MUVAFFAQIYATLI</b>\n\n{html.escape(message_text)}",
+			parse_mode=ParseMode.HTML
 		)
 		await callback_query.answer("✅ Test muvaffaqiyatli bajarildi!")
-		logging.info(f"Google Sheets test successful: {sheet_name} ({spreadsheet_id}/{worksheet_name})")
+		logging.info("Google Sheets test successful: %s (%s/%s)", sheet_name, spreadsheet_id, worksheet_name)
 	else:
 		await callback_query.answer(f"❌ Test muvaffaqiyatsiz: {message_text}", show_alert=True)
-		logging.error(f"Google Sheets test failed: {message_text}")
+		logging.error("Google Sheets test failed: %s", message_text)
 
-@admin_router.callback_query(F.data.startswith("sheet_stats_"))
+@admin_router.callback_query(F.data.startswith(_PFX_SHEET_STATS))
 async def show_sheet_stats(callback_query: CallbackQuery, state: FSMContext):
 	"""Google Sheet statistikasini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	sheet_id = int(callback_query.data.split("_")[-1])
+	sheet_id = int(callback_query.data[len(_PFX_SHEET_STATS):])
 	sheet_info = await get_google_sheet_by_id(sheet_id)
 	
 	if not sheet_info:
@@ -1584,44 +1675,40 @@ async def show_sheet_stats(callback_query: CallbackQuery, state: FSMContext):
 	sheet_db_id, sheet_name, spreadsheet_id, worksheet_name, is_active = sheet_info
 	
 	try:
-		stats = get_reports_statistics(spreadsheet_id, worksheet_name)
+		stats = await asyncio.to_thread(get_reports_statistics, spreadsheet_id, worksheet_name)
 		if stats:
-			text = f"📊 **{sheet_name.upper()} STATISTIKASI**\n\n"
-			text += f"📈 **Jami hisobotlar:** {stats.get('total_reports', 0)} ta\n"
-			text += f"👥 **Sotuvchilar:** {len(stats.get('sellers_stats', {}))} ta\n"
-			text += f"🛍️ **Mahsulotlar:** {len(stats.get('product_stats', {}))} ta\n"
-			text += f"📍 **Hududlar:** {len(stats.get('location_stats', {}))} ta\n"
-			text += f"📅 **Yangilangan:** {stats.get('last_updated', 'Noma\'lum')}\n\n"
+			text = f"📊 <b>{html.escape(sheet_name.upper())} STATISTIKASI</b>\n\n"
+			text += f"📈 <b>Jami hisobotlar:</b> {stats.get('total_reports', 0)} ta\n"
+			text += f"👥 <b>Sotuvchilar:</b> {len(stats.get('sellers_stats', {}))} ta\n"
+			text += f"🛍️ <b>Mahsulotlar:</b> {len(stats.get('product_stats', {}))} ta\n"
+			text += f"📍 <b>Hududlar:</b> {len(stats.get('location_stats', {}))} ta\n"
+			text += f"📅 <b>Yangilangan:</b> {stats.get('last_updated', 'Noma\'lum')}\n\n"
 			
 			top_sellers = stats.get('top_sellers', {})
 			if top_sellers:
-				text += "🏆 **TOP SOTUVCHILAR:**\n"
+				text += "🏆 <b>TOP SOTUVCHILAR:</b>\n"
 				for i, (seller, count) in enumerate(list(top_sellers.items())[:5], 1):
-					text += f"{i}. {seller}: {count} ta\n"
+					text += f"{i}. {html.escape(seller)}: {count} ta\n"
 			
 			top_products = stats.get('top_products', {})
 			if top_products:
-				text += "\n🛍️ **TOP MAHSULOTLAR:**\n"
+				text += "\n🛍️ <b>TOP MAHSULOTLAR:</b>\n"
 				for i, (product, count) in enumerate(list(top_products.items())[:3], 1):
-					product_short = product[:30] + "..." if len(product) > 30 else product
-					text += f"{i}. {product_short}: {count} ta\n"
+					product_short = _trunc(product, 30)
+					text += f"{i}. {html.escape(product_short)}: {count} ta\n"
 		else:
-			text = f"📊 **{sheet_name.upper()} STATISTIKASI**\n\nMa'lumotlar topilmadi"
+			text = f"📊 <b>{html.escape(sheet_name.upper())} STATISTIKASI</b>\n\nMa'lumotlar topilmadi"
 	except Exception as e:
-		text = f"📊 **{sheet_name.upper()} STATISTIKASI**\n\nXatolik: {str(e)}"
-		logging.error(f"Error getting sheet stats: {e}")
+		text = f"📊 <b>{html.escape(sheet_name.upper())} STATISTIKASI</b>\n\nXatolik: {html.escape(str(e))}"
+		logging.error("Error getting sheet stats: %s", e)
 	
-	await callback_query.message.answer(text, parse_mode=ParseMode.MARKDOWN)
+	await callback_query.message.answer(text, parse_mode=ParseMode.HTML)
 	await callback_query.answer()
 
-@admin_router.callback_query(F.data.startswith("sheet_delete_"))
+@admin_router.callback_query(F.data.startswith(_PFX_SHEET_DEL))
 async def delete_sheet(callback_query: CallbackQuery, state: FSMContext):
 	"""Google Sheet'ni o'chirish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	sheet_id = int(callback_query.data.split("_")[-1])
+	sheet_id = int(callback_query.data[len(_PFX_SHEET_DEL):])
 	sheet_info = await get_google_sheet_by_id(sheet_id)
 	
 	if not sheet_info:
@@ -1633,19 +1720,36 @@ async def delete_sheet(callback_query: CallbackQuery, state: FSMContext):
 	
 	if success:
 		await callback_query.answer(f"✅ '{sheet_name}' Google Sheet o'chirildi!", show_alert=True)
-		logging.info(f"Google Sheet deleted: {sheet_name} by admin")
+		# Guruhlar ro'yxati ham sheet nomini ko'rsatadi
+		_bump_render("groups", "sheets")
+		logging.info("Google Sheet deleted: %s by admin", sheet_name)
 		await show_sheets_list(callback_query, state)
 	else:
 		await callback_query.answer("❌ Xatolik yuz berdi!", show_alert=True)
 
-@admin_router.callback_query(F.data.startswith("sheet_update_"))
+# Sheet bo'yicha qulflar: (spreadsheet_id, worksheet_name) -> [qulf, foydalanuvchilar soni].
+# Bir varaqni bir vaqtda faqat bitta tozalash o'zgartiradi; hech kim ishlatmayotgan yozuv o'chiriladi
+_sheet_locks: Dict[Tuple[str, str], List[Any]] = {}
+
+@asynccontextmanager
+async def _sheet_lock(spreadsheet_id: str, worksheet_name: str):
+	key = (spreadsheet_id, worksheet_name)
+	entry = _sheet_locks.get(key)
+	if entry is None:
+		entry = _sheet_locks[key] = [asyncio.Lock(), 0]
+	entry[1] += 1
+	try:
+		async with entry[0]:
+			yield
+	finally:
+		entry[1] -= 1
+		if not entry[1]:
+			del _sheet_locks[key]
+
+@admin_router.callback_query(F.data.startswith(_PFX_SHEET_UPD))
 async def update_sheet(callback_query: CallbackQuery, state: FSMContext):
 	"""Google Sheet'ni yangilash"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	sheet_id = int(callback_query.data.split("_")[-1])
+	sheet_id = int(callback_query.data[len(_PFX_SHEET_UPD):])
 	sheet_info = await get_google_sheet_by_id(sheet_id)
 	
 	if not sheet_info:
@@ -1655,15 +1759,16 @@ async def update_sheet(callback_query: CallbackQuery, state: FSMContext):
 	sheet_db_id, sheet_name, spreadsheet_id, worksheet_name, is_active = sheet_info
 	
 	try:
-		success = clear_test_data(spreadsheet_id, worksheet_name)
+		async with _sheet_lock(spreadsheet_id, worksheet_name):
+			success = await asyncio.to_thread(clear_test_data, spreadsheet_id, worksheet_name)
 		if success:
 			await callback_query.answer(f"🔄 '{sheet_name}' yangilandi va test ma'lumotlari tozalandi!", show_alert=True)
-			logging.info(f"Google Sheet updated and cleaned: {sheet_name}")
+			logging.info("Google Sheet updated and cleaned: %s", sheet_name)
 		else:
 			await callback_query.answer("⚠️ Yangilashda muammo bo'ldi!", show_alert=True)
 	except Exception as e:
 		await callback_query.answer(f"❌ Xatolik: {str(e)}", show_alert=True)
-		logging.error(f"Error updating sheet: {e}")
+		logging.error("Error updating sheet: %s", e)
 
 # ============== ADMIN MANAGEMENT ==============
 
@@ -1676,12 +1781,7 @@ async def show_admin_management(callback_query: CallbackQuery, state: FSMContext
 	
 	text = format_admins_list()
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_admin_management_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_admin_management_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _ADMIN_MGMT_KB)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "admins_list")
@@ -1692,7 +1792,9 @@ async def show_admins_list(callback_query: CallbackQuery, state: FSMContext):
 		return
 	
 	text = format_admins_list()
-	await callback_query.answer(text, show_alert=True)
+	# Matn alert chegarasidan (200 belgi) uzun - alohida xabar sifatida
+	await callback_query.message.answer(text, parse_mode=ParseMode.HTML)
+	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "admin_add")
 async def add_admin_start(callback_query: CallbackQuery, state: FSMContext):
@@ -1703,21 +1805,16 @@ async def add_admin_start(callback_query: CallbackQuery, state: FSMContext):
 	
 	await state.set_state(AdminStates.waiting_for_new_admin_id)
 	text = (
-		"➕ **YANGI ADMIN QO'SHISH**\n\n"
+		"➕ <b>YANGI ADMIN QO'SHISH</b>\n\n"
 		"Yangi admin bo'lishi kerak bo'lgan foydalanuvchining Telegram ID'sini kiriting:\n\n"
-		"📝 **Masalan:** `123456789`\n\n"
-		"💡 **Eslatma:**\n"
+		"📝 <b>Masalan:</b> <code>123456789</code>\n\n"
+		"💡 <b>Eslatma:</b>\n"
 		"• Foydalanuvchi ID'sini olish uchun @userinfobot dan foydalaning\n"
 		"• Yangi admin to'liq huquqlarga ega bo'ladi\n"
 		"• Faqat siz (asosiy admin) adminlarni boshqara olasiz"
 	)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _CANCEL_KB)
 	await callback_query.answer()
 
 @admin_router.message(AdminStates.waiting_for_new_admin_id)
@@ -1728,46 +1825,36 @@ async def process_new_admin_id(message: Message, state: FSMContext):
 		await state.clear()
 		return
 	
-	try:
-		new_admin_id = int(message.text.strip())
-	except ValueError:
+	new_admin_id = parse_user_id(message.text)
+	if new_admin_id is None:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Faqat raqamli Telegram ID kiriting\n"
-			"**Masalan:** `123456789`",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			"<b>Masalan:</b> <code>123456789</code>",
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	if new_admin_id == ADMIN_ID:
+	if new_admin_id in _ADMIN_SET:
+		reason = "Siz allaqachon asosiy adminsiz!" if new_admin_id == ADMIN_ID else "Bu foydalanuvchi allaqachon admin!"
 		await message.answer(
-			"⚠️ **XATO**\n\n"
-			"Siz allaqachon asosiy adminsiz!",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			f"⚠️ <b>XATO</b>\n\n{reason}",
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	if new_admin_id in ADDITIONAL_ADMINS:
-		await message.answer(
-			"⚠️ **XATO**\n\n"
-			"Bu foydalanuvchi allaqachon admin!",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
-		)
-		return
-	
-	await state.update_data(new_admin_id=new_admin_id)
+	await start_flow(state, new_admin_id=new_admin_id)
 	await state.set_state(AdminStates.waiting_for_admin_name)
 	
 	await message.answer(
-		f"✅ **TASDIQLASH**\n\n"
-		f"**Yangi admin ID:** `{new_admin_id}`\n\n"
+		f"✅ <b>TASDIQLASH</b>\n\n"
+		f"<b>Yangi admin ID:</b> <code>{new_admin_id}</code>\n\n"
 		f"Bu admin uchun nom kiriting:\n"
-		f"*(Masalan: 'Akmal Admin' yoki 'Yordamchi Admin')*",
-		reply_markup=get_admin_cancel_inline_keyboard(),
-		parse_mode=ParseMode.MARKDOWN
+		f"<i>(Masalan: 'Akmal Admin' yoki 'Yordamchi Admin')</i>",
+		reply_markup=_CANCEL_KB,
+		parse_mode=ParseMode.HTML
 	)
 
 @admin_router.message(AdminStates.waiting_for_admin_name)
@@ -1781,40 +1868,39 @@ async def process_admin_name(message: Message, state: FSMContext):
 	admin_name = message.text.strip()
 	if not admin_name or len(admin_name) < 2:
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Admin nomini to'g'ri kiriting (kamida 2 belgi)",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	data = await state.get_data()
-	new_admin_id = data.get("new_admin_id")
+	flow = await get_flow_data(state)
+	new_admin_id = flow.new_admin_id
 	
 	success = add_admin(new_admin_id)
 	
 	if success:
 		text = (
-			f"✅ **MUVAFFAQIYAT**\n\n"
+			f"✅ <b>MUVAFFAQIYAT</b>\n\n"
 			f"Yangi admin muvaffaqiyatli qo'shildi!\n\n"
-			f"👨‍💻 **Admin nomi:** {admin_name}\n"
-			f"🆔 **Telegram ID:** `{new_admin_id}`\n"
-			f"🔐 **Huquqlar:** To'liq admin huquqlari\n"
-			f"📅 **Qo'shilgan:** {datetime.now().strftime('%d.%m.%Y %H:%M')}\n\n"
-			f"⚠️ **Eslatma:** Yangi admin darhol barcha admin funksiyalaridan foydalana oladi."
+			f"👨‍💻 <b>Admin nomi:</b> {html.escape(admin_name)}\n"
+			f"🆔 <b>Telegram ID:</b> <code>{new_admin_id}</code>\n"
+			f"🔐 <b>Huquqlar:</b> To'liq admin huquqlari\n"
+			f"📅 <b>Qo'shilgan:</b> {minute_stamp()}\n\n"
+			f"⚠️ <b>Eslatma:</b> Yangi admin darhol barcha admin funksiyalaridan foydalana oladi."
 		)
-		logging.info(f"New admin added: {new_admin_id} ({admin_name}) by main admin")
+		logging.info("New admin added: %s (%s) by main admin", new_admin_id, admin_name)
 	else:
-		text = "❌ **XATO**\n\nAdminni qo'shishda xatolik yuz berdi"
+		text = "❌ <b>XATO</b>\n\nAdminni qo'shishda xatolik yuz berdi"
 	
 	await state.clear()
-	await message.answer(text, parse_mode=ParseMode.MARKDOWN)
 	
-	# Admin ro'yxatini yangilash
+	# Admin ro'yxatini yangilash (natija bilan bitta xabarda)
 	await message.answer(
-		format_admins_list(),
-		reply_markup=get_admin_management_keyboard(),
-		parse_mode=ParseMode.MARKDOWN
+		f"{text}\n\n{format_admins_list()}",
+		reply_markup=_ADMIN_MGMT_KB,
+		parse_mode=ParseMode.HTML
 	)
 
 @admin_router.callback_query(F.data == "admin_remove")
@@ -1828,25 +1914,18 @@ async def remove_admin_start(callback_query: CallbackQuery, state: FSMContext):
 		await callback_query.answer("❌ O'chiriladigan qo'shimcha adminlar yo'q!", show_alert=True)
 		return
 	
-	text = (
-		"🗑️ **ADMIN O'CHIRISH**\n\n"
+	parts: List[str] = [
+		"🗑️ <b>ADMIN O'CHIRISH</b>\n\n"
 		"O'chirmoqchi bo'lgan admin ID'sini kiriting:\n\n"
-		"**Qo'shimcha adminlar:**\n"
-	)
-	
-	for i, admin_id in enumerate(ADDITIONAL_ADMINS, 1):
-		text += f"{i}. ID: `{admin_id}`\n"
-	
-	text += "\n💡 Faqat admin ID'sini kiriting"
+		"<b>Qo'shimcha adminlar:</b>\n"
+	]
+	parts.extend(f"{i}. ID: <code>{admin_id}</code>\n" for i, admin_id in enumerate(sorted(ADDITIONAL_ADMINS), 1))
+	parts.append("\n💡 Faqat admin ID'sini kiriting")
+	text = "".join(parts)
 	
 	await state.set_state(AdminStates.waiting_for_admin_delete_confirmation)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _CANCEL_KB)
 	await callback_query.answer()
 
 @admin_router.message(AdminStates.waiting_for_admin_delete_confirmation)
@@ -1857,32 +1936,31 @@ async def process_admin_delete(message: Message, state: FSMContext):
 		await state.clear()
 		return
 	
-	try:
-		admin_id_to_remove = int(message.text.strip())
-	except ValueError:
+	admin_id_to_remove = parse_user_id(message.text)
+	if admin_id_to_remove is None:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Faqat raqamli admin ID kiriting",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
 	if admin_id_to_remove == ADMIN_ID:
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Asosiy adminni o'chirish mumkin emas!",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
 	if admin_id_to_remove not in ADDITIONAL_ADMINS:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Bunday ID'li admin topilmadi",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
@@ -1890,26 +1968,50 @@ async def process_admin_delete(message: Message, state: FSMContext):
 	
 	if success:
 		text = (
-			f"✅ **MUVAFFAQIYAT**\n\n"
+			f"✅ <b>MUVAFFAQIYAT</b>\n\n"
 			f"Admin muvaffaqiyatli o'chirildi!\n\n"
-			f"🆔 **O'chirilgan admin ID:** `{admin_id_to_remove}`\n"
-			f"📅 **O'chirilgan:** {datetime.now().strftime('%d.%m.%Y %H:%M')}\n\n"
-			f"⚠️ **Eslatma:** Bu foydalanuvchi endi admin huquqlariga ega emas."
+			f"🆔 <b>O'chirilgan admin ID:</b> <code>{admin_id_to_remove}</code>\n"
+			f"📅 <b>O'chirilgan:</b> {minute_stamp()}\n\n"
+			f"⚠️ <b>Eslatma:</b> Bu foydalanuvchi endi admin huquqlariga ega emas."
 		)
-		logging.info(f"Admin removed: {admin_id_to_remove} by main admin")
+		logging.info("Admin removed: %s by main admin", admin_id_to_remove)
 	else:
-		text = "❌ **XATO**\n\nAdminni o'chirishda xatolik yuz berdi"
+		text = "❌ <b>XATO</b>\n\nAdminni o'chirishda xatolik yuz berdi"
 	
 	await state.clear()
-	await message.answer(text, parse_mode=ParseMode.MARKDOWN)
 	
-	# Admin ro'yxatini yangilash
+	# Admin ro'yxatini yangilash (natija bilan bitta xabarda)
 	await message.answer(
-		format_admins_list(),
-		reply_markup=get_admin_management_keyboard(),
-		parse_mode=ParseMode.MARKDOWN
+		f"{text}\n\n{format_admins_list()}",
+		reply_markup=_ADMIN_MGMT_KB,
+		parse_mode=ParseMode.HTML
 	)
 
+_ADMIN_PERMISSIONS_TMPL = (
+	"🔐 <b>ADMIN HUQUQLARI</b>\n\n"
+	"<b>👑 Asosiy Admin (Siz):</b>\n"
+	"├ ✅ Barcha admin funksiyalari\n"
+	"├ ✅ Adminlarni qo'shish/o'chirish\n"
+	"├ ✅ Tasdiqlovchilarni boshqarish\n"
+	"├ ✅ Tizim sozlamalari\n"
+	"├ ✅ Parol o'zgartirish\n"
+	"└ ✅ To'liq nazorat\n\n"
+	
+	"<b>👨‍💻 Qo'shimcha Adminlar:</b>\n"
+	"├ ✅ Ishchilarni boshqarish\n"
+	"├ ✅ Guruhlarni boshqarish\n"
+	"├ ✅ Google Sheets boshqaruvi\n"
+	"├ ✅ Hisobotlarni ko'rish\n"
+	"├ ✅ Statistika va analitika\n"
+	"├ ✅ Tasdiqlovchilarni boshqarish\n"
+	"├ ❌ Admin qo'shish/o'chirish\n"
+	"└ ❌ Tizim sozlamalari\n\n"
+	
+	"📊 <b>Jami adminlar:</b> {total} ta\n"
+	"👑 <b>Asosiy admin:</b> 1 ta\n"
+	"👨‍💻 <b>Qo'shimcha adminlar:</b> {extra} ta"
+)
+
 @admin_router.callback_query(F.data == "admin_permissions")
 async def show_admin_permissions(callback_query: CallbackQuery, state: FSMContext):
 	"""Admin huquqlarini ko'rsatish"""
@@ -1917,148 +2019,97 @@ async def show_admin_permissions(callback_query: CallbackQuery, state: FSMContex
 		await callback_query.answer("🚫 Faqat asosiy admin bu ma'lumotni ko'ra oladi!", show_alert=True)
 		return
 	
-	text = (
-		"🔐 **ADMIN HUQUQLARI**\n\n"
-		"**👑 Asosiy Admin (Siz):**\n"
-		"├ ✅ Barcha admin funksiyalari\n"
-		"├ ✅ Adminlarni qo'shish/o'chirish\n"
-		"├ ✅ Tasdiqlovchilarni boshqarish\n"
-		"├ ✅ Tizim sozlamalari\n"
-		"├ ✅ Parol o'zgartirish\n"
-		"└ ✅ To'liq nazorat\n\n"
-		
-		"**👨‍💻 Qo'shimcha Adminlar:**\n"
-		"├ ✅ Ishchilarni boshqarish\n"
-		"├ ✅ Guruhlarni boshqarish\n"
-		"├ ✅ Google Sheets boshqaruvi\n"
-		"├ ✅ Hisobotlarni ko'rish\n"
-		"├ ✅ Statistika va analitika\n"
-		"├ ✅ Tasdiqlovchilarni boshqarish\n"
-		"├ ❌ Admin qo'shish/o'chirish\n"
-		"└ ❌ Tizim sozlamalari\n\n"
-		
-		f"📊 **Jami adminlar:** {len(get_all_admins())} ta\n"
-		f"👑 **Asosiy admin:** 1 ta\n"
-		f"👨‍💻 **Qo'shimcha adminlar:** {len(ADDITIONAL_ADMINS)} ta"
-	)
-	
-	await callback_query.answer(text, show_alert=True)
+	text = _ADMIN_PERMISSIONS_TMPL.format(total=count_admins(), extra=len(ADDITIONAL_ADMINS))
+	# Matn alert chegarasidan (200 belgi) uzun - alohida xabar sifatida
+	await callback_query.message.answer(text, parse_mode=ParseMode.HTML)
+	await callback_query.answer()
 
 # ============== PASSWORD MANAGEMENT ==============
 
 @admin_router.callback_query(F.data == "admin_change_password")
 async def show_password_menu(callback_query: CallbackQuery, state: FSMContext):
 	"""Parol boshqaruvi menyusini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	current_password = await get_current_password()
 	
 	text = (
-		"🔐 **PAROL BOSHQARUVI**\n\n"
-		f"📋 **Joriy parol:** `{current_password}`\n\n"
-		"⚠️ **DIQQAT:**\n"
+		"🔐 <b>PAROL BOSHQARUVI</b>\n\n"
+		f"📋 <b>Joriy parol:</b> <code>{html.escape(current_password)}</code>\n\n"
+		"⚠️ <b>DIQQAT:</b>\n"
 		"• Parol o'zgarishi faqat yangi foydalanuvchilarga ta'sir qiladi\n"
 		"• Mavjud foydalanuvchilar eski parol bilan kirishda davom etadilar\n"
 		"• Yangi foydalanuvchilar yangi parol bilan ro'yxatdan o'tadilar\n\n"
 		"Kerakli amalni tanlang:"
 	)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_password_change_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_password_change_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _PASSWORD_KB)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "change_password_start")
 async def start_password_change(callback_query: CallbackQuery, state: FSMContext):
 	"""Parol o'zgartirishni boshlash"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	await state.set_state(AdminStates.waiting_for_new_password)
 	text = (
-		"🔐 **YANGI PAROL KIRITING**\n\n"
+		"🔐 <b>YANGI PAROL KIRITING</b>\n\n"
 		"Yangi parolni kiriting:\n\n"
-		"📝 **Tavsiyalar:**\n"
+		"📝 <b>Tavsiyalar:</b>\n"
 		"• Kamida 4 belgi\n"
 		"• Oson eslab qoladigan\n"
 		"• Xavfsiz bo'lishi kerak\n\n"
-		"💡 **Masalan:** `2025`, `admin123`, `secure2024`"
+		"💡 <b>Masalan:</b> <code>2025</code>, <code>admin123</code>, <code>secure2024</code>"
 	)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _CANCEL_KB)
 	await callback_query.answer()
 
 @admin_router.message(AdminStates.waiting_for_new_password)
 async def process_new_password(message: Message, state: FSMContext):
 	"""Yangi parolni qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
 	new_password = message.text.strip()
 	if not new_password or len(new_password) < 4:
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Parol kamida 4 belgi bo'lishi kerak.\n"
 			"Qaytadan kiriting:",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	current_password = await get_current_password()
-	if new_password == current_password:
+	if await check_password(new_password):
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Yangi parol joriy parol bilan bir xil.\n"
 			"Boshqa parol kiriting:",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	await state.update_data(new_password=new_password)
+	await start_flow(state, new_password=new_password)
 	await state.set_state(AdminStates.waiting_for_password_confirmation)
 	
 	await message.answer(
-		f"🔐 **PAROLNI TASDIQLASH**\n\n"
-		f"**Yangi parol:** `{new_password}`\n\n"
+		f"🔐 <b>PAROLNI TASDIQLASH</b>\n\n"
+		f"<b>Yangi parol:</b> <code>{html.escape(new_password)}</code>\n\n"
 		f"Parolni tasdiqlash uchun qaytadan kiriting:",
-		reply_markup=get_admin_cancel_inline_keyboard(),
-		parse_mode=ParseMode.MARKDOWN
+		reply_markup=_CANCEL_KB,
+		parse_mode=ParseMode.HTML
 	)
 
 @admin_router.message(AdminStates.waiting_for_password_confirmation)
 async def process_password_confirmation(message: Message, state: FSMContext):
 	"""Parol tasdiqlashni qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
 	confirmation = message.text.strip()
-	data = await state.get_data()
-	new_password = data.get("new_password")
+	flow = await get_flow_data(state)
+	new_password = flow.new_password
 	
 	if confirmation != new_password:
 		await message.answer(
-			"❌ **XATO**\n\n"
+			"❌ <b>XATO</b>\n\n"
 			"Parollar mos kelmadi.\n"
 			"Qaytadan tasdiqlash parolini kiriting:",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
@@ -2066,28 +2117,24 @@ async def process_password_confirmation(message: Message, state: FSMContext):
 	
 	if success:
 		text = (
-			f"✅ **MUVAFFAQIYAT**\n\n"
+			f"✅ <b>MUVAFFAQIYAT</b>\n\n"
 			f"Parol muvaffaqiyatli o'zgartirildi!\n\n"
-			f"📋 **Yangi parol:** `{new_password}`\n\n"
-			f"⚠️ **ESLATMA:**\n"
-			f"• Yangi foydalanuvchilar `{new_password}` parol bilan ro'yxatdan o'tadilar\n"
+			f"📋 <b>Yangi parol:</b> <code>{html.escape(new_password)}</code>\n\n"
+			f"⚠️ <b>ESLATMA:</b>\n"
+			f"• Yangi foydalanuvchilar <code>{html.escape(new_password)}</code> parol bilan ro'yxatdan o'tadilar\n"
 			f"• Mavjud foydalanuvchilar eski parol bilan kirishda davom etadilar\n"
 			f"• Bu o'zgarish darhol kuchga kiradi"
 		)
-		logging.info(f"Admin password changed to: {new_password}")
+		logging.info("Admin password changed to: %s", new_password)
 	else:
-		text = "❌ **XATO**\n\nParolni o'zgartirishda xatolik yuz berdi"
+		text = "❌ <b>XATO</b>\n\nParolni o'zgartirishda xatolik yuz berdi"
 	
 	await state.clear()
-	await message.answer(text, parse_mode=ParseMode.MARKDOWN)
+	await message.answer(text, parse_mode=ParseMode.HTML)
 
 @admin_router.callback_query(F.data == "view_current_password")
 async def view_current_password(callback_query: CallbackQuery, state: FSMContext):
 	"""Joriy parolni ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	current_password = await get_current_password()
 	await callback_query.answer(f"🔐 Joriy parol: {current_password}", show_alert=True)
 
@@ -2096,61 +2143,39 @@ async def view_current_password(callback_query: CallbackQuery, state: FSMContext
 @admin_router.callback_query(F.data == "admin_reports")
 async def show_reports_menu(callback_query: CallbackQuery, state: FSMContext):
 	"""Hisobotlar menyusini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	try:
-		await callback_query.message.edit_text(
-			"📊 **HISOBOTLAR**\n\nKerakli bo'limni tanlang:",
-			reply_markup=get_reports_stats_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
-		)
-	except TelegramBadRequest:
-		await callback_query.message.answer(
-			"📊 **HISOBOTLAR**\n\nKerakli bo'limni tanlang:",
-			reply_markup=get_reports_stats_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
-		)
+	await safe_edit_or_send(
+		callback_query,
+		"📊 <b>HISOBOTLAR</b>\n\nKerakli bo'limni tanlang:",
+		_REPORTS_KB
+	)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "reports_general")
 async def show_general_reports(callback_query: CallbackQuery, state: FSMContext):
 	"""Umumiy hisobotlarni ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	stats = await get_database_stats()
-	
-	today = date.today()
-	week_ago = today - timedelta(days=7)
-	week_reports = await get_reports_count_by_date(week_ago.isoformat(), today.isoformat())
-	
-	month_ago = today - timedelta(days=30)
-	month_reports = await get_reports_count_by_date(month_ago.isoformat(), today.isoformat())
+	today, week_ago, month_ago = report_windows()
+	stats, week_reports, month_reports = await asyncio.gather(
+		get_database_stats(today),
+		get_reports_count_by_date(week_ago, today),
+		get_reports_count_by_date(month_ago, today)
+	)
 	
 	text = (
-		"📊 **UMUMIY STATISTIKA**\n\n"
-		f"👥 **Jami ishchilar:** {stats.get('total_users', 0)} ta\n"
-		f"📝 **Jami hisobotlar:** {stats.get('total_reports', 0)} ta\n"
-		f"✅ **Tasdiqlangan:** {stats.get('confirmed_reports', 0)} ta\n"
-		f"⏳ **Kutilayotgan:** {stats.get('pending_reports', 0)} ta\n"
-		f"📅 **Bugungi hisobotlar:** {stats.get('today_reports', 0)} ta\n"
-		f"📈 **Haftalik hisobotlar:** {week_reports} ta\n"
-		f"📊 **Oylik hisobotlar:** {month_reports} ta\n"
-		f"🎯 **Tasdiqlash foizi:** {stats.get('confirmation_rate', 0)}%\n\n"
-		f"🏙️ **TOSHKENT SHAHAR:**\n"
+		"📊 <b>UMUMIY STATISTIKA</b>\n\n"
+		f"👥 <b>Jami ishchilar:</b> {stats.get('total_users', 0)} ta\n"
+		f"📝 <b>Jami hisobotlar:</b> {stats.get('total_reports', 0)} ta\n"
+		f"✅ <b>Tasdiqlangan:</b> {stats.get('confirmed_reports', 0)} ta\n"
+		f"⏳ <b>Kutilayotgan:</b> {stats.get('pending_reports', 0)} ta\n"
+		f"📅 <b>Bugungi hisobotlar:</b> {stats.get('today_reports', 0)} ta\n"
+		f"📈 <b>Haftalik hisobotlar:</b> {week_reports} ta\n"
+		f"📊 <b>Oylik hisobotlar:</b> {month_reports} ta\n"
+		f"🎯 <b>Tasdiqlash foizi:</b> {stats.get('confirmation_rate', 0)}%\n\n"
+		f"🏙️ <b>TOSHKENT SHAHAR:</b>\n"
 		f"├ Toshkent hisobotlari: {stats.get('tashkent_reports', 0)} ta\n"
 		f"└ Boshqa hududlar: {stats.get('other_reports', 0)} ta"
 	)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_reports_stats_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_reports_stats_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _REPORTS_KB)
 	await callback_query.answer()
 
 # ============== ANALYTICS ==============
@@ -2158,95 +2183,71 @@ async def show_general_reports(callback_query: CallbackQuery, state: FSMContext)
 @admin_router.callback_query(F.data == "admin_analytics")
 async def show_analytics_menu(callback_query: CallbackQuery, state: FSMContext):
 	"""Analitika menyusini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	text = (
-		"📊 **ANALITIKA VA STATISTIKA**\n\n"
+		"📊 <b>ANALITIKA VA STATISTIKA</b>\n\n"
 		"Ko'rmoqchi bo'lgan statistika turini tanlang:"
 	)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_analytics_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_analytics_keyboard(), parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _ANALYTICS_KB)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "analytics_general")
 async def show_general_analytics(callback_query: CallbackQuery, state: FSMContext):
 	"""Umumiy analitikani ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	stats = await get_database_stats()
-	
-	today = date.today()
-	week_ago = today - timedelta(days=7)
-	month_ago = today - timedelta(days=30)
-	
-	week_reports = await get_reports_count_by_date(week_ago.isoformat(), today.isoformat())
-	month_reports = await get_reports_count_by_date(month_ago.isoformat(), today.isoformat())
-	
-	# Qo'shimcha statistikalar
-	all_users = await get_all_users()
-	active_users = 0
-	blocked_users = 0
-	
-	for user in all_users:
-		is_blocked = await check_user_blocked(user[1])
-		if is_blocked:
-			blocked_users += 1
-		else:
-			active_users += 1
+	today, week_ago, month_ago = report_windows()
+	stats, week_reports, month_reports, (active_users, blocked_users), groups, sheets = await asyncio.gather(
+		get_database_stats(today),
+		get_reports_count_by_date(week_ago, today),
+		get_reports_count_by_date(month_ago, today),
+		get_user_block_counts(),
+		get_all_telegram_groups_cached(),
+		get_all_google_sheets_cached()
+	)
 	
 	text = (
-		"📊 **UMUMIY ANALITIKA**\n\n"
-		"👥 **FOYDALANUVCHILAR:**\n"
+		"📊 <b>UMUMIY ANALITIKA</b>\n\n"
+		"👥 <b>FOYDALANUVCHILAR:</b>\n"
 		f"├ Jami: {stats.get('total_users', 0)} ta\n"
 		f"├ ✅ Faol: {active_users} ta\n"
 		f"└ 🔒 Bloklangan: {blocked_users} ta\n\n"
 		
-		"📝 **HISOBOTLAR:**\n"
+		"📝 <b>HISOBOTLAR:</b>\n"
 		f"├ Jami: {stats.get('total_reports', 0)} ta\n"
 		f"├ ✅ Tasdiqlangan: {stats.get('confirmed_reports', 0)} ta\n"
 		f"├ ⏳ Kutilayotgan: {stats.get('pending_reports', 0)} ta\n"
 		f"└ 🎯 Tasdiqlash foizi: {stats.get('confirmation_rate', 0)}%\n\n"
 		
-		"📅 **VAQT BO'YICHA:**\n"
+		"📅 <b>VAQT BO'YICHA:</b>\n"
 		f"├ Bugun: {stats.get('today_reports', 0)} ta\n"
 		f"├ Hafta: {week_reports} ta\n"
 		f"└ Oy: {month_reports} ta\n\n"
 		
-		"🏙️ **JOYLASHUV BO'YICHA:**\n"
+		"🏙️ <b>JOYLASHUV BO'YICHA:</b>\n"
 		f"├ Toshkent shahar: {stats.get('tashkent_reports', 0)} ta\n"
 		f"└ Boshqa hududlar: {stats.get('other_reports', 0)} ta\n\n"
 		
-		"🏢 **TIZIM:**\n"
-		f"├ Guruhlar: {len(await get_all_telegram_groups())} ta\n"
-		f"├ Google Sheets: {len(await get_all_google_sheets())} ta\n"
-		f"├ Adminlar: {len(get_all_admins())} ta\n"
-		f"└ Tasdiqlovchilar: {len(get_all_approvers())} ta"
+		"🏢 <b>TIZIM:</b>\n"
+		f"├ Guruhlar: {len(groups)} ta\n"
+		f"├ Google Sheets: {len(sheets)} ta\n"
+		f"├ Adminlar: {count_admins()} ta\n"
+		f"└ Tasdiqlovchilar: {count_approvers()} ta"
 	)
 	
-	await callback_query.message.answer(text, parse_mode=ParseMode.MARKDOWN)
+	await callback_query.message.answer(text, parse_mode=ParseMode.HTML)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "analytics_daily")
 async def show_daily_analytics(callback_query: CallbackQuery, state: FSMContext):
 	"""Kunlik analitikani ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
+	text = "📅 <b>KUNLIK ANALITIKA</b>\n\n"
 	
-	text = "📅 **KUNLIK ANALITIKA**\n\n"
+	# So'nggi 7 kunlik statistika - bitta so'rov bilan
+	today = date.today()
+	days = [today - timedelta(days=i) for i in range(7)]
+	counts = await get_daily_report_counts(days[-1].isoformat(), today.isoformat())
 	
-	# So'nggi 7 kunlik statistika
-	for i in range(7):
-		day = date.today() - timedelta(days=i)
-		day_reports = await get_reports_count_by_date(day.isoformat())
+	for i, day in enumerate(days):
+		day_reports = counts.get(day.isoformat(), 0)
 		day_name = day.strftime('%A')[:3]  # Qisqa kun nomi
 		
 		if i == 0:
@@ -2259,18 +2260,17 @@ async def show_daily_analytics(callback_query: CallbackQuery, state: FSMContext)
 		# Grafik ko'rinishi
 		bar = "█" * min(day_reports, 20)  # Maksimal 20 ta belgi
 		
-		text += f"**{day_label}:** {day_reports} ta\n"
+		text += f"<b>{day_label}:</b> {day_reports} ta\n"
 		text += f"{bar}\n\n"
 	
 	# Haftalik o'rtacha
-	week_total = sum(
-		[await get_reports_count_by_date((date.today() - timedelta(days=i)).isoformat()) for i in range(7)])
+	week_total = sum(counts.values())
 	week_average = round(week_total / 7, 1)
 	
-	text += f"📊 **Haftalik o'rtacha:** {week_average} ta/kun\n"
-	text += f"📈 **Haftalik jami:** {week_total} ta"
+	text += f"📊 <b>Haftalik o'rtacha:</b> {week_average} ta/kun\n"
+	text += f"📈 <b>Haftalik jami:</b> {week_total} ta"
 	
-	await callback_query.message.answer(text, parse_mode=ParseMode.MARKDOWN)
+	await callback_query.message.answer(text, parse_mode=ParseMode.HTML)
 	await callback_query.answer()
 
 # ============== SETTINGS ==============
@@ -2278,60 +2278,27 @@ async def show_daily_analytics(callback_query: CallbackQuery, state: FSMContext)
 @admin_router.callback_query(F.data == "admin_settings")
 async def show_settings_menu(callback_query: CallbackQuery, state: FSMContext):
 	"""Sozlamalar menyusini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	try:
-		await callback_query.message.edit_text(
-			"⚙️ **SOZLAMALAR**\n\nKerakli bo'limni tanlang:",
-			reply_markup=get_enhanced_settings_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
-		)
-	except TelegramBadRequest:
-		await callback_query.message.answer(
-			"⚙️ **SOZLAMALAR**\n\nKerakli bo'limni tanlang:",
-			reply_markup=get_enhanced_settings_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
-		)
+	await safe_edit_or_send(
+		callback_query,
+		"⚙️ <b>SOZLAMALAR</b>\n\nKerakli bo'limni tanlang:",
+		_SETTINGS_KB
+	)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "system_info")
 async def show_system_info(callback_query: CallbackQuery, state: FSMContext):
 	"""Tizim ma'lumotlarini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	text = format_system_info()
 	
-	keyboard = InlineKeyboardMarkup(inline_keyboard=[
-		[InlineKeyboardButton(text="🔙 Sozlamalar", callback_data="admin_settings")]
-	])
-	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=keyboard, parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=keyboard, parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _SETTINGS_BACK_KB)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "database_info")
 async def show_database_info(callback_query: CallbackQuery, state: FSMContext):
 	"""Ma'lumotlar bazasi ma'lumotlarini ko'rsatish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	text = await format_database_info()
 	
-	keyboard = InlineKeyboardMarkup(inline_keyboard=[
-		[InlineKeyboardButton(text="🔙 Sozlamalar", callback_data="admin_settings")]
-	])
-	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=keyboard, parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=keyboard, parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _SETTINGS_BACK_KB)
 	await callback_query.answer()
 
 # ============== NAVIGATION ==============
@@ -2339,60 +2306,27 @@ async def show_database_info(callback_query: CallbackQuery, state: FSMContext):
 @admin_router.callback_query(F.data == "admin_menu")
 async def back_to_admin_menu(callback_query: CallbackQuery, state: FSMContext):
 	"""Admin menyuga qaytish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	await state.clear()
 	
-	admin_type = "👑 Asosiy Admin" if callback_query.from_user.id == ADMIN_ID else "👨‍💻 Admin"
-	
-	try:
-		await callback_query.message.edit_text(
-			f"👨‍💻 **ADMIN PANEL v2.1**\n\n"
-			f"Salom, {admin_type}!\n"
-			f"🆔 ID: `{callback_query.from_user.id}`\n"
-			f"📅 Vaqt: {datetime.now().strftime('%d.%m.%Y %H:%M')}\n\n"
-			f"Kerakli bo'limni tanlang:",
-			reply_markup=get_enhanced_admin_menu_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
-		)
-	except TelegramBadRequest:
-		await callback_query.message.answer(
-			f"👨‍💻 **ADMIN PANEL v2.1**\n\n"
-			f"Salom, {admin_type}!\n"
-			f"🆔 ID: `{callback_query.from_user.id}`\n"
-			f"📅 Vaqt: {datetime.now().strftime('%d.%m.%Y %H:%M')}\n\n"
-			f"Kerakli bo'limni tanlang:",
-			reply_markup=get_enhanced_admin_menu_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
-		)
+	await safe_edit_or_send(
+		callback_query,
+		admin_panel_text(callback_query.from_user.id),
+		_ADMIN_MENU_KB
+	)
 	await callback_query.answer()
 
 @admin_router.callback_query(F.data == "admin_exit")
 async def exit_admin_panel(callback_query: CallbackQuery, state: FSMContext):
 	"""Admin paneldan chiqish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	await state.clear()
-	try:
-		await callback_query.message.edit_text(
-			"🏠 **ASOSIY MENYU**\n\nAdmin paneldan chiqildi",
-			reply_markup=None,
-			parse_mode=ParseMode.MARKDOWN
-		)
-	except TelegramBadRequest:
-		await callback_query.message.answer(
-			"🏠 **ASOSIY MENYU**\n\nAdmin paneldan chiqildi",
-			reply_markup=None,
-			parse_mode=ParseMode.MARKDOWN
-		)
+	await safe_edit_or_send(
+		callback_query,
+		"🏠 <b>ASOSIY MENYU</b>\n\nAdmin paneldan chiqildi"
+	)
 	
 	await callback_query.message.answer(
 		"Asosiy menyuga qaytdingiz.",
-		reply_markup=get_main_menu_reply_keyboard()
+		reply_markup=_MAIN_MENU_REPLY_KB
 	)
 	await callback_query.answer()
 
@@ -2400,22 +2334,14 @@ async def exit_admin_panel(callback_query: CallbackQuery, state: FSMContext):
 async def cancel_admin_action_handler(callback_query: CallbackQuery, state: FSMContext):
 	"""Admin amalini bekor qilish"""
 	await state.clear()
-	try:
-		await callback_query.message.edit_text(
-			"🚫 **BEKOR QILINDI**\n\nAdmin jarayoni bekor qilindi",
-			reply_markup=None,
-			parse_mode=ParseMode.MARKDOWN
-		)
-	except TelegramBadRequest:
-		await callback_query.message.answer(
-			"🚫 **BEKOR QILINDI**\n\nAdmin jarayoni bekor qilindi",
-			reply_markup=None,
-			parse_mode=ParseMode.MARKDOWN
-		)
+	await safe_edit_or_send(
+		callback_query,
+		"🚫 <b>BEKOR QILINDI</b>\n\nAdmin jarayoni bekor qilindi"
+	)
 	
 	await callback_query.message.answer(
 		"Admin panelga qaytish uchun /rava buyrug'ini yuboring.",
-		reply_markup=get_main_menu_reply_keyboard()
+		reply_markup=_MAIN_MENU_REPLY_KB
 	)
 	await callback_query.answer()
 
@@ -2424,162 +2350,184 @@ async def cancel_admin_action_handler(callback_query: CallbackQuery, state: FSMC
 @admin_router.callback_query(F.data == "admin_broadcast")
 async def start_broadcast(callback_query: CallbackQuery, state: FSMContext):
 	"""Barcha foydalanuvchilarga xabar yuborish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
 	await state.set_state(AdminStates.waiting_for_broadcast_message)
 	text = (
-		"📢 **BARCHA FOYDALANUVCHILARGA XABAR**\n\n"
+		"📢 <b>BARCHA FOYDALANUVCHILARGA XABAR</b>\n\n"
 		"Barcha foydalanuvchilarga yubormoqchi bo'lgan xabaringizni kiriting:\n\n"
-		"⚠️ **DIQQAT:**\n"
+		"⚠️ <b>DIQQAT:</b>\n"
 		"• Xabar barcha ro'yxatdan o'tgan foydalanuvchilarga yuboriladi\n"
 		"• Bloklangan foydalanuvchilarga ham yuboriladi\n"
 		"• Bu amal bekor qilib bo'lmaydi\n\n"
 		"💡 Xabaringizni ehtiyotkorlik bilan yozing"
 	)
 	
-	try:
-		await callback_query.message.edit_text(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                       parse_mode=ParseMode.MARKDOWN)
-	except TelegramBadRequest:
-		await callback_query.message.answer(text, reply_markup=get_admin_cancel_inline_keyboard(),
-		                                    parse_mode=ParseMode.MARKDOWN)
+	await safe_edit_or_send(callback_query, text, _CANCEL_KB)
 	await callback_query.answer()
 
 @admin_router.message(AdminStates.waiting_for_broadcast_message)
 async def process_broadcast_message(message: Message, state: FSMContext):
 	"""Broadcast xabarini qayta ishlash"""
-	if not is_admin(message.from_user.id):
-		await message.answer("🚫 Ruxsat yo'q.")
-		await state.clear()
-		return
-	
 	broadcast_message = message.text.strip() if message.text else ""
 	if not broadcast_message or len(broadcast_message) < 5:
 		await message.answer(
-			"⚠️ **XATO**\n\n"
+			"⚠️ <b>XATO</b>\n\n"
 			"Xabar kamida 5 belgi bo'lishi kerak.\n"
 			"Qaytadan kiriting:",
-			reply_markup=get_admin_cancel_inline_keyboard(),
-			parse_mode=ParseMode.MARKDOWN
+			reply_markup=_CANCEL_KB,
+			parse_mode=ParseMode.HTML
 		)
 		return
 	
-	await state.update_data(broadcast_message=broadcast_message)
+	# Faqat sonini olish - ro'yxatning o'zi yuborish paytida bo'laklab o'qiladi.
+	# Son tasdiqlashda qayta so'ralmasligi uchun saqlanadi
+	user_count = await get_total_users_count()
+	await start_flow(state, broadcast_message=broadcast_message, broadcast_user_count=user_count)
 	await state.set_state(AdminStates.waiting_for_broadcast_confirmation)
 	
-	# Foydalanuvchilar sonini olish
-	all_users = await get_all_users()
-	user_count = len(all_users)
-	
 	confirmation_text = (
-		f"📢 **XABAR TASDIQLASH**\n\n"
-		f"**Yuborilishi kerak bo'lgan xabar:**\n"
-		f"```\n{broadcast_message}\n```\n\n"
-		f"👥 **Qabul qiluvchilar:** {user_count} ta foydalanuvchi\n\n"
+		f"📢 <b>XABAR TASDIQLASH</b>\n\n"
+		f"<b>Yuborilishi kerak bo'lgan xabar:</b>\n"
+		f"<pre>{html.escape(broadcast_message)}</pre>\n\n"
+		f"👥 <b>Qabul qiluvchilar:</b> {user_count} ta foydalanuvchi\n\n"
 		f"❓ Xabarni yuborishni tasdiqlaysizmi?"
 	)
 	
-	keyboard = InlineKeyboardMarkup(inline_keyboard=[
-		[
-			InlineKeyboardButton(text="✅ Yuborish", callback_data="confirm_broadcast"),
-			InlineKeyboardButton(text="❌ Bekor qilish", callback_data="cancel_admin_action")
-		]
-	])
-	
-	await message.answer(confirmation_text, reply_markup=keyboard, parse_mode=ParseMode.MARKDOWN)
+	await message.answer(confirmation_text, reply_markup=_BROADCAST_CONFIRM_KB, parse_mode=ParseMode.HTML)
+
+# Bir vaqtda yuboriladigan xabarlar soni, DB'dan o'qiladigan bo'lak va sekundiga yuboriladigan to'lqin hajmi
+BROADCAST_CONCURRENCY = 25
+BROADCAST_CHUNK_SIZE = 500
+BROADCAST_WAVE_SIZE = 30  # Telegram: sekundiga 30 ta xabar
+BROADCAST_WAVE_PERIOD = 1.0
+BROADCAST_PROGRESS_INTERVAL = 2.0
+BROADCAST_ERRORS_LOGGED = 50  # Yakuniy logda ko'rsatiladigan xatoliklar soni
+
+# Barcha broadcastlar uchun umumiy; limitni set_limit() orqali qayta ishga tushirmasdan o'zgartirish mumkin
+broadcast_admission = SendAdmission(BROADCAST_CONCURRENCY)
 
 @admin_router.callback_query(F.data == "confirm_broadcast")
 async def confirm_broadcast(callback_query: CallbackQuery, state: FSMContext, bot: Bot):
 	"""Broadcast xabarini tasdiqlash va yuborish"""
-	if not is_admin(callback_query.from_user.id):
-		await callback_query.answer("🚫 Ruxsat yo'q.", show_alert=True)
-		return
-	
-	data = await state.get_data()
-	broadcast_message = data.get("broadcast_message")
+	flow = await get_flow_data(state)
+	broadcast_message = flow.broadcast_message
 	
 	if not broadcast_message:
 		await callback_query.answer("❌ Xabar topilmadi!", show_alert=True)
 		await state.clear()
 		return
 	
-	# Barcha foydalanuvchilarni olish
-	all_users = await get_all_users()
-	
-	await callback_query.message.edit_text(
-		f"📤 **XABAR YUBORILMOQDA...**\n\n"
-		f"Jami foydalanuvchilar: {len(all_users)} ta\n"
-		f"Yuborilgan: 0 ta\n"
-		f"Xatoliklar: 0 ta",
-		parse_mode=ParseMode.MARKDOWN
-	)
+	# Foydalanuvchilar xotiraga to'liq yuklanmaydi; son tasdiqlash bosqichidan olinadi
+	total_users = flow.broadcast_user_count
+	if total_users is None:
+		total_users = await get_total_users_count()
 	
 	sent_count = 0
 	error_count = 0
+	unreachable_count = 0  # Botni bloklagan yoki o'chirilgan akkauntlar (403)
+	errors: List[Tuple[int, str]] = []  # Har xato alohida loglanmaydi - oxirida bitta yozuv
+	done = asyncio.Event()
+	# Matn barcha foydalanuvchilar uchun bir xil - bir marta quriladi va ekranlanadi
+	outgoing_text = f"📢 <b>ADMIN XABARI</b>\n\n{html.escape(broadcast_message)}"
+	
+	def progress_text() -> str:
+		return (
+			f"📤 <b>XABAR YUBORILMOQDA...</b>\n\n"
+			f"Jami foydalanuvchilar: {total_users} ta\n"
+			f"Yuborilgan: {sent_count} ta\n"
+			f"Xatoliklar: {error_count} ta"
+		)
 	
-	# Har bir foydalanuvchiga xabar yuborish
-	for user in all_users:
-		user_id, telegram_id, full_name, reg_date, is_blocked, group_name = user
-		
-		try:
-			await bot.send_message(
-				chat_id=telegram_id,
-				text=f"📢 **ADMIN XABARI**\n\n{broadcast_message}",
-				parse_mode=ParseMode.MARKDOWN
-			)
-			sent_count += 1
-			
-			# Har 10 ta xabardan keyin progress yangilash
-			if sent_count % 10 == 0:
-				try:
-					await callback_query.message.edit_text(
-						f"📤 **XABAR YUBORILMOQDA...**\n\n"
-						f"Jami foydalanuvchilar: {len(all_users)} ta\n"
-						f"Yuborilgan: {sent_count} ta\n"
-						f"Xatoliklar: {error_count} ta",
-						parse_mode=ParseMode.MARKDOWN
-					)
-				except:
-					pass
-		
-		except Exception as e:
-			error_count += 1
-			logging.error(f"Broadcast error for user {telegram_id}: {e}")
+	await callback_query.message.edit_text(progress_text(), parse_mode=ParseMode.HTML)
+	
+	async def progress_loop() -> None:
+		# Progress xabarini yuborish tezligidan qat'i nazar, ko'pi bilan har 2 soniyada yangilash
+		last_text = progress_text()
+		while not done.is_set():
+			try:
+				await asyncio.wait_for(done.wait(), timeout=BROADCAST_PROGRESS_INTERVAL)
+			except TimeoutError:
+				pass
+			text = progress_text()
+			if done.is_set() or text == last_text:
+				continue
+			try:
+				await callback_query.message.edit_text(text, parse_mode=ParseMode.HTML)
+				last_text = text
+			except TelegramAPIError as e:
+				# Progress yangilanmasa ham broadcast davom etadi - xato vazifani to'xtatmaydi
+				logging.warning("Broadcast progress edit failed: %s", e)
+	
+	async def send_one(telegram_id: int) -> None:
+		async with broadcast_admission:
+			try:
+				await bot.send_message(
+					chat_id=telegram_id,
+					text=outgoing_text,
+					parse_mode=ParseMode.HTML
+				)
+			except TelegramRetryAfter as e:
+				# Sessiya middleware'i qayta urinishlarni tugatgan - oxirgi marta kutib yuborish
+				await asyncio.sleep(e.retry_after)
+				await bot.send_message(
+					chat_id=telegram_id,
+					text=outgoing_text,
+					parse_mode=ParseMode.HTML
+				)
 	
-	# Yakuniy natija
+	progress_task = asyncio.create_task(progress_loop())
+	
+	# DB'dan bo'laklab o'qib, sekundiga bitta to'lqin (30 ta) tezlikda parallel yuborish
+	try:
+		async for chunk in get_all_user_ids_stream(BROADCAST_CHUNK_SIZE):
+			for start in range(0, len(chunk), BROADCAST_WAVE_SIZE):
+				wave = chunk[start:start + BROADCAST_WAVE_SIZE]
+				wave_started = time.monotonic()
+				results = await asyncio.gather(*(send_one(telegram_id) for telegram_id in wave), return_exceptions=True)
+				for telegram_id, result in zip(wave, results):
+					if isinstance(result, TelegramForbiddenError):
+						# Doimiy xato - logga yozilmaydi, faqat sanaladi
+						error_count += 1
+						unreachable_count += 1
+					elif isinstance(result, Exception):
+						error_count += 1
+						errors.append((telegram_id, repr(result)))
+					else:
+						sent_count += 1
+				elapsed = time.monotonic() - wave_started
+				if elapsed < BROADCAST_WAVE_PERIOD:
+					await asyncio.sleep(BROADCAST_WAVE_PERIOD - elapsed)
+	finally:
+		# Xato bo'lsa ham progress vazifasi to'xtatiladi; uning o'z xatosi yakuniy natijani to'smaydi
+		done.set()
+		await asyncio.gather(progress_task, return_exceptions=True)
+	
+	if errors:
+		logging.error("Broadcast errors (%s): %s", len(errors), errors[:BROADCAST_ERRORS_LOGGED])
+	
+	# Yakuniy natija (yuborish davomida qo'shilganlar ham hisobga olinadi)
+	processed = sent_count + error_count
+	success_rate = round((sent_count / processed) * 100, 1) if processed else 0.0
 	final_text = (
-		f"✅ **XABAR YUBORISH YAKUNLANDI**\n\n"
-		f"📊 **NATIJALAR:**\n"
-		f"├ Jami foydalanuvchilar: {len(all_users)} ta\n"
+		f"✅ <b>XABAR YUBORISH YAKUNLANDI</b>\n\n"
+		f"📊 <b>NATIJALAR:</b>\n"
+		f"├ Jami foydalanuvchilar: {processed} ta\n"
 		f"├ ✅ Muvaffaqiyatli yuborilgan: {sent_count} ta\n"
 		f"├ ❌ Xatoliklar: {error_count} ta\n"
-		f"└ 📈 Muvaffaqiyat foizi: {round((sent_count / len(all_users)) * 100, 1)}%\n\n"
-		f"📅 **Yuborilgan vaqt:** {datetime.now().strftime('%d.%m.%Y %H:%M')}"
+		f"├ 🚫 Botni bloklaganlar: {unreachable_count} ta\n"
+		f"└ 📈 Muvaffaqiyat foizi: {success_rate}%\n\n"
+		f"📅 <b>Yuborilgan vaqt:</b> {minute_stamp()}"
 	)
 	
-	await callback_query.message.edit_text(final_text, parse_mode=ParseMode.MARKDOWN)
+	await callback_query.message.edit_text(final_text, parse_mode=ParseMode.HTML)
 	await state.clear()
 	await callback_query.answer()
 	
-	logging.info(f"Broadcast completed by admin {callback_query.from_user.id}: {sent_count}/{len(all_users)} sent")
-
-# ============== LOGGING ==============
+	logging.info("Broadcast completed by admin %s: %s/%s sent", callback_query.from_user.id, sent_count, processed)
 
-logging.basicConfig(
-	level=logging.INFO,
-	format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
-logging.info("Enhanced Admin router v2.1 initialized successfully")
-logging.info(f"Main admin ID: {ADMIN_ID}")
-logging.info(f"Helper ID: {HELPER_ID}")
-logging.info(f"Additional admins: {len(ADDITIONAL_ADMINS)}")
-logging.info(f"Additional approvers: {len(APPROVERS)}")
-logging.info("✅ Tasdiqlovchilar tizimi qo'shildi va to'liq ishga tayyor")
-logging.info("📄 Sahifalash tizimi qo'shildi")
-logging.info("🔧 To'liq admin panel funksiyalari")
-logging.info("📢 Broadcast messaging qo'shildi")
-logging.info("🏙️ Toshkent shahar funksiyasi qo'llab-quvvatlanadi")
-logging.info("🎯 Admin paneldan qo'shilgan tasdiqlovchilar hisobotlarni tasdiqlash imkoniyatiga ega")
+@admin_router.startup()
+async def log_admin_startup():
+	"""Ishga tushishda admin router holatini loglash (import paytida emas)"""
+	logging.info(
+		"Admin router ready: main admin %s, helper %s, %s additional admins, %s approvers",
+		ADMIN_ID, HELPER_ID, len(ADDITIONAL_ADMINS), len(APPROVERS)
+	)
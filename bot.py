@@ -1,6 +1,12 @@
 import asyncio
 import logging
+import re
+import ssl
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import certifi
+from aiohttp import ClientSession, TCPConnector
 
 from aiogram import Bot, Dispatcher, F, Router
 from aiogram.enums import ParseMode
@@ -9,16 +15,18 @@ from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import Message, CallbackQuery
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 
 from config import BOT_TOKEN, ADMIN_PASSWORD, HELPER_ID
 from database import (
     init_db, add_user_to_db, check_user_exists, get_todays_sales_by_user,
-    check_full_name_exists, get_all_telegram_groups, check_user_blocked,
-    get_current_password
+    check_full_name_exists, get_all_telegram_groups_cached, check_user_blocked,
+    check_password, get_user_status
 )
 from otchot import otchot_router
 from admin import admin_router
 from additional import additional_router
+from rate_limiter import RateLimitMiddleware
 from keyboards import (
     get_main_menu_reply_keyboard, get_developer_contact_inline_keyboard,
     get_group_selection_keyboard
@@ -31,22 +39,22 @@ class RegistrationStates(StatesGroup):
     waiting_for_full_name = State()
     waiting_for_group_selection = State()
 
-# ==================== LOGGING ====================
-
-logging.basicConfig(level=logging.INFO, stream=sys.stdout, format='%(asctime)s - %(levelname)s - %(message)s')
-
 # ==================== MAIN ROUTER ====================
 
 main_router = Router()
 
+# Ro'yxatdan o'tishdagi guruhlar ro'yxati - har qanday o'zgarishda kesh baribir tozalanadi
+REGISTRATION_GROUPS_TTL = 60
+
 # ==================== HELPER FUNCTIONS ====================
 
+_FIRST_WORD = re.compile(r"\S+")
+
 def extract_first_name(full_text: str) -> str:
     """To'liq matndan faqat birinchi ismni ajratib olish"""
-    words = full_text.strip().split()
-    if words:
-        return words[0]
-    return full_text.strip()
+    # split() butun so'zlar ro'yxatini quradi - bizga faqat birinchisi kerak
+    match = _FIRST_WORD.search(full_text)
+    return match.group() if match else full_text.strip()
 
 # ==================== HANDLERS ====================
 
@@ -56,14 +64,15 @@ async def handle_start(message: Message, state: FSMContext):
     await state.clear()
     user_id = message.from_user.id
     
-    if await check_user_blocked(user_id):
+    exists, blocked = await get_user_status(user_id)
+    if blocked:
         await message.answer(
             "Sizning hisobingiz vaqtincha bloklangan.\n"
             "Qo'shimcha ma'lumot uchun admin bilan bog'laning."
         )
         return
     
-    if await check_user_exists(user_id):
+    if exists:
         await message.answer(
             f"Assalomu alaykum, {message.from_user.full_name}!\n"
             f"Xush kelibsiz! Kerakli bo'limni tanlang:",
@@ -80,9 +89,7 @@ async def handle_start(message: Message, state: FSMContext):
 @main_router.message(RegistrationStates.waiting_for_password)
 async def handle_password(message: Message, state: FSMContext):
     """Parolni tekshirish"""
-    current_password = await get_current_password()
-    
-    if message.text == current_password:
+    if await check_password(message.text):
         user_id = message.from_user.id
         if await check_user_exists(user_id):
             await state.clear()
@@ -136,7 +143,7 @@ async def handle_full_name(message: Message, state: FSMContext):
     
     await state.update_data(full_name=first_name)
     
-    groups = await get_all_telegram_groups()
+    groups = await get_all_telegram_groups_cached(REGISTRATION_GROUPS_TTL)
     if not groups:
         await message.answer(
             "Hozircha hech qanday guruh sozlanmagan.\n"
@@ -231,18 +238,59 @@ async def handle_my_sales(message: Message):
         await message.answer("Siz bugun hali hech qanday sotuv qayd etmabsiz.")
         return
     
-    response_text = f"Sizning bugungi sotuvlaringiz ({len(sales_today)} ta):\n\n"
-    for i, sale in enumerate(sales_today):
-        contract_id, product_type = sale
-        response_text += f"{i + 1}. Shartnoma ID: <code>{contract_id}</code>, Mahsulot: {product_type}\n"
+    response_text = f"Sizning bugungi sotuvlaringiz ({len(sales_today)} ta):\n\n" + "".join(
+        f"{i}. Shartnoma ID: <code>{contract_id}</code>, Mahsulot: {product_type}\n"
+        for i, (contract_id, product_type) in enumerate(sales_today, 1)
+    )
     
     await message.answer(response_text, parse_mode=ParseMode.HTML)
 
 
+# ==================== HTTP SESSION ====================
+
+class KeepAliveSession(AiohttpSession):
+    """Telegram API ulanishlarini broadcastlar orasida ham ochiq ushlab turuvchi sessiya"""
+    
+    def __init__(self, keepalive_timeout: float = 75, limit: int = 100, **kwargs):
+        super().__init__(limit=limit, **kwargs)
+        # aiohttp standarti 15 soniya - undan keyin har bir yangi so'rov TLS handshake qiladi
+        self.keepalive_timeout = keepalive_timeout
+        self.limit = limit
+        self._client: ClientSession | None = None
+    
+    async def create_session(self) -> ClientSession:
+        # Ulagich shu yerda quriladi - aiogram'ning ichki sozlamalariga tayanmaymiz
+        if self._client is None or self._client.closed:
+            self._client = ClientSession(
+                connector=TCPConnector(
+                    ssl=ssl.create_default_context(cafile=certifi.where()),
+                    limit=self.limit,
+                    ttl_dns_cache=3600,
+                    keepalive_timeout=self.keepalive_timeout
+                )
+            )
+        return self._client
+    
+    async def close(self) -> None:
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+        await super().close()
+
+
 # ==================== MAIN FUNCTION ====================
 
 async def main():
     """Asosiy funksiya"""
+    # Logging faqat shu yerda sozlanadi - modullar import paytida root loggerga tegmaydi
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler('bot.log', encoding='utf-8')
+        ]
+    )
+    
     if not BOT_TOKEN or BOT_TOKEN == "YOUR_BOT_TOKEN_HERE":
         logging.error("BOT_TOKEN topilmadi yoki o'rnatilmagan. Iltimos, config.py faylini to'g'rilang.")
         return
@@ -251,9 +299,22 @@ async def main():
             "OGOHLANTIRISH: HELPER_ID config.py da o'rnatilmagan (0). Faqat ADMIN_ID hisobotlarni tasdiqlay oladi."
         )
     
-    init_db()
+    # Google Sheets (gspread) chaqiruvlari asyncio.to_thread orqali shu pulda bajariladi
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=16))
     
-    bot = Bot(token=BOT_TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+    await asyncio.to_thread(init_db)
+    
+    bot = Bot(
+        token=BOT_TOKEN,
+        session=KeepAliveSession(limit=100),
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML)
+    )
+    # Telegram limitlariga oldindan moslashish (RetryAfter to'xtalishlarining oldini olish)
+    bot.session.middleware(RateLimitMiddleware(
+        overall_max_rate=30, overall_time_period=1,
+        group_max_rate=20, group_time_period=60,
+        max_retries=3
+    ))
     dp = Dispatcher()
     
     # Routerlarni qo'shish
@@ -264,7 +325,8 @@ async def main():
     
     logging.info("Bot ishga tushmoqda...")
     try:
-        await dp.start_polling(bot)
+        # Faqat handlerlar ishlatadigan update turlarini olish - qolganlari parse qilinmaydi
+        await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
     except Exception as e:
         logging.error(f"Bot ishlayotganda xatolik: {e}")
     finally:
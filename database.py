@@ -1,9 +1,68 @@
+import asyncio
+import hmac
+import queue
 import sqlite3
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, date
+from typing import Any, AsyncIterator
 
 DB_NAME = 'bot_data.db'
 
+# Ishchilar sahifalari keshi: (page, per_page) -> (users, total_pages, total_count)
+_users_page_cache: dict[tuple[int, int], tuple] = {}
+
+# Bloklanganlik holati keshi: telegram_id -> (vaqt, holat). Har xabarda DB'ga murojaat qilmaslik uchun
+BLOCKED_CACHE_TTL = 30
+BLOCKED_CACHE_MAX = 4096
+_blocked_cache: dict[int, tuple[float, bool]] = {}
+
+def _invalidate_users_cache():
+	_users_page_cache.clear()
+	_blocked_cache.clear()
+
+# Guruhlar/sheetlar ro'yxati uchun qisqa muddatli kesh: nom -> (vaqt, natija)
+LIST_CACHE_TTL = 5
+_ttl_cache: dict[str, tuple[float, Any]] = {}
+
+def _invalidate_list_cache(*keys: str):
+	for key in keys:
+		_ttl_cache.pop(key, None)
+
+# Bitta sheet yozuvi keshi: sheet_id -> (vaqt, yozuv)
+SHEET_CACHE_TTL = 30
+SHEET_CACHE_MAX = 256
+_sheet_cache: dict[int, tuple[float, tuple]] = {}
+
+# Joriy parol faqat update_password orqali o'zgaradi - birinchi o'qishdan keyin xotirada
+_password_cache: str | None = None
+
+# Statistika so'rovlari uchun ulanishlar havzasi: so'rovlar ishchi oqimlarda parallel bajariladi
+READ_POOL_SIZE = 8
+_read_pool: queue.LifoQueue = queue.LifoQueue()
+_read_pool_slots = threading.BoundedSemaphore(READ_POOL_SIZE)
+
+@contextmanager
+def _pooled_connection():
+	with _read_pool_slots:
+		try:
+			conn = _read_pool.get_nowait()
+		except queue.Empty:
+			conn = sqlite3.connect(DB_NAME, check_same_thread=False)
+		try:
+			yield conn
+		finally:
+			_read_pool.put(conn)
+
+def _read_all(query: str, params: tuple = ()) -> list:
+	with _pooled_connection() as conn:
+		return conn.execute(query, params).fetchall()
+
+async def _read(query: str, params: tuple = ()) -> list:
+	return await asyncio.to_thread(_read_all, query, params)
+
 def init_db():
 	conn = sqlite3.connect(DB_NAME)
 	cursor = conn.cursor()
@@ -133,6 +192,7 @@ async def add_user_to_db(telegram_id: int, full_name: str, assigned_group_id: in
 			(telegram_id, full_name, assigned_group_id)
 		)
 		conn.commit()
+		_invalidate_users_cache()
 		logging.info(f"User {telegram_id} added to database with group {assigned_group_id}.")
 	except sqlite3.IntegrityError:
 		logging.warning(f"User {telegram_id} already exists in database.")
@@ -147,18 +207,36 @@ async def check_user_exists(telegram_id: int) -> bool:
 	conn.close()
 	return result is not None
 
-async def check_user_blocked(telegram_id: int) -> bool:
+def _load_user_status(telegram_id: int) -> tuple[bool, bool]:
+	# (mavjud, bloklangan) ni DB'dan o'qib, bloklanganlik keshini to'ldirish - ikkala chaqiruvchi uchun yagona yo'l
 	conn = sqlite3.connect(DB_NAME)
-	cursor = conn.cursor()
 	try:
-		cursor.execute("SELECT is_blocked FROM users WHERE telegram_id = ?", (telegram_id,))
-		result = cursor.fetchone()
-		return bool(result[0]) if result else False
+		result = conn.execute("SELECT is_blocked FROM users WHERE telegram_id = ?", (telegram_id,)).fetchone()
+	finally:
+		conn.close()
+	blocked = bool(result[0]) if result else False
+	if len(_blocked_cache) >= BLOCKED_CACHE_MAX:
+		_blocked_cache.clear()
+	_blocked_cache[telegram_id] = (time.monotonic(), blocked)
+	return result is not None, blocked
+
+async def check_user_blocked(telegram_id: int) -> bool:
+	cached = _blocked_cache.get(telegram_id)
+	if cached and time.monotonic() - cached[0] < BLOCKED_CACHE_TTL:
+		return cached[1]
+	try:
+		return _load_user_status(telegram_id)[1]
 	except Exception as e:
 		logging.error(f"Error checking user blocked status: {e}")
 		return False
-	finally:
-		conn.close()
+
+async def get_user_status(telegram_id: int) -> tuple[bool, bool]:
+	# (mavjud, bloklangan) - check_user_exists va check_user_blocked o'rniga bitta so'rov
+	try:
+		return _load_user_status(telegram_id)
+	except Exception as e:
+		logging.error(f"Error getting user status: {e}")
+		return False, False
 
 async def get_user_assigned_group(telegram_id: int) -> tuple | None:
 	conn = sqlite3.connect(DB_NAME)
@@ -186,6 +264,7 @@ async def block_user(telegram_id: int) -> bool:
 		updated = cursor.rowcount > 0
 		conn.commit()
 		if updated:
+			_invalidate_users_cache()
 			logging.info(f"User {telegram_id} blocked successfully.")
 		return updated
 	except Exception as e:
@@ -203,6 +282,7 @@ async def unblock_user(telegram_id: int) -> bool:
 		updated = cursor.rowcount > 0
 		conn.commit()
 		if updated:
+			_invalidate_users_cache()
 			logging.info(f"User {telegram_id} unblocked successfully.")
 		return updated
 	except Exception as e:
@@ -213,6 +293,10 @@ async def unblock_user(telegram_id: int) -> bool:
 		conn.close()
 
 async def get_users_paginated(page: int = 1, per_page: int = 10) -> tuple:
+	cached = _users_page_cache.get((page, per_page))
+	if cached is not None:
+		return cached
+	
 	conn = sqlite3.connect(DB_NAME)
 	cursor = conn.cursor()
 	try:
@@ -232,7 +316,9 @@ async def get_users_paginated(page: int = 1, per_page: int = 10) -> tuple:
 		users = cursor.fetchall()
 		
 		total_pages = (total_count + per_page - 1) // per_page
-		return users, total_pages, total_count
+		result = (users, total_pages, total_count)
+		_users_page_cache[(page, per_page)] = result
+		return result
 	except Exception as e:
 		logging.error(f"Error fetching paginated users: {e}")
 		return [], 0, 0
@@ -358,6 +444,25 @@ async def get_all_users() -> list:
 	finally:
 		conn.close()
 
+async def get_all_user_ids_stream(chunk_size: int = 500) -> AsyncIterator[list[int]]:
+	# Faqat telegram_id - UNIQUE indeksning o'zidan o'qiladi, OFFSET o'rniga oxirgi qiymatdan davom etiladi
+	last_id = 0
+	while True:
+		try:
+			rows = await _read(
+				"SELECT telegram_id FROM users WHERE telegram_id > ? ORDER BY telegram_id LIMIT ?",
+				(last_id, chunk_size))
+		except Exception as e:
+			logging.error(f"Error streaming user ids: {e}")
+			return
+		if not rows:
+			return
+		ids = [row[0] for row in rows]
+		yield ids
+		if len(ids) < chunk_size:
+			return
+		last_id = ids[-1]
+
 async def delete_user_from_db(telegram_id: int) -> bool:
 	conn = sqlite3.connect(DB_NAME)
 	cursor = conn.cursor()
@@ -370,6 +475,7 @@ async def delete_user_from_db(telegram_id: int) -> bool:
 		user_deleted = cursor.rowcount > 0
 		conn.commit()
 		if user_deleted:
+			_invalidate_users_cache()
 			logging.info(f"User {telegram_id} deleted from database.")
 		return user_deleted
 	except Exception as e:
@@ -419,6 +525,7 @@ async def add_telegram_group(group_id: int, group_name: str, message_thread_id:
 			(group_id, group_name, message_thread_id, google_sheet_id)
 		)
 		conn.commit()
+		_invalidate_list_cache("groups")
 		logging.info(
 			f"Group {group_name} ({group_id}) with topic {message_thread_id} and sheet {google_sheet_id} added to database.")
 		return True
@@ -450,6 +557,17 @@ async def get_all_telegram_groups() -> list:
 	finally:
 		conn.close()
 
+async def get_all_telegram_groups_cached(ttl: float = LIST_CACHE_TTL) -> list:
+	now = time.monotonic()
+	cached = _ttl_cache.get("groups")
+	if cached and now - cached[0] < ttl:
+		return cached[1]
+	groups = await get_all_telegram_groups()
+	# Xatoda [] qaytadi - bo'sh natija keshlanmaydi
+	if groups:
+		_ttl_cache["groups"] = (now, groups)
+	return groups
+
 async def get_telegram_group_by_id(group_id: int) -> tuple | None:
 	conn = sqlite3.connect(DB_NAME)
 	cursor = conn.cursor()
@@ -478,6 +596,8 @@ async def delete_telegram_group(group_id: int) -> bool:
 		deleted = cursor.rowcount > 0
 		conn.commit()
 		if deleted:
+			_invalidate_users_cache()
+			_invalidate_list_cache("groups")
 			logging.info(f"Group {group_id} deleted from database.")
 		return deleted
 	except Exception as e:
@@ -496,6 +616,7 @@ async def add_google_sheet(sheet_name: str, spreadsheet_id: str, worksheet_name:
 			(sheet_name, spreadsheet_id, worksheet_name)
 		)
 		conn.commit()
+		_invalidate_list_cache("sheets")
 		logging.info(f"Google Sheet added: {sheet_name} - ID={spreadsheet_id}, Worksheet={worksheet_name}")
 		return True
 	except sqlite3.IntegrityError:
@@ -522,7 +643,21 @@ async def get_all_google_sheets() -> list:
 	finally:
 		conn.close()
 
+async def get_all_google_sheets_cached() -> list:
+	now = time.monotonic()
+	cached = _ttl_cache.get("sheets")
+	if cached and now - cached[0] < LIST_CACHE_TTL:
+		return cached[1]
+	sheets = await get_all_google_sheets()
+	if sheets:
+		_ttl_cache["sheets"] = (now, sheets)
+	return sheets
+
 async def get_google_sheet_by_id(sheet_id: int) -> tuple | None:
+	now = time.monotonic()
+	cached = _sheet_cache.get(sheet_id)
+	if cached and now - cached[0] < SHEET_CACHE_TTL:
+		return cached[1]
 	conn = sqlite3.connect(DB_NAME)
 	cursor = conn.cursor()
 	try:
@@ -530,6 +665,10 @@ async def get_google_sheet_by_id(sheet_id: int) -> tuple | None:
 			"SELECT id, sheet_name, spreadsheet_id, worksheet_name, is_active FROM google_sheets WHERE id = ?",
 			(sheet_id,))
 		result = cursor.fetchone()
+		if result:
+			if len(_sheet_cache) >= SHEET_CACHE_MAX:
+				_sheet_cache.clear()
+			_sheet_cache[sheet_id] = (now, result)
 		return result
 	except Exception as e:
 		logging.error(f"Error fetching Google Sheet by id {sheet_id}: {e}")
@@ -545,7 +684,10 @@ async def delete_google_sheet(sheet_id: int) -> bool:
 		cursor.execute("UPDATE google_sheets SET is_active = 0 WHERE id = ?", (sheet_id,))
 		updated = cursor.rowcount > 0
 		conn.commit()
+		_sheet_cache.pop(sheet_id, None)
 		if updated:
+			# Guruhlar ro'yxati sheet nomini ham ko'rsatadi
+			_invalidate_list_cache("sheets", "groups")
 			logging.info(f"Google Sheet {sheet_id} deactivated.")
 		return updated
 	except Exception as e:
@@ -614,75 +756,71 @@ async def get_reports_by_status(status: str) -> list:
 		conn.close()
 
 async def get_reports_count_by_date(start_date: str, end_date: str = None) -> int:
-	conn = sqlite3.connect(DB_NAME)
-	cursor = conn.cursor()
 	try:
 		if end_date:
-			cursor.execute("""
+			rows = await _read("""
                 SELECT COUNT(*) FROM sales_reports
                 WHERE submission_date BETWEEN ? AND ?
             """, (start_date, end_date))
 		else:
-			cursor.execute("SELECT COUNT(*) FROM sales_reports WHERE submission_date = ?", (start_date,))
-		result = cursor.fetchone()
-		return result[0] if result else 0
+			rows = await _read("SELECT COUNT(*) FROM sales_reports WHERE submission_date = ?", (start_date,))
+		return rows[0][0] if rows else 0
 	except Exception as e:
 		logging.error(f"Error getting reports count by date: {e}")
 		return 0
-	finally:
-		conn.close()
+
+async def get_daily_report_counts(start_date: str, end_date: str) -> dict[str, int]:
+	try:
+		rows = await _read("""
+                SELECT submission_date, COUNT(*) FROM sales_reports
+                WHERE submission_date BETWEEN ? AND ?
+                GROUP BY submission_date
+            """, (start_date, end_date))
+		return dict(rows)
+	except Exception as e:
+		logging.error(f"Error getting daily report counts: {e}")
+		return {}
 
 async def get_total_users_count() -> int:
-	conn = sqlite3.connect(DB_NAME)
-	cursor = conn.cursor()
 	try:
-		cursor.execute("SELECT COUNT(*) FROM users")
-		result = cursor.fetchone()
-		return result[0] if result else 0
+		rows = await _read("SELECT COUNT(*) FROM users")
+		return rows[0][0] if rows else 0
 	except Exception as e:
 		logging.error(f"Error getting total users count: {e}")
 		return 0
-	finally:
-		conn.close()
+
+async def get_user_block_counts() -> tuple:
+	try:
+		rows = await _read("SELECT COUNT(*), COALESCE(SUM(is_blocked != 0), 0) FROM users")
+		total, blocked = rows[0]
+		return total - blocked, blocked
+	except Exception as e:
+		logging.error(f"Error getting user block counts: {e}")
+		return 0, 0
 
 async def get_total_reports_count() -> int:
-	conn = sqlite3.connect(DB_NAME)
-	cursor = conn.cursor()
 	try:
-		cursor.execute("SELECT COUNT(*) FROM sales_reports")
-		result = cursor.fetchone()
-		return result[0] if result else 0
+		rows = await _read("SELECT COUNT(*) FROM sales_reports")
+		return rows[0][0] if rows else 0
 	except Exception as e:
 		logging.error(f"Error getting total reports count: {e}")
 		return 0
-	finally:
-		conn.close()
 
 async def get_confirmed_reports_count() -> int:
-	conn = sqlite3.connect(DB_NAME)
-	cursor = conn.cursor()
 	try:
-		cursor.execute("SELECT COUNT(*) FROM sales_reports WHERE status = 'confirmed'")
-		result = cursor.fetchone()
-		return result[0] if result else 0
+		rows = await _read("SELECT COUNT(*) FROM sales_reports WHERE status = 'confirmed'")
+		return rows[0][0] if rows else 0
 	except Exception as e:
 		logging.error(f"Error getting confirmed reports count: {e}")
 		return 0
-	finally:
-		conn.close()
 
 async def get_pending_reports_count() -> int:
-	conn = sqlite3.connect(DB_NAME)
-	cursor = conn.cursor()
 	try:
-		cursor.execute("SELECT COUNT(*) FROM sales_reports WHERE status = 'pending'")
-		result = cursor.fetchone()
-		return result[0] if result else 0
+		rows = await _read("SELECT COUNT(*) FROM sales_reports WHERE status = 'pending'")
+		return rows[0][0] if rows else 0
 	except Exception as e:
 		logging.error(f"Error getting pending reports count: {e}")
 		return 0
-	finally:
-		conn.close()
 
 async def update_user_name(telegram_id: int, new_name: str) -> bool:
 	conn = sqlite3.connect(DB_NAME)
@@ -692,6 +830,7 @@ async def update_user_name(telegram_id: int, new_name: str) -> bool:
 		updated = cursor.rowcount > 0
 		conn.commit()
 		if updated:
+			_invalidate_users_cache()
 			logging.info(f"User {telegram_id} name updated to {new_name}.")
 		return updated
 	except Exception as e:
@@ -709,6 +848,7 @@ async def update_user_group(telegram_id: int, group_id: int) -> bool:
 		updated = cursor.rowcount > 0
 		conn.commit()
 		if updated:
+			_invalidate_users_cache()
 			logging.info(f"User {telegram_id} group updated to {group_id}.")
 		return updated
 	except Exception as e:
@@ -718,14 +858,15 @@ async def update_user_group(telegram_id: int, group_id: int) -> bool:
 	finally:
 		conn.close()
 
-async def get_database_stats() -> dict:
+async def get_database_stats(today: str | None = None) -> dict:
 	try:
-		total_users = await get_total_users_count()
-		total_reports = await get_total_reports_count()
-		confirmed_reports = await get_confirmed_reports_count()
-		pending_reports = await get_pending_reports_count()
-		
-		today_reports = await get_reports_count_by_date(date.today().isoformat())
+		total_users, total_reports, confirmed_reports, pending_reports, today_reports = await asyncio.gather(
+			get_total_users_count(),
+			get_total_reports_count(),
+			get_confirmed_reports_count(),
+			get_pending_reports_count(),
+			get_reports_count_by_date(today or date.today().isoformat())
+		)
 		
 		stats = {
 			'total_users': total_users,
@@ -742,19 +883,28 @@ async def get_database_stats() -> dict:
 		return {}
 
 async def get_current_password() -> str:
+	global _password_cache
+	if _password_cache is not None:
+		return _password_cache
 	conn = sqlite3.connect(DB_NAME)
 	cursor = conn.cursor()
 	try:
 		cursor.execute("SELECT setting_value FROM bot_settings WHERE setting_key = 'admin_password'")
 		result = cursor.fetchone()
-		return result[0] if result else "2025"
+		_password_cache = result[0] if result else "2025"
+		return _password_cache
 	except Exception as e:
 		logging.error(f"Error getting current password: {e}")
 		return "2025"
 	finally:
 		conn.close()
 
+async def check_password(candidate: str | None) -> bool:
+	current = await get_current_password()
+	return hmac.compare_digest((candidate or "").encode(), current.encode())
+
 async def update_password(new_password: str) -> bool:
+	global _password_cache
 	conn = sqlite3.connect(DB_NAME)
 	cursor = conn.cursor()
 	try:
@@ -763,6 +913,7 @@ async def update_password(new_password: str) -> bool:
             VALUES ('admin_password', ?, ?)
         """, (new_password, datetime.now()))
 		conn.commit()
+		_password_cache = new_password
 		logging.info("Admin password updated successfully.")
 		return True
 	except Exception as e:
@@ -798,6 +949,7 @@ async def update_group_google_sheet(group_id: int, google_sheet_id: int) -> bool
 		updated = cursor.rowcount > 0
 		conn.commit()
 		if updated:
+			_invalidate_list_cache("groups")
 			logging.info(f"Group {group_id} Google Sheet updated to {google_sheet_id}.")
 		return updated
 	except Exception as e:
@@ -485,10 +485,24 @@ def clear_test_data(spreadsheet_id: str, worksheet_name: str) -> bool:
 				if is_test_row:
 					rows_to_delete.append(row_idx)
 		
-		for row_idx in reversed(rows_to_delete):
-			worksheet.delete_rows(row_idx)
-		
 		if rows_to_delete:
+			# Barcha o'chirishlar bitta so'rovda (pastdan yuqoriga, indekslar siljimasligi uchun)
+			worksheet.spreadsheet.batch_update({
+				"requests": [
+					{
+						"deleteDimension": {
+							"range": {
+								"sheetId": worksheet.id,
+								"dimension": "ROWS",
+								"startIndex": row_idx - 1,
+								"endIndex": row_idx
+							}
+						}
+					}
+					for row_idx in reversed(rows_to_delete)
+				]
+			})
+			# Qatorlar soni o'chirishdan keyin qayta o'qiladi - oraliqda qo'shilgan hisobot ham raqamlanadi
 			renumber_rows(worksheet)
 		
 		logging.info(f"🧹 {len(rows_to_delete)} ta test ma'lumoti tozalandi")
@@ -500,17 +514,18 @@ def clear_test_data(spreadsheet_id: str, worksheet_name: str) -> bool:
 
 def renumber_rows(worksheet):
 	try:
-		all_values = worksheet.get_all_values()
+		data_rows = len(worksheet.get_all_values()) - 1
 		
-		if len(all_values) <= 1:
+		if data_rows <= 0:
 			return
 		
-		for i in range(1, len(all_values)):
-			new_number = i
-			cell_address = f"A{i + 1}"
-			worksheet.update(cell_address, str(new_number))
+		# Butun "№" ustuni bitta so'rovda yoziladi
+		worksheet.update(
+			range_name=f"A2:A{data_rows + 1}",
+			values=[[str(i)] for i in range(1, data_rows + 1)]
+		)
 		
-		logging.info(f"🔢 {len(all_values) - 1} ta qatordagi raqamlar yangilandi")
+		logging.info(f"🔢 {data_rows} ta qatordagi raqamlar yangilandi")
 	
 	except Exception as e:
 		logging.error(f"❌ Qator raqamlarini yangilashda xato: {e}")
@@ -570,17 +585,3 @@ def handle_sheets_errors(func):
 	
 	
 	return wrapper
-
-logging.basicConfig(
-	level=logging.INFO,
-	format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-	handlers=[
-		logging.StreamHandler(),
-		logging.FileHandler('google_sheets.log', encoding='utf-8')
-	]
-)
-
-logging.info("🚀 Google Sheets Integration moduli muvaffaqiyatli yuklandi")
-logging.info("📊 Ma'lumotlar saqlash tartibi: Birinchi hisobot #1 (eng tepada), keyingisi #2 (pastda)")
-logging.info(
-	"📋 Ustunlar: № | Mijoz | Telefon | Mahsulot | Jo'natma | Manzil | Sana | Hisobot | Yuborilgan | Shartnoma | Summa | Sotuvchi")
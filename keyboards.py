@@ -1,6 +1,13 @@
+import functools
+
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton, ReplyKeyboardMarkup, KeyboardButton
 from config import DEVELOPER_USERNAME, DEVELOPER_USER_ID
 
+# DIQQAT: argumentsiz getterlar functools.cache bilan bitta umumiy obyektni qaytaradi.
+# aiogram klaviaturalari o'zgaruvchan (MutableTelegramObject) - qaytarilgan markup'ni
+# (.inline_keyboard / .keyboard) hech qachon o'zgartirmang, aks holda barcha foydalanuvchilarda buziladi
+
+@functools.cache
 def get_main_menu_reply_keyboard() -> ReplyKeyboardMarkup:
 	kb = [
 		[KeyboardButton(text="📝 Hisobot topshirish")],
@@ -13,6 +20,7 @@ def get_main_menu_reply_keyboard() -> ReplyKeyboardMarkup:
 	)
 	return keyboard
 
+@functools.cache
 def get_developer_contact_inline_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[
@@ -24,6 +32,7 @@ def get_developer_contact_inline_keyboard() -> InlineKeyboardMarkup:
 	]
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_yes_no_additional_phone_inline_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[
@@ -34,12 +43,14 @@ def get_yes_no_additional_phone_inline_keyboard() -> InlineKeyboardMarkup:
 	]
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_cancel_report_inline_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[InlineKeyboardButton(text="🚫 Jarayonni bekor qilish", callback_data="cancel_report_submission")]
 	]
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_report_confirmation_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[
@@ -52,12 +63,14 @@ def get_report_confirmation_keyboard() -> InlineKeyboardMarkup:
 	]
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_report_confirmed_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[InlineKeyboardButton(text="✅ Tasdiqlandi", callback_data="status_confirmed_noop")]
 	]
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_admin_menu_inline_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[
@@ -78,6 +91,7 @@ def get_admin_menu_inline_keyboard() -> InlineKeyboardMarkup:
 	]
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_admin_cancel_inline_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[InlineKeyboardButton(text="🚫 Bekor qilish", callback_data="cancel_admin_action")]
@@ -153,6 +167,7 @@ def get_worker_groups_keyboard(groups: list, worker_telegram_id: int) -> InlineK
 	
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_google_sheets_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[
@@ -238,6 +253,7 @@ def get_dynamic_group_selection_inline_keyboard(groups: list) -> InlineKeyboardM
 	buttons.append([InlineKeyboardButton(text="🚫 Jarayonni bekor qilish", callback_data="cancel_report_submission")])
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_reports_stats_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[
@@ -260,6 +276,7 @@ def get_worker_sales_back_keyboard(telegram_id: int) -> InlineKeyboardMarkup:
 	]
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_password_change_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[
@@ -272,6 +289,7 @@ def get_password_change_keyboard() -> InlineKeyboardMarkup:
 	]
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_settings_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[
@@ -288,6 +306,7 @@ def get_settings_keyboard() -> InlineKeyboardMarkup:
 	]
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_edit_selection_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[
@@ -312,6 +331,7 @@ def get_edit_selection_keyboard() -> InlineKeyboardMarkup:
 	]
 	return InlineKeyboardMarkup(inline_keyboard=buttons)
 
+@functools.cache
 def get_group_report_keyboard() -> InlineKeyboardMarkup:
 	buttons = [
 		[
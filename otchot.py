@@ -1135,23 +1135,3 @@ async def back_to_group_report(callback_query: CallbackQuery, bot: Bot):
 async def confirmed_noop_handler(callback_query: CallbackQuery):
 	"""Tasdiqlangan hisobot tugmasini bosish"""
 	await callback_query.answer("ℹ️ Bu hisobot allaqachon tasdiqlangan.")
-
-# LOGGING SOZLAMALARI
-logging.basicConfig(
-	level=logging.INFO,
-	format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-	handlers=[
-		logging.StreamHandler(),
-		logging.FileHandler('otchot.log', encoding='utf-8')
-	]
-)
-
-# MODUL MA'LUMOTLARI
-logging.info("📝 Otchot router muvaffaqiyatli yuklandi")
-logging.info(
-	"🔄 Hisobot jarayoni: Mijoz → Telefon → Qo'shimcha telefon → Mahsulot → Manzil → Shartnoma ID → Summa → Rasm → Tasdiqlash")
-logging.info("💰 Summa formatlash: 500000 → 500.000")
-logging.info("📱 Qo'shimcha telefon: Guruhga yuboriladi, Google Sheets'ga saqlanmaydi")
-logging.info("👨‍💼 Sotuvchi profili: To'liq batafsil ma'lumotlar")
-logging.info("🔗 Sotuvchi bilan bog'lanish: Helper kabi ishlaydi")
-logging.info("🔧 Optimallashtirilgan va to'liq tangilangan versiya")
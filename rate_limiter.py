@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Union
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+
+# Oldindan cheklanadigan usullar: faqat chatga yangi xabar chiqaradiganlar.
+# Tahrirlash, o'chirish, getChatMember va h.k. faqat RetryAfter orqali qayta uriniladi
+_FORWARD_METHODS = frozenset({"copyMessage", "copyMessages", "forwardMessage", "forwardMessages"})
+
+def _is_message_send(method: TelegramMethod) -> bool:
+	name = method.__api_method__
+	return (name.startswith("send") and name != "sendChatAction") or name in _FORWARD_METHODS
+
+
+class _WindowLimiter:
+	"""period soniya ichida max_rate tadan ortiq so'rovga yo'l qo'ymaydigan oyna"""
+	
+	def __init__(self, max_rate: int, period: float):
+		self.max_rate = max_rate
+		self.period = period
+		self._stamps: Deque[float] = deque()
+		self._lock = asyncio.Lock()
+	
+	async def acquire(self) -> None:
+		# Qulf navbatni saqlaydi: kutayotganlar kelish tartibida o'tadi
+		async with self._lock:
+			while True:
+				now = time.monotonic()
+				while self._stamps and now - self._stamps[0] >= self.period:
+					self._stamps.popleft()
+				if len(self._stamps) < self.max_rate:
+					self._stamps.append(now)
+					return
+				await asyncio.sleep(self.period - (now - self._stamps[0]))
+	
+	def is_idle(self, now: float) -> bool:
+		"""Oynada tirik belgi ham, kutayotgan ham yo'q - limiterni tashlab yuborish mumkin"""
+		return not self._lock.locked() and (not self._stamps or now - self._stamps[-1] >= self.period)
+
+
+class SendAdmission:
+	"""Bir vaqtdagi yuborishlar sonini cheklovchi, limiti ish paytida o'zgartiriladigan nazoratchi"""
+	
+	def __init__(self, max_concurrency: int):
+		self.max_concurrency = max_concurrency
+		self.active = 0
+		self._cond = asyncio.Condition()
+	
+	async def acquire(self) -> None:
+		async with self._cond:
+			await self._cond.wait_for(lambda: self.active < self.max_concurrency)
+			self.active += 1
+	
+	async def release(self) -> None:
+		async with self._cond:
+			self.active -= 1
+			self._cond.notify(1)
+	
+	async def set_limit(self, max_concurrency: int) -> None:
+		# Limit oshsa, kutayotganlar darhol qayta tekshiradi
+		async with self._cond:
+			self.max_concurrency = max_concurrency
+			self._cond.notify_all()
+	
+	async def __aenter__(self) -> "SendAdmission":
+		await self.acquire()
+		return self
+	
+	async def __aexit__(self, *exc_info) -> None:
+		await self.release()
+
+
+class RateLimitMiddleware(BaseRequestMiddleware):
+	"""Telegram limitlariga oldindan moslashuvchi so'rov middleware'i
+	
+	Umumiy: sekundiga 30 ta xabar, guruh/kanal uchun: daqiqasiga 20 ta.
+	RetryAfter kelsa, ko'rsatilgan vaqt kutiladi va so'rov qayta yuboriladi.
+	"""
+	
+	def __init__(self, overall_max_rate: int = 30, overall_time_period: float = 1,
+	             group_max_rate: int = 20, group_time_period: float = 60, max_retries: int = 3):
+		self._overall = _WindowLimiter(overall_max_rate, overall_time_period)
+		self._group_max_rate = group_max_rate
+		self._group_time_period = group_time_period
+		self._groups: Dict[Union[int, str], _WindowLimiter] = {}
+		self.max_retries = max_retries
+	
+	def _group_limiter(self, chat_id: Union[int, str]) -> _WindowLimiter:
+		limiter = self._groups.get(chat_id)
+		if limiter is None:
+			# Yangi guruh qo'shilishidan oldin bo'sh qolganlarini tozalash - lug'at cheksiz o'smaydi
+			now = time.monotonic()
+			for key in [key for key, old in self._groups.items() if old.is_idle(now)]:
+				del self._groups[key]
+			limiter = self._groups[chat_id] = _WindowLimiter(self._group_max_rate, self._group_time_period)
+		return limiter
+	
+	async def __call__(
+		self,
+		make_request: NextRequestMiddlewareType[TelegramType],
+		bot: Bot,
+		method: TelegramMethod[TelegramType]
+	) -> Response[TelegramType]:
+		# Chatsiz so'rovlar (getUpdates, answerCallbackQuery) umuman ushlanmaydi
+		chat_id = getattr(method, "chat_id", None)
+		if chat_id is None:
+			return await make_request(bot, method)
+		
+		# Oynalar faqat xabar yuborishga qo'llanadi - boshqa usullar callback javobini kechiktirmasin
+		throttled = _is_message_send(method)
+		is_group = throttled and (isinstance(chat_id, str) or chat_id < 0)
+		
+		for attempt in range(self.max_retries + 1):
+			if is_group:
+				await self._group_limiter(chat_id).acquire()
+			if throttled:
+				await self._overall.acquire()
+			try:
+				return await make_request(bot, method)
+			except TelegramRetryAfter as e:
+				if attempt == self.max_retries:
+					raise
+				logging.warning(
+					"RetryAfter: %s (%s) - %ss kutilmoqda (%d/%d)",
+					type(method).__name__, chat_id, e.retry_after, attempt + 1, self.max_retries
+				)
+				await asyncio.sleep(e.retry_after + 0.1)
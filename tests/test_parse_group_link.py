@@ -0,0 +1,29 @@
+import pytest
+
+from admin import parse_group_link
+
+
+@pytest.mark.parametrize("link, expected", [
+	("https://t.me/c/1234567890/5", (-1001234567890, 5)),
+	("https://t.me/c/1234567890", (-1001234567890, None)),
+	("-1001234567890", (-1001234567890, None)),
+	# Mavzudagi xabar havolasi, oxirgi "/" va "?single" qo'shimchasi
+	("https://t.me/c/1234567890/5/678", (-1001234567890, 5)),
+	("https://t.me/c/1234567890/", (-1001234567890, None)),
+	("https://t.me/c/1234567890/5?single", (-1001234567890, 5)),
+	# Uzun ID qisqartirilmaydi
+	("https://t.me/c/12345678901234567890", (-10012345678901234567890, None)),
+])
+def test_valid_links(link, expected):
+	assert parse_group_link(link) == expected
+
+
+@pytest.mark.parametrize("link", [
+	# Oxiridagi ortiqcha belgilar
+	"https://t.me/c/1234567890/5abc",
+	"https://t.me/c/1234567890x",
+	"-1001234567890 x",
+	"havola",
+])
+def test_invalid_links(link):
+	assert parse_group_link(link) is None